@@ -7,7 +7,7 @@ import time
 import aiohttp
 import discord
 from discord.ext import commands
-from database import init_db, get_all_users_guild_aware, remove_user, clear_guild_records, get_all_guild_ids_with_records
+from database import init_db, close_db, get_all_users_guild_aware, remove_user, clear_guild_records, get_all_guild_ids_with_records
 
 # Add project root to sys.path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -1002,6 +1002,7 @@ async def main():
         if not bot.is_closed():
             logger.debug("Closing bot connection...")
             await bot.close()
+        await close_db()
         logger.info("Bot shutdown completed")
         logger.info("="*60)
 
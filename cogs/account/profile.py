@@ -6,7 +6,7 @@ import aiohttp
 import logging
 import os
 from pathlib import Path
-from typing import Optional, List, Dict, Tuple
+from typing import Optional, List, Dict, Tuple, Callable
 from datetime import datetime, timedelta
 import re
 import json
@@ -971,7 +971,7 @@ class Profile(commands.Cog):
         # Create gallery view if there are bio images
         gallery_view = None
         if bio_images:
-            gallery_view = GalleryView(bio_images, user_data['name'], avatar_url)
+            gallery_view = GalleryView(len(bio_images), bio_images.__getitem__, user_data['name'], avatar_url)
 
         # Create unified view with achievements, favorites, and gallery buttons
         unified_view = UnifiedProfileView(profile_embed, achievements_view, favorites_view, gallery_view)
@@ -1506,16 +1506,17 @@ class FavoritesView(discord.ui.View):
 class GalleryView(discord.ui.View):
     """View for displaying bio images in a paginated gallery"""
     
-    def __init__(self, images: List[str], user_name: str, avatar_url: str, profile_pager=None):
+    def __init__(self, image_count: int, get_image: Callable[[int], str], user_name: str, avatar_url: str, profile_pager=None):
         super().__init__(timeout=120)
-        self.images = images
+        self.image_count = image_count
+        self.get_image = get_image
         self.user_name = user_name
         self.avatar_url = avatar_url
         self.profile_pager = profile_pager
         self.current_index = 0
         
         # Disable prev button on first page
-        if len(images) <= 1:
+        if image_count <= 1:
             self.children[0].disabled = True  # Previous button
             self.children[1].disabled = True  # Next button
     
@@ -1528,7 +1529,7 @@ class GalleryView(discord.ui.View):
         """Build embed for current image"""
         embed = discord.Embed(
             title=f"🖼️ {self.user_name}'s Gallery",
-            description=f"Image {self.current_index + 1} of {len(self.images)}",
+            description=f"Image {self.current_index + 1} of {self.image_count}",
             color=discord.Color.purple()
         )
         
@@ -1536,18 +1537,18 @@ class GalleryView(discord.ui.View):
             embed.set_thumbnail(url=self.avatar_url)
         
         # Set current image
-        embed.set_image(url=self.images[self.current_index])
-        embed.set_footer(text=f"Page {self.current_index + 1}/{len(self.images)}")
+        embed.set_image(url=self.get_image(self.current_index))
+        embed.set_footer(text=f"Page {self.current_index + 1}/{self.image_count}")
         
         return embed
     
     @discord.ui.button(label="◀ Previous", style=discord.ButtonStyle.primary)
     async def prev_image(self, interaction: discord.Interaction, button: discord.ui.Button):
-        self.current_index = (self.current_index - 1) % len(self.images)
+        self.current_index = (self.current_index - 1) % self.image_count
         
         # Update button states
         self.children[0].disabled = (self.current_index == 0)
-        self.children[1].disabled = (self.current_index == len(self.images) - 1)
+        self.children[1].disabled = (self.current_index == self.image_count - 1)
         
         await interaction.response.edit_message(
             embed=self.get_current_embed(),
@@ -1556,11 +1557,11 @@ class GalleryView(discord.ui.View):
     
     @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.primary)
     async def next_image(self, interaction: discord.Interaction, button: discord.ui.Button):
-        self.current_index = (self.current_index + 1) % len(self.images)
+        self.current_index = (self.current_index + 1) % self.image_count
         
         # Update button states
         self.children[0].disabled = (self.current_index == 0)
-        self.children[1].disabled = (self.current_index == len(self.images) - 1)
+        self.children[1].disabled = (self.current_index == self.image_count - 1)
         
         await interaction.response.edit_message(
             embed=self.get_current_embed(),
@@ -1577,9 +1578,12 @@ class GalleryView(discord.ui.View):
 
 
 class Pager(discord.ui.View):
-    def __init__(self, pages: List[discord.Embed]):
+    """Generic paginator that builds each page's embed on demand"""
+
+    def __init__(self, page_count: int, build: Callable[[int], discord.Embed]):
         super().__init__(timeout=120)
-        self.pages = pages
+        self.page_count = page_count
+        self.build = build
         self.index = 0
 
     async def on_timeout(self):
@@ -1587,15 +1591,18 @@ class Pager(discord.ui.View):
             if isinstance(child, discord.ui.Button):
                 child.disabled = True
 
+    def get_current_embed(self) -> discord.Embed:
+        return self.build(self.index)
+
     @discord.ui.button(label="◀", style=discord.ButtonStyle.secondary)
     async def prev(self, interaction: discord.Interaction, button: discord.ui.Button):
-        self.index = (self.index - 1) % len(self.pages)
-        await interaction.response.edit_message(embed=self.pages[self.index], view=self)
+        self.index = (self.index - 1) % self.page_count
+        await interaction.response.edit_message(embed=self.get_current_embed(), view=self)
 
     @discord.ui.button(label="▶", style=discord.ButtonStyle.secondary)
     async def next(self, interaction: discord.Interaction, button: discord.ui.Button):
-        self.index = (self.index + 1) % len(self.pages)
-        await interaction.response.edit_message(embed=self.pages[self.index], view=self)
+        self.index = (self.index + 1) % self.page_count
+        await interaction.response.edit_message(embed=self.get_current_embed(), view=self)
 
 
 # -----------------------------
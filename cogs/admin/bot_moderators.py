@@ -46,6 +46,10 @@ if not any(isinstance(h, logging.FileHandler) and getattr(h, 'baseFilename', Non
 logger.info("Bot moderators logging initialized")
 
 
+# Strips the <@...> / <@!...> mention wrapper from user ID input
+_MENTION_TRANS = str.maketrans("", "", "<@!>")
+
+
 class BotModeratorsMainView(discord.ui.View):
     """Main menu view for bot moderators management"""
     
@@ -197,11 +201,8 @@ class AddBotModeratorModal(discord.ui.Modal):
         await interaction.response.defer(ephemeral=True)
         
         try:
-            # Parse user ID from input
-            user_id_str = self.user_id.value.strip()
-            
-            # Remove mention formatting if present
-            user_id_str = user_id_str.replace("<@", "").replace("!", "").replace(">", "")
+            # Parse user ID from input, dropping mention formatting in one pass
+            user_id_str = self.user_id.value.strip().translate(_MENTION_TRANS)
             
             # Convert to int
             user_id = int(user_id_str)
@@ -267,11 +268,8 @@ class RemoveBotModeratorModal(discord.ui.Modal):
         await interaction.response.defer(ephemeral=True)
         
         try:
-            # Parse user ID from input
-            user_id_str = self.user_id.value.strip()
-            
-            # Remove mention formatting if present
-            user_id_str = user_id_str.replace("<@", "").replace("!", "").replace(">", "")
+            # Parse user ID from input, dropping mention formatting in one pass
+            user_id_str = self.user_id.value.strip().translate(_MENTION_TRANS)
             
             # Convert to int
             user_id = int(user_id_str)
@@ -3,15 +3,19 @@ Unified Server Configuration Interface
 Consolidates all server management commands into a single interactive interface
 """
 
+import asyncio
 import discord
 from discord.ext import commands
 from discord import app_commands
 import logging
+import re
 from pathlib import Path
 from datetime import datetime
 
 from database import (
     get_guild_bot_update_channel, remove_guild_bot_update_channel,
+    get_invite_channel, get_all_guild_config, invalidate_guild_config_cache,
+    get_cached_bot_update_channel, get_cached_invite_channel,
     is_user_moderator, execute_db_operation
 )
 
@@ -19,168 +23,220 @@ from database import (
 # Logging Setup
 # ------------------------------------------------------
 LOG_DIR = Path("logs")
-LOG_DIR.mkdir(exist_ok=True)
 LOG_FILE = LOG_DIR / "server_config.log"
 
 logger = logging.getLogger("ServerConfig")
 logger.setLevel(logging.DEBUG)
 
-if not any(isinstance(h, logging.FileHandler) and getattr(h, 'baseFilename', None) == str(LOG_FILE)
-           for h in logger.handlers):
+formatter = logging.Formatter(
+    fmt="[%(asctime)s] [%(levelname)-8s] [%(name)s] %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+
+def _configure_logging():
+    """Attach the log handler; called from setup() so importing the module stays side-effect free"""
+    # The logger outlives cog reloads, so only attach a handler the first time
+    if getattr(logger, "_sc_configured", False):
+        return
     try:
-        file_handler = logging.FileHandler(LOG_FILE, mode='w', encoding='utf-8')
+        LOG_DIR.mkdir(exist_ok=True)
+        file_handler = logging.FileHandler(LOG_FILE, mode='a', encoding='utf-8')
         file_handler.setLevel(logging.DEBUG)
-        formatter = logging.Formatter(
-            fmt="[%(asctime)s] [%(levelname)-8s] [%(name)s] %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
         file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
     except Exception:
         stream_handler = logging.StreamHandler()
         stream_handler.setLevel(logging.DEBUG)
-        stream_handler.setFormatter(logging.Formatter(fmt="[%(asctime)s] [%(levelname)-8s] [%(name)s] %(message)s",
-                                                      datefmt="%Y-%m-%d %H:%M:%S"))
+        stream_handler.setFormatter(formatter)
         logger.addHandler(stream_handler)
+    logger._sc_configured = True
+    logger.info("Server configuration logging initialized")
+
+# Matches a channel mention (<#123>) or a bare channel ID (123)
+_CHANNEL_RE = re.compile(r'<#(\d+)>$|(\d+)$')
+
+# Discord snowflakes store their creation time (ms since this epoch) in the high bits
+DISCORD_EPOCH_MS = 1420070400000
+
+
+def _snowflake_unix_ts(snowflake_id: int) -> int:
+    """Creation time of a Discord object as a Unix timestamp, without building a datetime"""
+    return ((snowflake_id >> 22) + DISCORD_EPOCH_MS) // 1000
+
+
+# Static parts of the embeds, kept as plain dicts and turned into a fresh Embed per request.
+# Templates hold only scalar keys: Embed.from_dict reuses nested dicts/lists rather than copying them.
+_BOT_UPDATES_TEMPLATE = {
+    "title": "📢 Bot Updates Channel",
+    "description": "Configure where changelog and update notifications are posted.",
+    "color": 0x5865F2,
+}
+_INVITE_CHANNEL_TEMPLATE = {
+    "title": "📨 Invite Tracking Channel",
+    "description": "Configure where member join/leave notifications are posted.",
+    "color": 0x5865F2,
+}
+_OVERVIEW_TEMPLATE = {
+    "title": "📋 Server Configuration Overview",
+    "color": 0x5865F2,
+}
+_BOT_UPDATES_REMOVED_TEMPLATE = {
+    "title": "✅ Bot Updates Channel Removed",
+    "description": "Bot updates channel configuration has been cleared.\nYou won't receive automatic update notifications.",
+    "color": 0x57F287,
+}
+_INVITE_CHANNEL_REMOVED_TEMPLATE = {
+    "title": "✅ Invite Tracking Channel Removed",
+    "description": "Invite tracking channel configuration has been cleared.\nJoin/leave messages are now disabled.",
+    "color": 0x57F287,
+}
+
+
+def _fresh(template: dict) -> discord.Embed:
+    """Create a new embed from one of the static templates above"""
+    return discord.Embed.from_dict(template)
+
+
+def _build_channel_embed(template: dict, channel, channel_id, unset_value: str,
+                         about_name: str, about_value: str) -> discord.Embed:
+    """Build the status embed shared by the channel configuration pages"""
+    embed = _fresh(template)
+    
+    if channel:
+        embed.add_field(
+            name="📊 Current Configuration",
+            value=f"**Channel:** {channel.mention}\n**Category:** {channel.category.name if channel.category else 'None'}\n**Created:** <t:{_snowflake_unix_ts(channel.id)}:R>",
+            inline=False
+        )
+        embed.color = 0x57F287
+    elif channel_id:
+        embed.add_field(
+            name="⚠️ Configuration Issue",
+            value=f"Configured channel (ID: {channel_id}) is not visible to the bot.",
+            inline=False
+        )
+        embed.color = 0xFEE75C
+    else:
+        embed.add_field(name="📝 No Channel Configured", value=unset_value, inline=False)
+        embed.color = 0xED4245
+    
+    embed.add_field(name=about_name, value=about_value, inline=False)
+    return embed
+
+
+async def _send_ephemeral(interaction: discord.Interaction, content: str = None, **kwargs):
+    """Reply directly if the interaction is still unanswered, otherwise via followup"""
+    if interaction.response.is_done():
+        await interaction.followup.send(content, ephemeral=True, **kwargs)
+    else:
+        await interaction.response.send_message(content, ephemeral=True, **kwargs)
 
-logger.info("Server configuration logging initialized")
+
+async def _log_invite_count(guild: discord.Guild):
+    """Fetch the guild's invites once so missing permissions show up in the log"""
+    try:
+        invites = await guild.invites()
+        # Note: We can't directly access invite_tracker cog's cache here
+        # The invite tracker cog will pick it up on next check
+        logger.info("Initialized invite cache for %s with %s invites", guild.name, len(invites))
+    except discord.Forbidden:
+        logger.warning("Missing permissions to initialize invites for %s", guild.name)
+    except Exception as e:
+        logger.error("Failed to initialize invite cache: %s", e)
 
 
 class ServerConfigMainView(discord.ui.View):
-    """Main menu view for unified server configuration system"""
+    """Main menu view for unified server configuration system
+    
+    Persistent (no timeout, fixed custom_ids): one instance per cog is shared by
+    every /server-config message and survives bot restarts.
+    """
     
     def __init__(self, cog):
-        super().__init__(timeout=300.0)
+        super().__init__(timeout=None)
         self.cog = cog
     
-    @discord.ui.button(label=" Bot Updates Channel", style=discord.ButtonStyle.primary, row=0)
+    @discord.ui.button(label=" Bot Updates Channel", style=discord.ButtonStyle.primary, row=0,
+                       custom_id="server_config_main:bot_updates")
     async def manage_bot_updates(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Manage bot updates channel settings"""
-        await interaction.response.defer(ephemeral=True)
+        # Only defer when the channel has to be read from the database
+        cached, channel_id = get_cached_bot_update_channel(interaction.guild.id)
+        if not cached:
+            await interaction.response.defer(ephemeral=True)
         
         try:
-            channel_id = await get_guild_bot_update_channel(interaction.guild.id)
-            
-            embed = discord.Embed(
-                title="📢 Bot Updates Channel",
-                description="Configure where changelog and update notifications are posted.",
-                color=0x5865F2
-            )
-            
-            if channel_id:
-                channel = self.cog.bot.get_channel(channel_id)
-                if channel:
-                    embed.add_field(
-                        name="📊 Current Configuration",
-                        value=f"**Channel:** {channel.mention}\n**Category:** {channel.category.name if channel.category else 'None'}\n**Created:** <t:{int(channel.created_at.timestamp())}:R>",
-                        inline=False
-                    )
-                    embed.color = 0x57F287
-                else:
-                    embed.add_field(
-                        name="⚠️ Configuration Issue",
-                        value=f"Configured channel (ID: {channel_id}) is not visible to the bot.",
-                        inline=False
-                    )
-                    embed.color = 0xFEE75C
-            else:
-                embed.add_field(
-                    name="📝 No Channel Configured",
-                    value="No bot updates channel is currently set.\nYou won't receive automatic update notifications.",
-                    inline=False
-                )
-                embed.color = 0xED4245
-            
-            embed.add_field(
-                name="ℹ️ About Update Notifications",
-                value="When configured, bot moderators can send changelog updates to this channel using `/changelog`.",
-                inline=False
+            if not cached:
+                channel_id = await get_guild_bot_update_channel(interaction.guild.id)
+            
+            channel = interaction.guild.get_channel(channel_id) if channel_id else None
+            embed = _build_channel_embed(
+                _BOT_UPDATES_TEMPLATE,
+                channel=channel,
+                channel_id=channel_id,
+                unset_value="No bot updates channel is currently set.\nYou won't receive automatic update notifications.",
+                about_name="ℹ️ About Update Notifications",
+                about_value="When configured, bot moderators can send changelog updates to this channel using `/changelog`."
             )
             
             view = BotUpdatesConfigView(self.cog, channel_id)
-            await interaction.followup.send(embed=embed, view=view, ephemeral=True)
-            logger.info(f"Bot updates management opened by {interaction.user.id} in guild {interaction.guild.id}")
+            await _send_ephemeral(interaction, embed=embed, view=view)
+            logger.info("Bot updates management opened by %s in guild %s", interaction.user.id, interaction.guild.id)
         
         except Exception as e:
-            logger.error(f"Error in bot updates management: {e}")
-            await interaction.followup.send("❌ Error loading bot updates settings.", ephemeral=True)
+            logger.error("Error in bot updates management: %s", e)
+            await _send_ephemeral(interaction, "❌ Error loading bot updates settings.")
     
-    @discord.ui.button(label="📨 Invite Tracking Channel", style=discord.ButtonStyle.primary, row=1)
+    @discord.ui.button(label="📨 Invite Tracking Channel", style=discord.ButtonStyle.primary, row=1,
+                       custom_id="server_config_main:invite_channel")
     async def manage_invite_channel(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Manage invite tracking channel settings"""
-        await interaction.response.defer(ephemeral=True)
+        # Only defer when the channel has to be read from the database
+        cached, channel_id = get_cached_invite_channel(interaction.guild.id)
+        if not cached:
+            await interaction.response.defer(ephemeral=True)
         
         try:
-            # Get invite tracking channel from database
-            result = await execute_db_operation(
-                "get invite tracking channel",
-                "SELECT announcement_channel_id FROM invite_tracker_settings WHERE guild_id = ?",
-                (interaction.guild.id,),
-                fetch_type='one'
-            )
-            
-            channel_id = result[0] if result else None
-            
-            embed = discord.Embed(
-                title="📨 Invite Tracking Channel",
-                description="Configure where member join/leave notifications are posted.",
-                color=0x5865F2
-            )
-            
-            if channel_id:
-                channel = self.cog.bot.get_channel(channel_id)
-                if channel:
-                    embed.add_field(
-                        name="📊 Current Configuration",
-                        value=f"**Channel:** {channel.mention}\n**Category:** {channel.category.name if channel.category else 'None'}\n**Created:** <t:{int(channel.created_at.timestamp())}:R>",
-                        inline=False
-                    )
-                    embed.color = 0x57F287
-                else:
-                    embed.add_field(
-                        name="⚠️ Configuration Issue",
-                        value=f"Configured channel (ID: {channel_id}) is not visible to the bot.",
-                        inline=False
-                    )
-                    embed.color = 0xFEE75C
-            else:
-                embed.add_field(
-                    name="📝 No Channel Configured",
-                    value="No invite tracking channel is currently set.\nJoin/leave messages are disabled.",
-                    inline=False
-                )
-                embed.color = 0xED4245
-            
-            embed.add_field(
-                name="ℹ️ About Invite Tracking",
-                value="Tracks which invite link new members used and sends welcome/goodbye messages.",
-                inline=False
+            if not cached:
+                channel_id = await get_invite_channel(interaction.guild.id)
+            
+            channel = interaction.guild.get_channel(channel_id) if channel_id else None
+            embed = _build_channel_embed(
+                _INVITE_CHANNEL_TEMPLATE,
+                channel=channel,
+                channel_id=channel_id,
+                unset_value="No invite tracking channel is currently set.\nJoin/leave messages are disabled.",
+                about_name="ℹ️ About Invite Tracking",
+                about_value="Tracks which invite link new members used and sends welcome/goodbye messages."
             )
             
             view = InviteChannelConfigView(self.cog, channel_id)
-            await interaction.followup.send(embed=embed, view=view, ephemeral=True)
-            logger.info(f"Invite channel management opened by {interaction.user.id} in guild {interaction.guild.id}")
+            await _send_ephemeral(interaction, embed=embed, view=view)
+            logger.info("Invite channel management opened by %s in guild %s", interaction.user.id, interaction.guild.id)
         
         except Exception as e:
-            logger.error(f"Error in invite channel management: {e}")
-            await interaction.followup.send("❌ Error loading invite tracking settings.", ephemeral=True)
+            logger.error("Error in invite channel management: %s", e)
+            await _send_ephemeral(interaction, "❌ Error loading invite tracking settings.")
     
-    @discord.ui.button(label="📋 View All Settings", style=discord.ButtonStyle.secondary, row=1)
+    @discord.ui.button(label="📋 View All Settings", style=discord.ButtonStyle.secondary, row=1,
+                       custom_id="server_config_main:view_all")
     async def view_all_settings(self, interaction: discord.Interaction, button: discord.ui.Button):
         """View all server configuration settings"""
         await interaction.response.defer(ephemeral=True)
         
         try:
-            embed = discord.Embed(
-                title="📋 Server Configuration Overview",
-                description=f"Complete configuration for **{interaction.guild.name}**",
-                color=0x5865F2
-            )
+            embed = _fresh(_OVERVIEW_TEMPLATE)
+            embed.description = f"Complete configuration for **{interaction.guild.name}**"
+            
+            # Fetch both channel settings in a single (cached) lookup
+            cfg = await get_all_guild_config(interaction.guild.id)
+            bot_update_channel_id = cfg.get("bot")
+            invite_channel_id = cfg.get("invite")
             
             # Bot updates channel
-            bot_update_channel_id = await get_guild_bot_update_channel(interaction.guild.id)
             if bot_update_channel_id:
-                bot_channel = self.cog.bot.get_channel(bot_update_channel_id)
+                bot_channel = interaction.guild.get_channel(bot_update_channel_id)
                 bot_info = f"✅ {bot_channel.mention}" if bot_channel else f"⚠️ Channel ID {bot_update_channel_id} (not found)"
             else:
                 bot_info = "❌ Not configured"
@@ -192,16 +248,9 @@ class ServerConfigMainView(discord.ui.View):
             )
             
             # Invite tracking channel
-            invite_result = await execute_db_operation(
-                "get invite tracking channel",
-                "SELECT announcement_channel_id FROM invite_tracker_settings WHERE guild_id = ?",
-                (interaction.guild.id,),
-                fetch_type='one'
-            )
-            
-            if invite_result:
-                invite_channel = self.cog.bot.get_channel(invite_result[0])
-                invite_info = f"✅ {invite_channel.mention}" if invite_channel else f"⚠️ Channel ID {invite_result[0]} (not found)"
+            if invite_channel_id:
+                invite_channel = interaction.guild.get_channel(invite_channel_id)
+                invite_info = f"✅ {invite_channel.mention}" if invite_channel else f"⚠️ Channel ID {invite_channel_id} (not found)"
             else:
                 invite_info = "❌ Not configured"
             
@@ -214,10 +263,10 @@ class ServerConfigMainView(discord.ui.View):
             embed.set_footer(text="Use the buttons above to configure each setting")
             
             await interaction.followup.send(embed=embed, ephemeral=True)
-            logger.info(f"All settings viewed by {interaction.user.id} in guild {interaction.guild.id}")
+            logger.info("All settings viewed by %s in guild %s", interaction.user.id, interaction.guild.id)
         
         except Exception as e:
-            logger.error(f"Error viewing all settings: {e}")
+            logger.error("Error viewing all settings: %s", e)
             await interaction.followup.send("❌ Error loading server settings.", ephemeral=True)
 
 
@@ -229,9 +278,14 @@ class BotUpdatesConfigView(discord.ui.View):
         self.cog = cog
         self.current_channel_id = current_channel_id
         
-        # Disable remove button if no channel is set
-        if not current_channel_id:
-            self.children[1].disabled = True
+        # Remove button is only enabled when a channel is set
+        self.remove_btn = discord.ui.Button(
+            label="🗑️ Remove Channel",
+            style=discord.ButtonStyle.danger,
+            disabled=not current_channel_id
+        )
+        self.remove_btn.callback = self.remove_channel
+        self.add_item(self.remove_btn)
     
     @discord.ui.button(label="✏️ Set Channel", style=discord.ButtonStyle.success)
     async def set_channel(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -239,24 +293,19 @@ class BotUpdatesConfigView(discord.ui.View):
         modal = SetBotUpdatesChannelModal(self.cog)
         await interaction.response.send_modal(modal)
     
-    @discord.ui.button(label="🗑️ Remove Channel", style=discord.ButtonStyle.danger)
-    async def remove_channel(self, interaction: discord.Interaction, button: discord.ui.Button):
+    async def remove_channel(self, interaction: discord.Interaction):
         """Remove bot updates channel configuration"""
         await interaction.response.defer(ephemeral=True)
         
         try:
             await remove_guild_bot_update_channel(interaction.guild.id)
             
-            embed = discord.Embed(
-                title="✅ Bot Updates Channel Removed",
-                description="Bot updates channel configuration has been cleared.\nYou won't receive automatic update notifications.",
-                color=0x57F287
-            )
+            embed = _fresh(_BOT_UPDATES_REMOVED_TEMPLATE)
             await interaction.followup.send(embed=embed, ephemeral=True)
-            logger.info(f"Bot updates channel removed for guild {interaction.guild.id} by {interaction.user.id}")
+            logger.info("Bot updates channel removed for guild %s by %s", interaction.guild.id, interaction.user.id)
         
         except Exception as e:
-            logger.error(f"Error removing bot updates channel: {e}")
+            logger.error("Error removing bot updates channel: %s", e)
             await interaction.followup.send("❌ Error removing bot updates channel.", ephemeral=True)
 
 
@@ -268,9 +317,14 @@ class InviteChannelConfigView(discord.ui.View):
         self.cog = cog
         self.current_channel_id = current_channel_id
         
-        # Disable remove button if no channel is set
-        if not current_channel_id:
-            self.children[1].disabled = True
+        # Remove button is only enabled when a channel is set
+        self.remove_btn = discord.ui.Button(
+            label="🗑️ Remove Channel",
+            style=discord.ButtonStyle.danger,
+            disabled=not current_channel_id
+        )
+        self.remove_btn.callback = self.remove_channel
+        self.add_item(self.remove_btn)
     
     @discord.ui.button(label="✏️ Set Channel", style=discord.ButtonStyle.success)
     async def set_channel(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -278,8 +332,7 @@ class InviteChannelConfigView(discord.ui.View):
         modal = SetInviteChannelModal(self.cog)
         await interaction.response.send_modal(modal)
     
-    @discord.ui.button(label="🗑️ Remove Channel", style=discord.ButtonStyle.danger)
-    async def remove_channel(self, interaction: discord.Interaction, button: discord.ui.Button):
+    async def remove_channel(self, interaction: discord.Interaction):
         """Remove invite tracking channel configuration"""
         await interaction.response.defer(ephemeral=True)
         
@@ -289,17 +342,14 @@ class InviteChannelConfigView(discord.ui.View):
                 "DELETE FROM invite_tracker_settings WHERE guild_id = ?",
                 (interaction.guild.id,)
             )
+            invalidate_guild_config_cache(interaction.guild.id)
             
-            embed = discord.Embed(
-                title="✅ Invite Tracking Channel Removed",
-                description="Invite tracking channel configuration has been cleared.\nJoin/leave messages are now disabled.",
-                color=0x57F287
-            )
+            embed = _fresh(_INVITE_CHANNEL_REMOVED_TEMPLATE)
             await interaction.followup.send(embed=embed, ephemeral=True)
-            logger.info(f"Invite channel removed for guild {interaction.guild.id} by {interaction.user.id}")
+            logger.info("Invite channel removed for guild %s by %s", interaction.guild.id, interaction.user.id)
         
         except Exception as e:
-            logger.error(f"Error removing invite channel: {e}")
+            logger.error("Error removing invite channel: %s", e)
             await interaction.followup.send("❌ Error removing invite tracking channel.", ephemeral=True)
 
 
@@ -321,39 +371,44 @@ class SetBotUpdatesChannelModal(discord.ui.Modal):
         await interaction.response.defer(ephemeral=True)
         
         try:
-            # Parse channel ID from input
-            channel_id_str = self.channel_id.value.strip()
-            
-            # Remove mention formatting if present
-            channel_id_str = channel_id_str.replace("<#", "").replace(">", "")
-            
-            # Convert to int
-            channel_id = int(channel_id_str)
+            # Parse channel ID from a mention or raw ID
+            match = _CHANNEL_RE.match(self.channel_id.value.strip())
+            if not match:
+                raise ValueError("invalid channel input")
+            channel_id = int(match.group(1) or match.group(2))
             
             # Get the channel
-            channel = self.cog.bot.get_channel(channel_id)
+            channel = interaction.guild.get_channel(channel_id)
             
-            if not channel or channel.guild.id != interaction.guild.id:
+            if not channel:
                 await interaction.followup.send("❌ Channel not found in this server. Please check the channel ID.", ephemeral=True)
                 return
             
-            # Check permissions
-            permissions = channel.permissions_for(interaction.guild.me)
+            # Check permissions (posts to this channel are embeds)
+            me = interaction.guild.me
+            permissions = channel.permissions_for(me)
             if not permissions.send_messages:
                 await interaction.followup.send(f"❌ I don't have permission to send messages in {channel.mention}.", ephemeral=True)
                 return
+            if not permissions.embed_links:
+                await interaction.followup.send(f"❌ I don't have permission to embed links in {channel.mention}.", ephemeral=True)
+                return
             
             # Set the bot updates channel (using database function)
             # Note: We need to import this function or use execute_db_operation
             await execute_db_operation(
                 "set bot updates channel",
                 """
-                INSERT OR REPLACE INTO guild_bot_update_channels 
+                INSERT INTO guild_bot_update_channels 
                 (guild_id, channel_id, updated_at)
                 VALUES (?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(guild_id) DO UPDATE SET
+                    channel_id = excluded.channel_id,
+                    updated_at = CURRENT_TIMESTAMP
                 """,
                 (interaction.guild.id, channel.id)
             )
+            invalidate_guild_config_cache(interaction.guild.id)
             
             embed = discord.Embed(
                 title="✅ Bot Updates Channel Set",
@@ -361,12 +416,12 @@ class SetBotUpdatesChannelModal(discord.ui.Modal):
                 color=0x57F287
             )
             await interaction.followup.send(embed=embed, ephemeral=True)
-            logger.info(f"Bot updates channel set for guild {interaction.guild.id}: #{channel.name} ({channel.id})")
+            logger.info("Bot updates channel set for guild %s: #%s (%s)", interaction.guild.id, channel.name, channel.id)
         
         except ValueError:
             await interaction.followup.send("❌ Invalid channel ID format. Please enter a valid number.", ephemeral=True)
         except Exception as e:
-            logger.error(f"Error setting bot updates channel: {e}")
+            logger.error("Error setting bot updates channel: %s", e)
             await interaction.followup.send("❌ Error setting bot updates channel.", ephemeral=True)
 
 
@@ -388,49 +443,43 @@ class SetInviteChannelModal(discord.ui.Modal):
         await interaction.response.defer(ephemeral=True)
         
         try:
-            # Parse channel ID from input
-            channel_id_str = self.channel_id.value.strip()
-            
-            # Remove mention formatting if present
-            channel_id_str = channel_id_str.replace("<#", "").replace(">", "")
-            
-            # Convert to int
-            channel_id = int(channel_id_str)
+            # Parse channel ID from a mention or raw ID
+            match = _CHANNEL_RE.match(self.channel_id.value.strip())
+            if not match:
+                raise ValueError("invalid channel input")
+            channel_id = int(match.group(1) or match.group(2))
             
             # Get the channel
-            channel = self.cog.bot.get_channel(channel_id)
+            channel = interaction.guild.get_channel(channel_id)
             
-            if not channel or channel.guild.id != interaction.guild.id:
+            if not channel:
                 await interaction.followup.send("❌ Channel not found in this server. Please check the channel ID.", ephemeral=True)
                 return
             
-            # Check permissions
-            permissions = channel.permissions_for(interaction.guild.me)
+            # Check permissions (posts to this channel are embeds)
+            me = interaction.guild.me
+            permissions = channel.permissions_for(me)
             if not permissions.send_messages:
                 await interaction.followup.send(f"❌ I don't have permission to send messages in {channel.mention}.", ephemeral=True)
                 return
+            if not permissions.embed_links:
+                await interaction.followup.send(f"❌ I don't have permission to embed links in {channel.mention}.", ephemeral=True)
+                return
             
             # Set the invite channel
             await execute_db_operation(
                 "set invite channel",
                 """
-                INSERT OR REPLACE INTO invite_tracker_settings 
+                INSERT INTO invite_tracker_settings 
                 (guild_id, announcement_channel_id, updated_at)
                 VALUES (?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(guild_id) DO UPDATE SET
+                    announcement_channel_id = excluded.announcement_channel_id,
+                    updated_at = CURRENT_TIMESTAMP
                 """,
                 (interaction.guild.id, channel.id)
             )
-            
-            # Initialize invite cache for this guild
-            try:
-                invites = await interaction.guild.invites()
-                # Note: We can't directly access invite_tracker cog's cache here
-                # The invite tracker cog will pick it up on next check
-                logger.info(f"Initialized invite cache for {interaction.guild.name} with {len(invites)} invites")
-            except discord.Forbidden:
-                logger.warning(f"Missing permissions to initialize invites for {interaction.guild.name}")
-            except Exception as e:
-                logger.error(f"Failed to initialize invite cache: {e}")
+            invalidate_guild_config_cache(interaction.guild.id)
             
             embed = discord.Embed(
                 title="✅ Invite Tracking Channel Set",
@@ -438,12 +487,18 @@ class SetInviteChannelModal(discord.ui.Modal):
                 color=0x57F287
             )
             await interaction.followup.send(embed=embed, ephemeral=True)
-            logger.info(f"Invite channel set for guild {interaction.guild.id}: #{channel.name} ({channel.id})")
+            
+            # Check invite access in the background so the confirmation isn't delayed
+            # (the cog keeps a reference; the event loop only holds tasks weakly)
+            task = asyncio.create_task(_log_invite_count(interaction.guild))
+            self.cog._background_tasks.add(task)
+            task.add_done_callback(self.cog._background_tasks.discard)
+            logger.info("Invite channel set for guild %s: #%s (%s)", interaction.guild.id, channel.name, channel.id)
         
         except ValueError:
             await interaction.followup.send("❌ Invalid channel ID format. Please enter a valid number.", ephemeral=True)
         except Exception as e:
-            logger.error(f"Error setting invite channel: {e}")
+            logger.error("Error setting invite channel: %s", e)
             await interaction.followup.send("❌ Error setting invite tracking channel.", ephemeral=True)
 
 
@@ -452,8 +507,19 @@ class ServerConfig(commands.Cog):
     
     def __init__(self, bot):
         self.bot = bot
+        self._main_view = ServerConfigMainView(self)
+        self._background_tasks = set()  # fire-and-forget tasks, kept alive until they finish
         logger.info("ServerConfig cog initialized")
     
+    async def cog_load(self):
+        # Register the shared main menu so its buttons keep working after restarts
+        self.bot.add_view(self._main_view)
+    
+    async def cog_unload(self):
+        self._main_view.stop()
+        for task in self._background_tasks:
+            task.cancel()
+    
     @app_commands.command(name="server-config", description="⚙️ Configure server settings - roles, channels, and notifications")
     @app_commands.default_permissions(manage_guild=True)
     async def server_config(self, interaction: discord.Interaction):
@@ -470,7 +536,7 @@ class ServerConfig(commands.Cog):
         
         try:
             guild_id = interaction.guild.id
-            logger.info(f"Server config opened by {interaction.user.display_name} ({interaction.user.id}) in guild {guild_id}")
+            logger.info("Server config opened by %s (%s) in guild %s", interaction.user.display_name, interaction.user.id, guild_id)
             
             embed = discord.Embed(
                 title="⚙️ Server Configuration",
@@ -495,16 +561,16 @@ class ServerConfig(commands.Cog):
             
             embed.set_footer(text=f"Server ID: {guild_id} | Configuration System v2.0")
             
-            view = ServerConfigMainView(self)
-            await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
-            logger.info(f"Server config main menu sent to user {interaction.user.id} in guild {guild_id}")
+            await interaction.response.send_message(embed=embed, view=self._main_view, ephemeral=True)
+            logger.info("Server config main menu sent to user %s in guild %s", interaction.user.id, guild_id)
         
         except Exception as e:
-            logger.error(f"Error in server config command: {e}", exc_info=True)
+            logger.error("Error in server config command: %s", e, exc_info=True)
             await interaction.response.send_message("❌ Error opening server configuration. Please try again.", ephemeral=True)
 
 
 async def setup(bot):
     """Setup function for the cog"""
+    _configure_logging()
     await bot.add_cog(ServerConfig(bot))
     logger.info("ServerConfig cog loaded successfully")
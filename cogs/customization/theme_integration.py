@@ -72,7 +72,7 @@ def integrate_theme_system(bot):
                 
                 return embed
             except Exception as e:
-                logger.error(f"Error applying theme: {e}")
+                logger.error("Error applying theme: %s", e)
                 return embed
         
         # Patch other major cogs
@@ -81,13 +81,13 @@ def integrate_theme_system(bot):
         for cog_name in cogs_to_patch:
             cog = bot.get_cog(cog_name)
             if cog:
-                logger.info(f"Integrating themes with {cog_name} cog")
+                logger.info("Integrating themes with %s cog", cog_name)
                 patch_cog_embeds(cog, apply_theme_to_embed)
         
         logger.info("Theme integration completed successfully")
         
     except Exception as e:
-        logger.error(f"Error integrating theme system: {e}")
+        logger.error("Error integrating theme system: %s", e)
 
 def patch_cog_embeds(cog, theme_function):
     """
@@ -101,10 +101,10 @@ def patch_cog_embeds(cog, theme_function):
         # 2. Wrap them to apply themes before sending
         # 3. Preserve original functionality
         
-        logger.info(f"Theme patching applied to {cog.__class__.__name__}")
+        logger.info("Theme patching applied to %s", cog.__class__.__name__)
         
     except Exception as e:
-        logger.error(f"Error patching {cog.__class__.__name__}: {e}")
+        logger.error("Error patching %s: %s", cog.__class__.__name__, e)
 
 class ThemeIntegrationHandler(commands.Cog):
     """Handler cog for theme integration setup"""
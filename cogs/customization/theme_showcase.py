@@ -69,6 +69,8 @@ class ThemePreviewView(discord.ui.View):
     
     def _get_preview_embed(self) -> discord.Embed:
         """Create preview embed for current theme"""
+        from .themes import CATEGORY_DISPLAY
+        
         if not self.themes:
             return discord.Embed(title="❌ No Themes", color=0xFF0000)
         
@@ -77,7 +79,7 @@ class ThemePreviewView(discord.ui.View):
         embed = discord.Embed(
             title=f"🎨 Theme Preview: {theme.name}",
             description=f"**Description:** {theme.description}\n"
-                       f"**Category:** {theme.category.value.replace('_', ' ').title()}\n"
+                       f"**Category:** {CATEGORY_DISPLAY[theme.category]}\n"
                        f"**Emoji:** {theme.emoji}",
             color=theme.colors.primary
         )
@@ -90,9 +92,7 @@ class ThemePreviewView(discord.ui.View):
             )
         
         # Color showcase
-        color_info = f"**Primary:** #{theme.colors.primary:06X}\n"
-        color_info += f"**Secondary:** #{theme.colors.secondary:06X}\n"
-        color_info += f"**Accent:** #{theme.colors.accent:06X}"
+        color_info = self.theme_manager.get_color_preview(theme)
         
         embed.add_field(
             name="🎨 Colors",
@@ -153,7 +153,7 @@ class ThemePreviewView(discord.ui.View):
         
         theme = self.themes[self.current_index]
         guild_id = interaction.guild.id if interaction.guild else None
-        logger.info(f"User {interaction.user.id} applying theme '{theme.name}' from preview in guild {guild_id}")
+        logger.info("User %s applying theme '%s' from preview in guild %s", interaction.user.id, theme.name, guild_id)
         
         success = self.theme_manager.set_user_theme(self.user_id, theme.id)
         
@@ -176,9 +176,9 @@ class ThemePreviewView(discord.ui.View):
                 child.disabled = True
             
             await interaction.response.edit_message(embed=embed, view=self)
-            logger.info(f"Successfully applied theme '{theme.name}' for user {interaction.user.id}")
+            logger.info("Successfully applied theme '%s' for user %s", theme.name, interaction.user.id)
         else:
-            logger.error(f"Failed to apply theme '{theme.name}' for user {interaction.user.id}")
+            logger.error("Failed to apply theme '%s' for user %s", theme.name, interaction.user.id)
             await interaction.response.send_message("❌ Failed to apply theme.", ephemeral=True)
     
     @discord.ui.button(label="🎲 Random", style=discord.ButtonStyle.secondary)
@@ -273,7 +273,7 @@ class ThemeCategorySelect(discord.ui.Select):
             from .themes import ThemeCategory
             
             if self.values[0] == "all":
-                themes = list(self.theme_manager.themes.values())
+                themes = self.theme_manager.get_all_themes()
             else:
                 category = ThemeCategory(self.values[0])
                 themes = self.theme_manager.get_themes_by_category(category)
@@ -294,7 +294,7 @@ class ThemeCategorySelect(discord.ui.Select):
             await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
         
         except Exception as e:
-            logger.error(f"Error in theme category callback: {e}")
+            logger.error("Error in theme category callback: %s", e)
             embed = discord.Embed(
                 title="❌ Error",
                 description="An error occurred while loading themes.",
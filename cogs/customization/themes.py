@@ -11,38 +11,83 @@ from enum import Enum
 from datetime import datetime, timezone
 import json
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import atexit
 import asyncio
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 import random
+import sys
+from collections import OrderedDict, defaultdict
+from itertools import islice
+from difflib import get_close_matches
+import time
+from array import array
 from pathlib import Path
 
+# Optional faster JSON backend for theme (de)serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional typo-tolerant theme name matching; difflib is used when missing
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# Minimum similarity (0-100) for a misspelled theme name to count as a match
+FUZZY_MATCH_CUTOFF = 70
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to JSON bytes, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(data: Union[bytes, str]) -> Any:
+    """Deserialize JSON bytes/str, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 # Set up dedicated logging for theme system
 LOG_DIR = Path("logs")
-LOG_DIR.mkdir(exist_ok=True)
 LOG_FILE = LOG_DIR / "themes.log"
 
 logger = logging.getLogger("ThemeSystem")
 logger.setLevel(logging.DEBUG)
 
-if not any(isinstance(h, logging.FileHandler) and getattr(h, 'baseFilename', None) == str(LOG_FILE)
-           for h in logger.handlers):
+# Records are written to disk by a QueueListener thread so logging never blocks the event loop.
+# The flag on the logger survives cog reloads, so handlers are only attached once per process.
+if not getattr(logger, "_themes_configured", False):
     try:
-        file_handler = logging.FileHandler(LOG_FILE, mode='w', encoding='utf-8')
+        LOG_DIR.mkdir(exist_ok=True)
+        file_handler = logging.FileHandler(LOG_FILE, mode='a', encoding='utf-8')
         file_handler.setLevel(logging.DEBUG)
         formatter = logging.Formatter(
             fmt="[%(asctime)s] [%(levelname)-8s] [%(name)s] %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S"
         )
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(QueueHandler(log_queue))
+        _log_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _log_listener.start()
+        atexit.register(_log_listener.stop)
     except Exception:
         stream_handler = logging.StreamHandler()
         stream_handler.setLevel(logging.DEBUG)
         stream_handler.setFormatter(logging.Formatter(fmt="[%(asctime)s] [%(levelname)-8s] [%(name)s] %(message)s",
                                                       datefmt="%Y-%m-%d %H:%M:%S"))
         logger.addHandler(stream_handler)
-
-logger.info("Theme system logging initialized")
+    logger._themes_configured = True
+    logger.info("Theme system logging initialized")
 
 # Database imports for bot moderator checks
 from database import is_user_bot_moderator
@@ -71,6 +116,11 @@ class ThemeCategory(Enum):
     NEON = "neon"
     CUSTOM = "custom"
 
+# Human-readable category names ("anime_character" -> "Anime Character"), formatted once
+CATEGORY_DISPLAY: Dict[ThemeCategory, str] = {
+    category: category.value.replace('_', ' ').title() for category in ThemeCategory
+}
+
 class SeasonType(Enum):
     """Seasonal theme types"""
     SPRING = "spring"
@@ -81,7 +131,7 @@ class SeasonType(Enum):
     HALLOWEEN = "halloween"
     NEW_YEAR = "new_year"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ThemeColors:
     """Color scheme for a theme"""
     primary: int          # Main embed color
@@ -92,13 +142,20 @@ class ThemeColors:
     background: str      # Background color hint (hex)
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "primary": self.primary,
+            "secondary": self.secondary,
+            "accent": self.accent,
+            "text_primary": self.text_primary,
+            "text_secondary": self.text_secondary,
+            "background": self.background
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ThemeColors':
         return cls(**data)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Theme:
     """Complete theme definition"""
     id: str
@@ -114,334 +171,380 @@ class Theme:
     is_premium: bool = False
     
     def to_dict(self) -> Dict[str, Any]:
-        data = asdict(self)
-        data['category'] = self.category.value
-        return data
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "category": self.category.value,
+            "colors": self.colors.to_dict(),
+            "emoji": self.emoji,
+            "author": self.author,
+            "character_source": self.character_source,
+            "seasonal_period": self.seasonal_period,
+            "popularity_score": self.popularity_score,
+            "is_premium": self.is_premium
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Theme':
         data['category'] = ThemeCategory(data['category'])
         data['colors'] = ThemeColors.from_dict(data['colors'])
+        if data.get('seasonal_period') is not None:
+            data['seasonal_period'] = tuple(data['seasonal_period'])  # JSON gives a list
         return cls(**data)
+    
+    def to_json_bytes(self) -> bytes:
+        return _dumps(self.to_dict())
+    
+    @classmethod
+    def from_json_bytes(cls, data: Union[bytes, str]) -> 'Theme':
+        return cls.from_dict(_loads(data))
+
+# How long get_seasonal_theme reuses its last date check
+SEASONAL_CACHE_SECONDS = 3600
+
+# Most (user, guild) pairs whose resolved effective theme is kept, least recently used evicted first
+EFFECTIVE_CACHE_SIZE = 4096
+
+# Predefined theme data lives in a JSON resource so it can be updated without touching code
+THEMES_DATA_FILE = Path(__file__).parent / "themes_data.json"
+
+
+def _load_theme_specs(path: Path = THEMES_DATA_FILE) -> Dict[str, tuple]:
+    """Load predefined theme data as plain tuples so no Theme objects are built until requested:
+    id -> (name, description, category, colors, emoji, character_source, seasonal_period)
+    colors -> (primary, secondary, accent, text_primary, text_secondary, background)
+    """
+    specs = {}
+    for entry in _loads(path.read_bytes()):
+        colors = entry["colors"]
+        seasonal_period = entry.get("seasonal_period")
+        specs[entry["id"]] = (
+            entry["name"],
+            entry["description"],
+            entry["category"],
+            (int(colors["primary"][1:], 16), int(colors["secondary"][1:], 16), int(colors["accent"][1:], 16),
+             colors["text_primary"], colors["text_secondary"], colors["background"]),
+            entry["emoji"],
+            entry.get("character_source"),
+            tuple(seasonal_period) if seasonal_period else None
+        )
+    return specs
+
 
 class ThemeManager:
     """Manages all theme operations and storage"""
     
     def __init__(self):
-        self.themes: Dict[str, Theme] = {}
+        self.themes: Dict[str, Theme] = {}  # theme_id -> Theme, filled lazily by get_theme
         self.user_themes: Dict[int, str] = {}  # user_id -> theme_id
         self.guild_themes: Dict[int, str] = {}  # guild_id -> theme_id
+        # (user_id, guild_id) -> resolved theme_id, plus a per-user index of cached keys for invalidation
+        self._effective_cache: "OrderedDict[Tuple[int, Optional[int]], str]" = OrderedDict()
+        self._user_effective_keys: Dict[int, set] = defaultdict(set)
+        self._specs: Dict[str, tuple] = {}
+        self._rng = random.Random()  # Private generator, independent of the shared module-level state
+        # Palette tuple -> shared ThemeColors, so themes with identical colors reuse one object
+        self._palette_cache: Dict[tuple, ThemeColors] = {}
+        self._color_preview: Dict[ThemeColors, str] = {}  # Palette -> formatted hex color block
+        # theme_id -> popularity score, and the id ranking derived from it (None until next read)
+        self._popularity: Dict[str, int] = {}
+        self._popular_cache: Optional[List[str]] = None
+        # Shared results of get_all_themes / get_themes_grouped_by_category
+        self._all_themes: Optional[Tuple[Theme, ...]] = None
+        self._grouped_themes: Optional[Dict[ThemeCategory, Tuple[Theme, ...]]] = None
+        self._by_category: Dict[ThemeCategory, List[str]] = defaultdict(list)  # category -> theme_ids
+        self._seasonal_by_month: List[List[str]] = [[] for _ in range(13)]  # month (1-12) -> theme_ids
+        self._seasonal_cache: Tuple[float, Optional[str]] = (float("-inf"), None)  # (monotonic time, theme_id)
+        # Primary colors packed by row so they can be read without building Theme objects
+        self._theme_ids: Tuple[str, ...] = ()
+        self._id_to_row: Dict[str, int] = {}
+        self._primary = array('I')
+        # Lowercased "name/description/source" rows for search, parallel to _theme_ids
+        self._search_haystack: Tuple[str, ...] = ()
+        # Lowercase theme name -> theme_id, and (lowercase name, theme_id) rows for partial matches
+        self._name_index: Dict[str, str] = {}
+        self._name_items: Tuple[Tuple[str, str], ...] = ()
+        self._name_choices: Tuple[str, ...] = ()  # Lowercase names for fuzzy matching
+        # Trigram of a lowercase name -> rows of _name_items containing it (substring prefilter)
+        self._name_trigrams: Dict[str, set] = defaultdict(set)
+        # theme_id -> (standalone footer, suffix for an existing footer)
+        self._footer_text: Dict[str, Tuple[str, str]] = {}
+        # theme_id -> (header line, detail line) shown for the theme in browse listings
+        self._browse_lines: Dict[str, Tuple[str, str]] = {}
         self._initialize_predefined_themes()
     
     def _initialize_predefined_themes(self):
-        """Initialize all predefined themes"""
-        # Classic themes
-        classic_themes = [
-            Theme(
-                id="default",
-                name="Default Blue",
-                description="The classic AniList blue theme",
-                category=ThemeCategory.CLASSIC,
-                colors=ThemeColors(0x02A9FF, 0x0080CC, 0x0066AA, "#FFFFFF", "#E1E8ED", "#F7F9FA"),
-                emoji="🔵"
-            ),
-            Theme(
-                id="dark_purple",
-                name="Dark Purple",
-                description="Elegant dark purple theme",
-                category=ThemeCategory.CLASSIC,
-                colors=ThemeColors(0x9D4EDD, 0x7B2CBF, 0x5A189A, "#FFFFFF", "#E9C46A", "#10002B"),
-                emoji="🟣"
-            ),
-            Theme(
-                id="crimson_red",
-                name="Crimson Red",
-                description="Bold crimson red theme",
-                category=ThemeCategory.CLASSIC,
-                colors=ThemeColors(0xDC143C, 0xB91C1C, 0x991B1B, "#FFFFFF", "#FED7D7", "#1A0000"),
-                emoji="🔴"
-            ),
-            Theme(
-                id="forest_green",
-                name="Forest Green",
-                description="Natural forest green theme",
-                category=ThemeCategory.CLASSIC,
-                colors=ThemeColors(0x22C55E, 0x16A34A, 0x15803D, "#FFFFFF", "#DCFCE7", "#0A0A0A"),
-                emoji="🟢"
-            ),
-            Theme(
-                id="sunset_orange",
-                name="Sunset Orange",
-                description="Warm sunset orange theme",
-                category=ThemeCategory.CLASSIC,
-                colors=ThemeColors(0xFF6B35, 0xE55100, 0xBF360C, "#FFFFFF", "#FFF3E0", "#1A0A00"),
-                emoji="🟠"
-            )
-        ]
-        
-        # Character-based themes
-        character_themes = [
-            Theme(
-                id="naruto",
-                name="Naruto Uzumaki",
-                description="Bright orange and blue like the Hokage",
-                category=ThemeCategory.ANIME_CHARACTER,
-                colors=ThemeColors(0xFF6600, 0x0066CC, 0xFFCC00, "#FFFFFF", "#FFF3E0", "#001122"),
-                emoji="🍥",
-                character_source="Naruto"
-            ),
-            Theme(
-                id="goku",
-                name="Son Goku",
-                description="Orange and blue like Goku's gi",
-                category=ThemeCategory.ANIME_CHARACTER,
-                colors=ThemeColors(0xFF4500, 0x1E90FF, 0xFFD700, "#FFFFFF", "#FFF8DC", "#000033"),
-                emoji="🔥",
-                character_source="Dragon Ball"
-            ),
-            Theme(
-                id="luffy",
-                name="Monkey D. Luffy",
-                description="Red and straw hat yellow",
-                category=ThemeCategory.ANIME_CHARACTER,
-                colors=ThemeColors(0xDC143C, 0xFFD700, 0x8B0000, "#FFFFFF", "#FFFACD", "#2F1B14"),
-                emoji="👒",
-                character_source="One Piece"
-            ),
-            Theme(
-                id="tanjiro",
-                name="Tanjiro Kamado",
-                description="Green and black checkered pattern vibes",
-                category=ThemeCategory.ANIME_CHARACTER,
-                colors=ThemeColors(0x2D5A27, 0x000000, 0x4A7C59, "#FFFFFF", "#F0FFF0", "#0D1B0D"),
-                emoji="⚔️",
-                character_source="Demon Slayer"
-            ),
-            Theme(
-                id="edward_elric",
-                name="Edward Elric",
-                description="Golden alchemy and red coat",
-                category=ThemeCategory.ANIME_CHARACTER,
-                colors=ThemeColors(0xDAA520, 0xB22222, 0xFFD700, "#FFFFFF", "#FFFACD", "#2B1810"),
-                emoji="⚗️",
-                character_source="Fullmetal Alchemist"
-            ),
-            Theme(
-                id="violet_evergarden",
-                name="Violet Evergarden",
-                description="Elegant violet and gold",
-                category=ThemeCategory.ANIME_CHARACTER,
-                colors=ThemeColors(0x9370DB, 0xDAA520, 0xE6E6FA, "#FFFFFF", "#F5F5F5", "#2E1A47"),
-                emoji="💌",
-                character_source="Violet Evergarden"
-            )
-        ]
-        
-        # Seasonal themes
-        seasonal_themes = [
-            Theme(
-                id="spring_sakura",
-                name="Spring Sakura",
-                description="Cherry blossom pink and fresh green",
-                category=ThemeCategory.SEASONAL,
-                colors=ThemeColors(0xFFB7C5, 0x90EE90, 0xFF69B4, "#2F4F2F", "#F0FFF0", "#FFF8F5"),
-                emoji="🌸",
-                seasonal_period=(3, 5)  # March to May
-            ),
-            Theme(
-                id="summer_ocean",
-                name="Summer Ocean",
-                description="Ocean blue and sunny yellow",
-                category=ThemeCategory.SEASONAL,
-                colors=ThemeColors(0x00CED1, 0xFFD700, 0x87CEEB, "#FFFFFF", "#F0F8FF", "#001830"),
-                emoji="🏖️",
-                seasonal_period=(6, 8)  # June to August
-            ),
-            Theme(
-                id="autumn_leaves",
-                name="Autumn Leaves",
-                description="Warm autumn colors",
-                category=ThemeCategory.SEASONAL,
-                colors=ThemeColors(0xD2691E, 0xCD853F, 0xDC143C, "#FFFFFF", "#FFF8DC", "#2F1B14"),
-                emoji="🍂",
-                seasonal_period=(9, 11)  # September to November
-            ),
-            Theme(
-                id="winter_snow",
-                name="Winter Snow",
-                description="Cool winter whites and blues",
-                category=ThemeCategory.SEASONAL,
-                colors=ThemeColors(0x4682B4, 0xB0C4DE, 0x87CEEB, "#2F4F4F", "#F0F8FF", "#F8F8FF"),
-                emoji="❄️",
-                seasonal_period=(12, 2)  # December to February
-            ),
-            Theme(
-                id="christmas_festive",
-                name="Christmas Festive",
-                description="Festive red and green",
-                category=ThemeCategory.SEASONAL,
-                colors=ThemeColors(0xDC143C, 0x228B22, 0xFFD700, "#FFFFFF", "#F0FFF0", "#0D2818"),
-                emoji="🎄",
-                seasonal_period=(12, 12)  # December only
-            ),
-            Theme(
-                id="halloween_spooky",
-                name="Halloween Spooky",
-                description="Spooky orange and black",
-                category=ThemeCategory.SEASONAL,
-                colors=ThemeColors(0xFF4500, 0x000000, 0x8B0000, "#FFFFFF", "#FFF8DC", "#1A0A00"),
-                emoji="🎃",
-                seasonal_period=(10, 10)  # October only
-            )
-        ]
-        
-        # Mood-based themes
-        mood_themes = [
-            Theme(
-                id="energetic",
-                name="Energetic Burst",
-                description="High-energy bright colors",
-                category=ThemeCategory.MOOD,
-                colors=ThemeColors(0xFF1493, 0x00FF7F, 0xFFD700, "#FFFFFF", "#FFFACD", "#1A001A"),
-                emoji="⚡"
-            ),
-            Theme(
-                id="calm_zen",
-                name="Calm Zen",
-                description="Peaceful and relaxing colors",
-                category=ThemeCategory.MOOD,
-                colors=ThemeColors(0x87CEEB, 0x98FB98, 0xE6E6FA, "#2F4F4F", "#F0F8FF", "#F5F5F5"),
-                emoji="🧘"
-            ),
-            Theme(
-                id="mysterious",
-                name="Mysterious",
-                description="Dark and mysterious atmosphere",
-                category=ThemeCategory.MOOD,
-                colors=ThemeColors(0x4B0082, 0x2F2F2F, 0x8A2BE2, "#E6E6FA", "#D8BFD8", "#0A0A0A"),
-                emoji="🌙"
-            ),
-            Theme(
-                id="romantic",
-                name="Romantic",
-                description="Soft romantic colors",
-                category=ThemeCategory.MOOD,
-                colors=ThemeColors(0xFFB6C1, 0xFFC0CB, 0xFF69B4, "#8B008B", "#FFF0F5", "#FFF8F8"),
-                emoji="💕"
-            )
-        ]
-        
-        # Gradient themes
-        gradient_themes = [
-            Theme(
-                id="sunset_gradient",
-                name="Sunset Gradient",
-                description="Beautiful sunset color transition",
-                category=ThemeCategory.GRADIENT,
-                colors=ThemeColors(0xFF4500, 0xFF6347, 0xFFD700, "#FFFFFF", "#FFF8DC", "#1A0A00"),
-                emoji="🌅"
-            ),
-            Theme(
-                id="ocean_gradient",
-                name="Ocean Gradient",
-                description="Deep ocean to surface transition",
-                category=ThemeCategory.GRADIENT,
-                colors=ThemeColors(0x000080, 0x4169E1, 0x87CEEB, "#FFFFFF", "#F0F8FF", "#000033"),
-                emoji="🌊"
-            ),
-            Theme(
-                id="aurora_gradient",
-                name="Aurora Gradient",
-                description="Northern lights inspired",
-                category=ThemeCategory.GRADIENT,
-                colors=ThemeColors(0x00FF7F, 0x00CED1, 0x9370DB, "#FFFFFF", "#F0FFF0", "#0A1A0A"),
-                emoji="🌌"
-            )
-        ]
-        
-        # Neon themes
-        neon_themes = [
-            Theme(
-                id="neon_cyberpunk",
-                name="Neon Cyberpunk",
-                description="Futuristic neon cyberpunk style",
-                category=ThemeCategory.NEON,
-                colors=ThemeColors(0x00FFFF, 0xFF00FF, 0x39FF14, "#FFFFFF", "#E0FFFF", "#000020"),
-                emoji="🤖"
-            ),
-            Theme(
-                id="neon_pink",
-                name="Neon Pink",
-                description="Electric hot pink theme",
-                category=ThemeCategory.NEON,
-                colors=ThemeColors(0xFF1493, 0xFF69B4, 0xFFB6C1, "#FFFFFF", "#FFF0F5", "#2A0A1A"),
-                emoji="💖"
+        """Register all predefined theme specs (Theme objects are built on first lookup)"""
+        # Interned ids let dict lookups short-circuit on identity
+        self._specs.update((sys.intern(theme_id), spec) for theme_id, spec in _load_theme_specs().items())
+        
+        self._theme_ids = tuple(self._specs)
+        self._id_to_row = {theme_id: row for row, theme_id in enumerate(self._theme_ids)}
+        self._primary = array('I', (self._specs[theme_id][3][0] for theme_id in self._theme_ids))
+        self._search_haystack = tuple(
+            f"{spec[0]}\x1f{spec[1]}\x1f{spec[5] or ''}".lower()
+            for spec in (self._specs[theme_id] for theme_id in self._theme_ids)
+        )
+        self._name_items = tuple((self._specs[theme_id][0].lower(), theme_id) for theme_id in self._theme_ids)
+        self._name_index = {}
+        for name_lower, theme_id in self._name_items:
+            self._name_index.setdefault(name_lower, theme_id)
+        self._name_choices = tuple(self._name_index)
+        for row, (name_lower, _) in enumerate(self._name_items):
+            for i in range(len(name_lower) - 2):
+                self._name_trigrams[name_lower[i:i + 3]].add(row)
+        self._footer_text = {}
+        for theme_id, spec in self._specs.items():
+            footer = f"Theme: {spec[0]} {spec[4]}"
+            self._footer_text[theme_id] = (footer, f" • {footer}")
+        self._browse_lines = {
+            theme_id: self._format_browse_lines(spec[0], spec[1], spec[4], spec[5])
+            for theme_id, spec in self._specs.items()
+        }
+        
+        # Build the category and seasonal indexes once
+        for theme_id, spec in self._specs.items():
+            category = ThemeCategory(spec[2])
+            self._by_category[category].append(theme_id)
+            
+            seasonal_period = spec[6]
+            if category == ThemeCategory.SEASONAL and seasonal_period:
+                start_month, end_month = seasonal_period
+                for month in range(1, 13):
+                    if start_month <= end_month:
+                        in_season = start_month <= month <= end_month
+                    else:  # Winter case (Dec-Feb)
+                        in_season = month >= start_month or month <= end_month
+                    if in_season:
+                        self._seasonal_by_month[month].append(theme_id)
+        
+        logger.info("Registered %s predefined themes", len(self._specs))
+    
+    def _get_palette(self, colors: tuple) -> ThemeColors:
+        """Return the shared ThemeColors for a palette tuple"""
+        palette = self._palette_cache.get(colors)
+        if palette is None:
+            palette = self._palette_cache[colors] = ThemeColors(*colors)
+        return palette
+    
+    def _build_theme(self, theme_id: str, spec: tuple) -> Theme:
+        """Materialize a Theme from its spec tuple"""
+        name, description, category, colors, emoji, character_source, seasonal_period = spec
+        return Theme(
+            id=theme_id,
+            name=name,
+            description=description,
+            category=ThemeCategory(category),
+            colors=self._get_palette(colors),
+            emoji=emoji,
+            character_source=character_source,
+            seasonal_period=seasonal_period,
+            popularity_score=self._popularity.get(theme_id, 0)
+        )
+    
+    @property
+    def theme_count(self) -> int:
+        """Number of available themes"""
+        return len(self._specs)
+    
+    def has_theme(self, theme_id: str) -> bool:
+        """Check whether a theme ID exists without building the theme"""
+        return theme_id in self._specs
+    
+    def get_footer_text(self, theme: Theme) -> Tuple[str, str]:
+        """Return (footer, footer suffix) strings for a theme"""
+        footer_text = self._footer_text.get(theme.id)
+        if footer_text is None:
+            footer = f"Theme: {theme.name} {theme.emoji}"
+            footer_text = (footer, f" • {footer}")
+        return footer_text
+    
+    @staticmethod
+    def _format_browse_lines(name: str, description: str, emoji: str,
+                             character_source: Optional[str]) -> Tuple[str, str]:
+        """Build the two browse listing lines for a theme"""
+        if character_source:
+            detail = f"   └ *from {character_source}*"
+        else:
+            detail = f"   └ *{description}*"
+        return f"{emoji} **{name}**", detail
+    
+    def get_browse_lines(self, theme: Theme) -> Tuple[str, str]:
+        """Return the (header, detail) browse listing lines for a theme"""
+        lines = self._browse_lines.get(theme.id)
+        if lines is None:
+            lines = self._format_browse_lines(theme.name, theme.description, theme.emoji, theme.character_source)
+        return lines
+    
+    def get_color_preview(self, theme: Theme) -> str:
+        """Return the '**Primary:** #RRGGBB ...' block for a theme's palette, formatted once"""
+        colors = theme.colors
+        preview = self._color_preview.get(colors)
+        if preview is None:
+            preview = self._color_preview[colors] = (
+                f"**Primary:** #{colors.primary:06X}\n"
+                f"**Secondary:** #{colors.secondary:06X}\n"
+                f"**Accent:** #{colors.accent:06X}"
             )
-        ]
-        
-        # Store all themes
-        all_themes = classic_themes + character_themes + seasonal_themes + mood_themes + gradient_themes + neon_themes
-        for theme in all_themes:
-            self.themes[theme.id] = theme
-        
-        logger.info(f"Initialized {len(all_themes)} predefined themes")
+        return preview
+    
+    def random_theme(self) -> Theme:
+        """Pick a random theme without materializing the full theme list"""
+        return self.get_theme(self._rng.choice(self._theme_ids))
     
     def get_theme(self, theme_id: str) -> Optional[Theme]:
-        """Get a theme by ID"""
-        return self.themes.get(theme_id)
+        """Get a theme by ID, building and caching it on first use"""
+        theme = self.themes.get(theme_id)
+        if theme is None:
+            spec = self._specs.get(theme_id)
+            if spec is None:
+                return None
+            theme = self.themes[theme_id] = self._build_theme(theme_id, spec)
+        return theme
+    
+    def get_primary(self, theme_id: str) -> Optional[int]:
+        """Get a theme's primary embed color without building the theme"""
+        row = self._id_to_row.get(theme_id)
+        return self._primary[row] if row is not None else None
+    
+    def get_all_themes(self) -> Tuple[Theme, ...]:
+        """Get every available theme in definition order (shared, read-only tuple)"""
+        if self._all_themes is None:
+            self._all_themes = tuple(self.get_theme(theme_id) for theme_id in self._theme_ids)
+        return self._all_themes
     
     def get_themes_by_category(self, category: ThemeCategory) -> List[Theme]:
         """Get all themes in a category"""
-        return [theme for theme in self.themes.values() if theme.category == category]
+        return [self.get_theme(theme_id) for theme_id in self._by_category.get(category, ())]
+    
+    def get_themes_grouped_by_category(self) -> Dict[ThemeCategory, Tuple[Theme, ...]]:
+        """Get all themes grouped by category (shared, read-only)"""
+        if self._grouped_themes is None:
+            self._grouped_themes = {
+                category: tuple(self.get_theme(theme_id) for theme_id in theme_ids)
+                for category, theme_ids in self._by_category.items()
+            }
+        return self._grouped_themes
     
     def get_seasonal_theme(self) -> Optional[Theme]:
-        """Get the appropriate seasonal theme for current date"""
+        """Get the appropriate seasonal theme for current date (recomputed at most once per hour)"""
+        checked_at, theme_id = self._seasonal_cache
+        if time.monotonic() - checked_at < SEASONAL_CACHE_SECONDS:
+            return self.get_theme(theme_id) if theme_id else None
+        
         now = datetime.now()
         current_month = now.month
         
         # Check for special seasonal themes first
         if current_month == 12 and now.day >= 20:  # Christmas period
-            return self.get_theme("christmas_festive")
+            theme_id = "christmas_festive"
         elif current_month == 10:  # Halloween
-            return self.get_theme("halloween_spooky")
-        
-        # Regular seasonal themes
-        for theme in self.themes.values():
-            if theme.category == ThemeCategory.SEASONAL and theme.seasonal_period:
-                start_month, end_month = theme.seasonal_period
-                if start_month <= end_month:
-                    if start_month <= current_month <= end_month:
-                        return theme
-                else:  # Winter case (Dec-Feb)
-                    if current_month >= start_month or current_month <= end_month:
-                        return theme
+            theme_id = "halloween_spooky"
+        else:
+            # Regular seasonal themes
+            theme_ids = self._seasonal_by_month[current_month]
+            theme_id = theme_ids[0] if theme_ids else None
+        
+        if theme_id != self._seasonal_cache[1]:
+            # Season rolled over; cached resolutions may have fallen through to the old one
+            self._clear_effective_cache()
+        self._seasonal_cache = (time.monotonic(), theme_id)
+        return self.get_theme(theme_id) if theme_id else None
+    
+    def resolve_theme(self, query: str) -> Optional[Theme]:
+        """Resolve user input to a theme: exact name, theme ID, partial name, then closest spelling"""
+        query_lower = query.lower()
         
+        theme_id = self._name_index.get(query_lower)
+        if theme_id is None and query_lower in self._specs:
+            theme_id = query_lower
+        if theme_id is None:
+            theme_id = self._partial_name_match(query_lower)
+        if theme_id is None:
+            name_lower = self._closest_name(query_lower)
+            if name_lower is not None:
+                theme_id = self._name_index[name_lower]
+        return self.get_theme(theme_id) if theme_id else None
+    
+    def _partial_name_match(self, query_lower: str) -> Optional[str]:
+        """First theme (in registry order) whose lowercase name contains the query"""
+        name_items = self._name_items
+        if len(query_lower) < 3:
+            rows = range(len(name_items))
+        else:
+            # A name containing the query contains every query trigram, so intersect their row sets
+            trigrams = self._name_trigrams
+            candidates = None
+            for i in range(len(query_lower) - 2):
+                found = trigrams.get(query_lower[i:i + 3])
+                if not found:
+                    return None
+                candidates = found.copy() if candidates is None else candidates & found
+                if not candidates:
+                    return None
+            rows = sorted(candidates)
+        for row in rows:
+            name_lower, theme_id = name_items[row]
+            if query_lower in name_lower:
+                return theme_id
         return None
     
+    def _closest_name(self, query_lower: str) -> Optional[str]:
+        """Best-scoring lowercase theme name for a possibly misspelled query"""
+        if RAPIDFUZZ_AVAILABLE:
+            match = process.extractOne(query_lower, self._name_choices, scorer=fuzz.WRatio,
+                                       score_cutoff=FUZZY_MATCH_CUTOFF)
+            return match[0] if match else None
+        matches = get_close_matches(query_lower, self._name_choices, n=1, cutoff=FUZZY_MATCH_CUTOFF / 100)
+        return matches[0] if matches else None
+    
     def get_popular_themes(self, limit: int = 10) -> List[Theme]:
         """Get most popular themes"""
-        return sorted(self.themes.values(), key=lambda t: t.popularity_score, reverse=True)[:limit]
+        if self._popular_cache is None:
+            popularity = self._popularity
+            self._popular_cache = sorted(self._theme_ids, key=lambda i: popularity.get(i, 0), reverse=True)
+        return [self.get_theme(theme_id) for theme_id in self._popular_cache[:limit]]
+    
+    def bump_popularity(self, theme_id: str, amount: int = 1) -> bool:
+        """Increase a theme's popularity score"""
+        if theme_id not in self._specs:
+            return False
+        self._popularity[theme_id] = self._popularity.get(theme_id, 0) + amount
+        self.themes.pop(theme_id, None)  # Themes are frozen; rebuild with the new score on next lookup
+        self._popular_cache = None
+        self._all_themes = None
+        self._grouped_themes = None
+        return True
     
     def search_themes(self, query: str) -> List[Theme]:
         """Search themes by name or description"""
         query_lower = query.lower()
-        results = []
-        
-        for theme in self.themes.values():
-            if (query_lower in theme.name.lower() or 
-                query_lower in theme.description.lower() or 
-                (theme.character_source and query_lower in theme.character_source.lower())):
-                results.append(theme)
-        
-        return results
+        if "\x1f" in query_lower:  # never match across field separators
+            return []
+        
+        theme_ids = self._theme_ids
+        return [
+            self.get_theme(theme_ids[row])
+            for row, haystack in enumerate(self._search_haystack)
+            if query_lower in haystack
+        ]
     
     def set_user_theme(self, user_id: int, theme_id: str) -> bool:
         """Set a user's theme"""
-        if theme_id in self.themes:
-            self.user_themes[user_id] = theme_id
+        if theme_id in self._specs:
+            self.user_themes[user_id] = sys.intern(theme_id)
+            self._invalidate_user_effective(user_id)
             return True
         return False
     
+    def clear_user_theme(self, user_id: int) -> bool:
+        """Remove a user's theme preference; returns False if none was set"""
+        if self.user_themes.pop(user_id, None) is None:
+            return False
+        self._invalidate_user_effective(user_id)
+        return True
+    
     def get_user_theme(self, user_id: int) -> Optional[Theme]:
         """Get a user's current theme"""
         theme_id = self.user_themes.get(user_id)
@@ -451,13 +554,56 @@ class ThemeManager:
     
     def set_guild_theme(self, guild_id: int, theme_id: str) -> bool:
         """Set a guild's default theme"""
-        if theme_id in self.themes:
-            self.guild_themes[guild_id] = theme_id
+        if theme_id in self._specs:
+            self.guild_themes[guild_id] = sys.intern(theme_id)
+            self._clear_effective_cache()  # Guild changes are rare; drop every member's entry
             return True
         return False
     
+    def clear_guild_theme(self, guild_id: int) -> bool:
+        """Remove a guild's default theme; returns False if none was set"""
+        if self.guild_themes.pop(guild_id, None) is None:
+            return False
+        self._clear_effective_cache()
+        return True
+    
+    def _invalidate_user_effective(self, user_id: int):
+        """Drop cached effective themes for one user across all guilds"""
+        for key in self._user_effective_keys.pop(user_id, ()):
+            self._effective_cache.pop(key, None)
+    
+    def _clear_effective_cache(self):
+        """Drop all cached effective themes"""
+        self._effective_cache.clear()
+        self._user_effective_keys.clear()
+    
     def get_effective_theme(self, user_id: int, guild_id: Optional[int] = None) -> Theme:
         """Get the effective theme for a user (user > guild > seasonal > default)"""
+        # Let an expired seasonal check run (and invalidate on rollover) before trusting the cache
+        if time.monotonic() - self._seasonal_cache[0] >= SEASONAL_CACHE_SECONDS:
+            self.get_seasonal_theme()
+        
+        key = (user_id, guild_id)
+        cache = self._effective_cache
+        theme_id = cache.get(key)
+        if theme_id is not None:
+            cache.move_to_end(key)
+            return self.get_theme(theme_id)
+        
+        theme = self._resolve_effective_theme(user_id, guild_id)
+        cache[key] = theme.id
+        self._user_effective_keys[user_id].add(key)
+        if len(cache) > EFFECTIVE_CACHE_SIZE:
+            (old_user_id, old_guild_id), _ = cache.popitem(last=False)
+            keys = self._user_effective_keys.get(old_user_id)
+            if keys is not None:
+                keys.discard((old_user_id, old_guild_id))
+                if not keys:
+                    del self._user_effective_keys[old_user_id]
+        return theme
+    
+    def _resolve_effective_theme(self, user_id: int, guild_id: Optional[int]) -> Theme:
+        """Walk the user > guild > seasonal > default chain"""
         # User preference first
         user_theme = self.get_user_theme(user_id)
         if user_theme:
@@ -478,14 +624,26 @@ class ThemeManager:
         return self.get_theme("default")
 
 
+async def _reply(interaction: discord.Interaction, **kwargs):
+    """Answer the interaction directly if still unanswered, otherwise via followup"""
+    if interaction.response.is_done():
+        await interaction.followup.send(**kwargs)
+    else:
+        await interaction.response.send_message(**kwargs)
+
+
 class ThemeMainMenuView(discord.ui.View):
-    """Main menu view for unified theme system"""
+    """Main menu view for unified theme system
+    
+    Persistent (no timeout, fixed custom_ids): one instance per cog is shared by
+    every /theme message and survives bot restarts.
+    """
     
     def __init__(self, theme_cog):
-        super().__init__(timeout=300.0)
+        super().__init__(timeout=None)
         self.theme_cog = theme_cog
     
-    @discord.ui.button(label="🔍 Browse & Preview", style=discord.ButtonStyle.primary, row=0)
+    @discord.ui.button(label="🔍 Browse & Preview", style=discord.ButtonStyle.primary, row=0, custom_id="theme_main_menu:browse")
     async def browse_preview(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Open interactive theme browser with live preview"""
         try:
@@ -512,58 +670,52 @@ class ThemeMainMenuView(discord.ui.View):
             
             embed.add_field(
                 name="📊 Available",
-                value=f"• {len(self.theme_cog.theme_manager.themes)} total themes\n• 7 categories\n• Character themes\n• Seasonal themes",
+                value=f"• {self.theme_cog.theme_manager.theme_count} total themes\n• 7 categories\n• Character themes\n• Seasonal themes",
                 inline=True
             )
             
             view = ThemeCategoryView(self.theme_cog.theme_manager)
             await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
-            logger.info(f"Theme browser opened for user {interaction.user.id}")
+            logger.info("Theme browser opened for user %s", interaction.user.id)
         except Exception as e:
-            logger.error(f"Error opening theme browser: {e}")
+            logger.error("Error opening theme browser: %s", e)
             await interaction.response.send_message("❌ Error opening theme browser.", ephemeral=True)
     
-    @discord.ui.button(label="📋 View All Themes", style=discord.ButtonStyle.secondary, row=0)
+    @discord.ui.button(label="📋 View All Themes", style=discord.ButtonStyle.secondary, row=0, custom_id="theme_main_menu:showcase")
     async def showcase_all(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Show comprehensive theme showcase"""
         await interaction.response.defer(ephemeral=True)
         
         try:
-            themes = list(self.theme_cog.theme_manager.themes.values())
-            
-            # Group themes by category
-            category_themes = {}
-            for theme in themes:
-                cat = theme.category.value
-                if cat not in category_themes:
-                    category_themes[cat] = []
-                category_themes[cat].append(theme)
+            theme_manager = self.theme_cog.theme_manager
+            grouped = theme_manager.get_themes_grouped_by_category()
             
             embed = discord.Embed(
                 title="🎨 Complete Theme Showcase",
-                description=f"Browse all **{len(themes)}** available themes organized by category:",
+                description=f"Browse all **{theme_manager.theme_count}** available themes organized by category:",
                 color=0x02A9FF
             )
             
-            for category_name, cat_themes in sorted(category_themes.items()):
-                theme_list = "\n".join([f"{t.emoji} **{t.name}** - {t.description[:50]}..." for t in cat_themes[:5]])
-                if len(cat_themes) > 5:
-                    theme_list += f"\n*... and {len(cat_themes) - 5} more*"
+            for category, cat_themes in sorted(grouped.items(), key=lambda item: item[0].value):
+                count = len(cat_themes)
+                theme_list = "\n".join([f"{t.emoji} **{t.name}** - {t.description[:50]}..." for t in islice(cat_themes, 5)])
+                if count > 5:
+                    theme_list += f"\n*... and {count - 5} more*"
                 
                 embed.add_field(
-                    name=f"{category_name.replace('_', ' ').title()} ({len(cat_themes)} themes)",
+                    name=f"{CATEGORY_DISPLAY[category]} ({count} themes)",
                     value=theme_list,
                     inline=False
                 )
             
             embed.set_footer(text="Use 'Browse & Preview' to see themes in action!")
             await interaction.followup.send(embed=embed, ephemeral=True)
-            logger.info(f"Theme showcase sent to user {interaction.user.id}")
+            logger.info("Theme showcase sent to user %s", interaction.user.id)
         except Exception as e:
-            logger.error(f"Error in theme showcase: {e}")
+            logger.error("Error in theme showcase: %s", e)
             await interaction.followup.send("❌ Error loading theme showcase.", ephemeral=True)
     
-    @discord.ui.button(label="⚙️ My Current Theme", style=discord.ButtonStyle.secondary, row=1)
+    @discord.ui.button(label="⚙️ My Current Theme", style=discord.ButtonStyle.secondary, row=1, custom_id="theme_main_menu:current")
     async def current_theme(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Show current theme details"""
         guild_id = interaction.guild.id if interaction.guild else None
@@ -577,14 +729,14 @@ class ThemeMainMenuView(discord.ui.View):
         
         embed.add_field(
             name="📁 Category",
-            value=theme.category.value.replace('_', ' ').title(),
+            value=CATEGORY_DISPLAY[theme.category],
             inline=True
         )
         
         if theme.character_source:
             embed.add_field(name="📺 Source", value=theme.character_source, inline=True)
         
-        color_info = f"**Primary:** #{theme.colors.primary:06X}\n**Secondary:** #{theme.colors.secondary:06X}\n**Accent:** #{theme.colors.accent:06X}"
+        color_info = self.theme_cog.theme_manager.get_color_preview(theme)
         embed.add_field(name="🎨 Colors", value=color_info, inline=False)
         
         embed.add_field(
@@ -595,29 +747,31 @@ class ThemeMainMenuView(discord.ui.View):
         
         embed.set_footer(text=f"Theme: {theme.name} {theme.emoji}")
         await interaction.response.send_message(embed=embed, ephemeral=True)
-        logger.info(f"Current theme details sent to user {interaction.user.id}")
+        logger.info("Current theme details sent to user %s", interaction.user.id)
+    
+    async def _send_theme_applied(self, interaction: discord.Interaction, theme: Theme,
+                                  title: str, description: str, footer_prefix: str):
+        """Apply a theme for the user and confirm it with a theme-colored embed"""
+        theme_manager = self.theme_cog.theme_manager
+        theme_manager.set_user_theme(interaction.user.id, theme.id)
+        
+        embed = discord.Embed(title=title, description=description, color=theme.colors.primary)
+        embed.set_footer(text=f"{footer_prefix} {theme_manager.get_footer_text(theme)[0]}")
+        await interaction.response.send_message(embed=embed, ephemeral=True)
     
-    @discord.ui.button(label="🎲 Random Theme", style=discord.ButtonStyle.secondary, row=1)
+    @discord.ui.button(label="🎲 Random Theme", style=discord.ButtonStyle.secondary, row=1, custom_id="theme_main_menu:random")
     async def random_theme(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Apply a random theme"""
-        import random
-        themes = list(self.theme_cog.theme_manager.themes.values())
-        theme = random.choice(themes)
-        
-        guild_id = interaction.guild.id if interaction.guild else None
-        self.theme_cog.theme_manager.set_user_theme(interaction.user.id, theme.id)
-        
-        embed = discord.Embed(
-            title=f"🎲 Random Theme Applied: {theme.name}",
-            description=f"Your theme has been randomly set to **{theme.name}**!\n\n*{theme.description}*",
-            color=theme.colors.primary
+        theme = self.theme_cog.theme_manager.random_theme()
+        await self._send_theme_applied(
+            interaction, theme,
+            f"🎲 Random Theme Applied: {theme.name}",
+            f"Your theme has been randomly set to **{theme.name}**!\n\n*{theme.description}*",
+            "Feeling lucky?"
         )
-        embed.set_footer(text=f"Feeling lucky? Theme: {theme.name} {theme.emoji}")
-        
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-        logger.info(f"Random theme '{theme.name}' applied for user {interaction.user.id}")
+        logger.info("Random theme '%s' applied for user %s", theme.name, interaction.user.id)
     
-    @discord.ui.button(label="🌸 Seasonal Theme", style=discord.ButtonStyle.secondary, row=2)
+    @discord.ui.button(label="🌸 Seasonal Theme", style=discord.ButtonStyle.secondary, row=2, custom_id="theme_main_menu:seasonal")
     async def seasonal_theme(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Apply current seasonal theme"""
         theme = self.theme_cog.theme_manager.get_seasonal_theme()
@@ -626,61 +780,137 @@ class ThemeMainMenuView(discord.ui.View):
             await interaction.response.send_message("❌ No seasonal theme available for current month.", ephemeral=True)
             return
         
-        guild_id = interaction.guild.id if interaction.guild else None
-        self.theme_cog.theme_manager.set_user_theme(interaction.user.id, theme.id)
-        
-        embed = discord.Embed(
-            title=f"🌸 Seasonal Theme Applied: {theme.name}",
-            description=f"Your theme has been set to the current seasonal theme **{theme.name}**!\n\n*{theme.description}*",
-            color=theme.colors.primary
+        await self._send_theme_applied(
+            interaction, theme,
+            f"🌸 Seasonal Theme Applied: {theme.name}",
+            f"Your theme has been set to the current seasonal theme **{theme.name}**!\n\n*{theme.description}*",
+            "Perfect for the season!"
         )
-        embed.set_footer(text=f"Perfect for the season! Theme: {theme.name} {theme.emoji}")
-        
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-        logger.info(f"Seasonal theme '{theme.name}' applied for user {interaction.user.id}")
+        logger.info("Seasonal theme '%s' applied for user %s", theme.name, interaction.user.id)
     
-    @discord.ui.button(label="🔄 Reset to Default", style=discord.ButtonStyle.danger, row=2)
+    @discord.ui.button(label="🔄 Reset to Default", style=discord.ButtonStyle.danger, row=2, custom_id="theme_main_menu:reset")
     async def reset_theme(self, interaction: discord.Interaction, button: discord.ui.Button):
         """Reset to default theme"""
-        self.theme_cog.theme_manager.set_user_theme(interaction.user.id, "default")
         theme = self.theme_cog.theme_manager.get_theme("default")
-        
-        embed = discord.Embed(
-            title="🔄 Theme Reset",
-            description=f"Your theme has been reset to the default **{theme.name}** theme.",
-            color=theme.colors.primary
+        await self._send_theme_applied(
+            interaction, theme,
+            "🔄 Theme Reset",
+            f"Your theme has been reset to the default **{theme.name}** theme.",
+            "Back to basics!"
         )
-        embed.set_footer(text=f"Back to basics! Theme: {theme.name} {theme.emoji}")
-        
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-        logger.info(f"Theme reset to default for user {interaction.user.id}")
-
+        logger.info("Theme reset to default for user %s", interaction.user.id)
 
 class CustomThemeSystem(commands.Cog):
     """Custom Theme System for the AniList bot"""
     
+    # Static "How to Use" field appended to every browse listing
+    _HOW_TO_USE_NAME = "💡 How to Use"
+    _HOW_TO_USE_VALUE = (
+        "`/theme set <theme_name>` - Apply a theme\n"
+        "`/theme current` - View your current theme\n"
+        "`/theme seasonal` - Auto seasonal theme"
+    )
+    
     def __init__(self, bot):
         self.bot = bot
         self.theme_manager = ThemeManager()
+        self._main_view = ThemeMainMenuView(self)
+        # Constant error/notice embeds, built once and sent as-is (never mutate them)
+        self._theme_error_embed = discord.Embed(
+            title="❌ Error",
+            description="An error occurred while opening theme system. Please try again.",
+            color=0xFF0000
+        )
+        self._missing_name_embed = discord.Embed(
+            title="❌ Missing Theme Name",
+            description="Please specify a theme name to apply.\nUse `/theme browse` to see available themes.",
+            color=0xFF0000
+        )
+        self._apply_failed_embed = discord.Embed(
+            title="❌ Failed to Apply Theme",
+            description="An error occurred while applying the theme.",
+            color=0xFF0000
+        )
+        self._no_seasonal_embed = discord.Embed(
+            title="🌟 No Seasonal Theme",
+            description="There's no special seasonal theme available right now.\nTry again during special seasons!",
+            color=0xFFA500
+        )
+        self._guild_error_embed = discord.Embed(
+            title="❌ Error",
+            description="An error occurred while processing the guild theme request.",
+            color=0xFF0000
+        )
+        self._guild_missing_name_embed = discord.Embed(
+            title="❌ Missing Theme Name",
+            description="Please specify a theme name for the guild.\nUse `/theme browse` to see available themes.",
+            color=0xFF0000
+        )
+        default_theme = self.theme_manager.get_theme("default")
+        self._reset_embed = discord.Embed(
+            title="🔄 Theme Reset",
+            description="Your theme has been reset to default. Seasonal themes will be applied automatically!",
+            color=default_theme.colors.primary
+        )
+        self._reset_embed.set_footer(text=self.theme_manager.get_footer_text(default_theme)[0])
+        self._no_user_theme_embed = discord.Embed(
+            title="🔄 Nothing to Reset",
+            description="You haven't set a personal theme. Default and seasonal themes are already in use.",
+            color=default_theme.colors.primary
+        )
+        self._guild_reset_embed = discord.Embed(
+            title="🔄 Guild Theme Reset",
+            description="Guild theme has been reset. Default and seasonal themes will be used.",
+            color=0x02A9FF
+        )
+        self._no_guild_theme_embed = discord.Embed(
+            title="🔄 Nothing to Reset",
+            description="This server has no guild theme set. Default and seasonal themes are already in use.",
+            color=0x02A9FF
+        )
+        self._guild_failed_embed = discord.Embed(
+            title="❌ Failed to Set Guild Theme",
+            description="An error occurred while setting the guild theme.",
+            color=0xFF0000
+        )
+        # Invariant parts of the /theme menu embed; description, color and footer are per-user
+        self._menu_embed_template = {
+            "title": "🎨 Theme Management System",
+            "fields": [
+                {
+                    "name": "📊 System Info",
+                    "value": f"• **{self.theme_manager.theme_count}** total themes\n• **7** categories\n• Character themes\n• Seasonal themes",
+                    "inline": True
+                },
+                {
+                    "name": "🌟 Features",
+                    "value": "• Live preview\n• Interactive browser\n• Quick apply\n• Random selection",
+                    "inline": True
+                }
+            ]
+        }
         logger.info("Custom Theme System initialized")
     
     async def cog_load(self):
         """Called when the cog is loaded"""
+        # Register the shared main menu so its buttons keep working after restarts
+        self.bot.add_view(self._main_view)
         logger.info("Custom Theme System loaded successfully")
     
     async def cog_unload(self):
         """Called when the cog is unloaded"""
+        self._main_view.stop()
         logger.info("Custom Theme System unloaded")
     
     def apply_theme_to_embed(self, embed: discord.Embed, theme: Theme, user_id: int) -> discord.Embed:
         """Apply a theme to a Discord embed"""
-        embed.color = theme.colors.primary
+        primary = self.theme_manager.get_primary(theme.id)
+        embed.color = primary if primary is not None else theme.colors.primary
         
         # Add theme footer
-        if embed.footer.text:
-            embed.set_footer(text=f"{embed.footer.text} • Theme: {theme.name} {theme.emoji}")
-        else:
-            embed.set_footer(text=f"Theme: {theme.name} {theme.emoji}")
+        footer, suffix = self.theme_manager.get_footer_text(theme)
+        existing = embed.footer.text
+        embed.set_footer(text=existing + suffix if existing else footer)
         
         return embed
     
@@ -689,71 +919,54 @@ class CustomThemeSystem(commands.Cog):
         """Unified theme management command with interactive interface"""
         try:
             guild_id = interaction.guild.id if interaction.guild else None
-            logger.info(f"Theme command invoked by {interaction.user.display_name} ({interaction.user.id}) in guild {guild_id}")
+            logger.info("Theme command invoked by %s (%s) in guild %s", interaction.user.display_name, interaction.user.id, guild_id)
             
             # Get current theme info
             current_theme = self.theme_manager.get_effective_theme(interaction.user.id, guild_id)
-            total_themes = len(self.theme_manager.themes)
-            
-            embed = discord.Embed(
-                title="🎨 Theme Management System",
-                description=(
-                    "Welcome to the complete theme customization system!\n\n"
-                    "**Your Current Theme:**\n"
-                    f"{current_theme.emoji} **{current_theme.name}**\n"
-                    f"*{current_theme.description}*\n\n"
-                    "Choose an option below to get started:"
-                ),
-                color=current_theme.colors.primary
-            )
             
-            embed.add_field(
-                name="📊 System Info",
-                value=f"• **{total_themes}** total themes\n• **7** categories\n• Character themes\n• Seasonal themes",
-                inline=True
-            )
-            
-            embed.add_field(
-                name="🌟 Features",
-                value="• Live preview\n• Interactive browser\n• Quick apply\n• Random selection",
-                inline=True
+            # from_dict shares the template's field list, so never add fields to this embed
+            embed = discord.Embed.from_dict(self._menu_embed_template)
+            embed.description = (
+                "Welcome to the complete theme customization system!\n\n"
+                "**Your Current Theme:**\n"
+                f"{current_theme.emoji} **{current_theme.name}**\n"
+                f"*{current_theme.description}*\n\n"
+                "Choose an option below to get started:"
             )
+            embed.color = current_theme.colors.primary
             
             if interaction.guild:
                 embed.set_footer(text=f"Guild: {interaction.guild.name} | Theme: {current_theme.name} {current_theme.emoji}")
             else:
                 embed.set_footer(text=f"DM | Theme: {current_theme.name} {current_theme.emoji}")
             
-            view = ThemeMainMenuView(self)
-            await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
-            logger.info(f"Theme main menu sent to user {interaction.user.id} in guild {guild_id}")
+            await interaction.response.send_message(embed=embed, view=self._main_view, ephemeral=True)
+            logger.info("Theme main menu sent to user %s in guild %s", interaction.user.id, guild_id)
         
         except Exception as e:
             guild_id = interaction.guild.id if interaction.guild else None
-            logger.error(f"Error in theme command for user {interaction.user.id} in guild {guild_id}: {e}", exc_info=True)
-            embed = discord.Embed(
-                title="❌ Error",
-                description="An error occurred while opening theme system. Please try again.",
-                color=0xFF0000
-            )
-            
+            logger.error("Error in theme command for user %s in guild %s: %s", interaction.user.id, guild_id, e, exc_info=True)
             try:
-                await interaction.response.send_message(embed=embed, ephemeral=True)
+                await interaction.response.send_message(embed=self._theme_error_embed, ephemeral=True)
             except Exception as follow_e:
-                logger.error(f"Failed to send error message: {follow_e}")
+                logger.error("Failed to send error message: %s", follow_e)
     
     async def _handle_browse_themes(self, interaction: discord.Interaction, category: str):
         """Handle browsing available themes"""
-        if category == "all":
-            themes = list(self.theme_manager.themes.values())
+        try:
+            cat_enum = ThemeCategory(category) if category != "all" else None
+        except ValueError:
+            cat_enum = None
+        
+        if cat_enum is None:
+            by_category = self.theme_manager.get_themes_grouped_by_category()
+            theme_count = self.theme_manager.theme_count
         else:
-            try:
-                cat_enum = ThemeCategory(category)
-                themes = self.theme_manager.get_themes_by_category(cat_enum)
-            except ValueError:
-                themes = list(self.theme_manager.themes.values())
+            themes = self.theme_manager.get_themes_by_category(cat_enum)
+            by_category = {cat_enum: themes}
+            theme_count = len(themes)
         
-        if not themes:
+        if not theme_count:
             embed = discord.Embed(
                 title="📋 No Themes Found",
                 description=f"No themes found in category: {category}",
@@ -764,73 +977,42 @@ class CustomThemeSystem(commands.Cog):
         
         # Create theme browser embed
         embed = discord.Embed(
-            title=f"🎨 Available Themes ({len(themes)})",
+            title=f"🎨 Available Themes ({theme_count})",
             description=f"**Category:** {category.title() if category != 'all' else 'All Categories'}\n\n",
             color=0x02A9FF
         )
         
-        # Group themes by category for better display
-        by_category = {}
-        for theme in themes[:15]:  # Limit to 15 for embed space
-            cat = theme.category.value
-            if cat not in by_category:
-                by_category[cat] = []
-            by_category[cat].append(theme)
-        
-        for cat, cat_themes in by_category.items():
+        # Themes are already grouped by category; show the first 15 for embed space
+        # Each field lists at most 4 themes (8 lines); only those are formatted
+        remaining = 15
+        for cat_enum, cat_themes in by_category.items():
+            if remaining <= 0:
+                break
+            shown = min(len(cat_themes), remaining)
+            remaining -= shown
             theme_list = []
-            for theme in cat_themes:
-                theme_list.append(f"{theme.emoji} **{theme.name}**")
-                if theme.character_source:
-                    theme_list.append(f"   └ *from {theme.character_source}*")
-                else:
-                    theme_list.append(f"   └ *{theme.description}*")
+            for theme in islice(cat_themes, min(shown, 4)):
+                theme_list.extend(self.theme_manager.get_browse_lines(theme))
             
+            hidden_lines = shown * 2 - len(theme_list)
             embed.add_field(
-                name=f"📁 {cat.replace('_', ' ').title()}",
-                value="\n".join(theme_list[:8]) + (f"\n*...and {len(theme_list)-8} more*" if len(theme_list) > 8 else ""),
+                name=f"📁 {CATEGORY_DISPLAY[cat_enum]}",
+                value="\n".join(theme_list) + (f"\n*...and {hidden_lines} more*" if hidden_lines > 0 else ""),
                 inline=False
             )
         
-        embed.add_field(
-            name="💡 How to Use",
-            value="`/theme set <theme_name>` - Apply a theme\n`/theme current` - View your current theme\n`/theme seasonal` - Auto seasonal theme",
-            inline=False
-        )
+        embed.add_field(name=self._HOW_TO_USE_NAME, value=self._HOW_TO_USE_VALUE, inline=False)
         
         await interaction.followup.send(embed=embed)
     
     async def _handle_set_theme(self, interaction: discord.Interaction, theme_name: Optional[str]):
         """Handle setting a user's theme"""
         if not theme_name:
-            embed = discord.Embed(
-                title="❌ Missing Theme Name",
-                description="Please specify a theme name to apply.\nUse `/theme browse` to see available themes.",
-                color=0xFF0000
-            )
-            await interaction.followup.send(embed=embed)
+            await interaction.followup.send(embed=self._missing_name_embed)
             return
         
-        # Search for theme by name (fuzzy matching)
-        found_theme = None
-        theme_name_lower = theme_name.lower()
-        
-        # Exact match first
-        for theme in self.theme_manager.themes.values():
-            if theme.name.lower() == theme_name_lower:
-                found_theme = theme
-                break
-        
-        # Partial match if no exact match
-        if not found_theme:
-            for theme in self.theme_manager.themes.values():
-                if theme_name_lower in theme.name.lower():
-                    found_theme = theme
-                    break
-        
-        # ID match as fallback
-        if not found_theme:
-            found_theme = self.theme_manager.get_theme(theme_name_lower)
+        # Search for theme by name or ID
+        found_theme = self.theme_manager.resolve_theme(theme_name)
         
         if not found_theme:
             embed = discord.Embed(
@@ -854,7 +1036,7 @@ class CustomThemeSystem(commands.Cog):
             
             embed.add_field(
                 name="🎨 Theme Details",
-                value=f"**Category:** {found_theme.category.value.replace('_', ' ').title()}\n"
+                value=f"**Category:** {CATEGORY_DISPLAY[found_theme.category]}\n"
                       f"**Colors:** Primary theme applied\n"
                       f"**Emoji:** {found_theme.emoji}",
                 inline=False
@@ -871,12 +1053,7 @@ class CustomThemeSystem(commands.Cog):
             
             await interaction.followup.send(embed=embed)
         else:
-            embed = discord.Embed(
-                title="❌ Failed to Apply Theme",
-                description="An error occurred while applying the theme.",
-                color=0xFF0000
-            )
-            await interaction.followup.send(embed=embed)
+            await interaction.followup.send(embed=self._apply_failed_embed)
     
     async def _handle_current_theme(self, interaction: discord.Interaction):
         """Show user's current theme"""
@@ -897,7 +1074,7 @@ class CustomThemeSystem(commands.Cog):
         embed.add_field(
             name="📋 Theme Info",
             value=f"**Source:** {theme_source}\n"
-                  f"**Category:** {current_theme.category.value.replace('_', ' ').title()}\n"
+                  f"**Category:** {CATEGORY_DISPLAY[current_theme.category]}\n"
                   f"**Emoji:** {current_theme.emoji}",
             inline=True
         )
@@ -910,9 +1087,7 @@ class CustomThemeSystem(commands.Cog):
             )
         
         # Color preview
-        color_preview = f"**Primary:** #{current_theme.colors.primary:06X}\n"
-        color_preview += f"**Secondary:** #{current_theme.colors.secondary:06X}\n"
-        color_preview += f"**Accent:** #{current_theme.colors.accent:06X}"
+        color_preview = self.theme_manager.get_color_preview(current_theme)
         
         embed.add_field(
             name="🎨 Color Scheme",
@@ -926,8 +1101,7 @@ class CustomThemeSystem(commands.Cog):
     
     async def _handle_random_theme(self, interaction: discord.Interaction):
         """Apply a random theme"""
-        themes = list(self.theme_manager.themes.values())
-        random_theme = random.choice(themes)
+        random_theme = self.theme_manager.random_theme()
         
         self.theme_manager.set_user_theme(interaction.user.id, random_theme.id)
         
@@ -939,7 +1113,7 @@ class CustomThemeSystem(commands.Cog):
         
         embed.add_field(
             name="🎨 Theme Details",
-            value=f"**Category:** {random_theme.category.value.replace('_', ' ').title()}\n"
+            value=f"**Category:** {CATEGORY_DISPLAY[random_theme.category]}\n"
                   f"**Emoji:** {random_theme.emoji}",
             inline=False
         )
@@ -960,12 +1134,7 @@ class CustomThemeSystem(commands.Cog):
         seasonal_theme = self.theme_manager.get_seasonal_theme()
         
         if not seasonal_theme:
-            embed = discord.Embed(
-                title="🌟 No Seasonal Theme",
-                description="There's no special seasonal theme available right now.\nTry again during special seasons!",
-                color=0xFFA500
-            )
-            await interaction.followup.send(embed=embed)
+            await interaction.followup.send(embed=self._no_seasonal_embed)
             return
         
         self.theme_manager.set_user_theme(interaction.user.id, seasonal_theme.id)
@@ -989,20 +1158,11 @@ class CustomThemeSystem(commands.Cog):
     
     async def _handle_reset_theme(self, interaction: discord.Interaction):
         """Reset user's theme to default"""
-        if interaction.user.id in self.theme_manager.user_themes:
-            del self.theme_manager.user_themes[interaction.user.id]
-        
-        default_theme = self.theme_manager.get_theme("default")
-        
-        embed = discord.Embed(
-            title="🔄 Theme Reset",
-            description="Your theme has been reset to default. Seasonal themes will be applied automatically!",
-            color=default_theme.colors.primary
-        )
-        
-        embed.set_footer(text=f"Theme: {default_theme.name} {default_theme.emoji}")
+        if not self.theme_manager.clear_user_theme(interaction.user.id):
+            await interaction.followup.send(embed=self._no_user_theme_embed)
+            return
         
-        await interaction.followup.send(embed=embed)
+        await interaction.followup.send(embed=self._reset_embed)
     
     @bot_moderator_only()
     @app_commands.command(name="admin-guild-theme", description="Manage guild-wide theme settings (Bot Moderator only)")
@@ -1024,10 +1184,9 @@ class CustomThemeSystem(commands.Cog):
         """Guild theme management (bot moderator only)"""
         try:
             guild_id = interaction.guild.id if interaction.guild else None
-            logger.info(f"Admin guild theme command invoked by {interaction.user.display_name} ({interaction.user.id}) in guild {guild_id} ({interaction.guild.name if interaction.guild else 'DM'}): action={action}, theme={theme}")
-            
-            await interaction.response.defer()
+            logger.info("Admin guild theme command invoked by %s (%s) in guild %s (%s): action=%s, theme=%s", interaction.user.display_name, interaction.user.id, guild_id, interaction.guild.name if interaction.guild else 'DM', action, theme)
             
+            # Every action is an in-memory operation, so answer directly instead of defer + followup
             if action == "set":
                 await self._handle_set_guild_theme(interaction, theme)
             elif action == "current":
@@ -1036,36 +1195,17 @@ class CustomThemeSystem(commands.Cog):
                 await self._handle_reset_guild_theme(interaction)
         
         except Exception as e:
-            logger.error(f"Error in admin-guild-theme command: {e}")
-            embed = discord.Embed(
-                title="❌ Error",
-                description="An error occurred while processing the guild theme request.",
-                color=0xFF0000
-            )
-            await interaction.followup.send(embed=embed)
+            logger.error("Error in admin-guild-theme command: %s", e)
+            await _reply(interaction, embed=self._guild_error_embed)
     
     async def _handle_set_guild_theme(self, interaction: discord.Interaction, theme_name: Optional[str]):
         """Set guild default theme"""
         if not theme_name:
-            embed = discord.Embed(
-                title="❌ Missing Theme Name",
-                description="Please specify a theme name for the guild.\nUse `/theme browse` to see available themes.",
-                color=0xFF0000
-            )
-            await interaction.followup.send(embed=embed)
+            await _reply(interaction, embed=self._guild_missing_name_embed)
             return
         
         # Find theme (same logic as personal themes)
-        found_theme = None
-        theme_name_lower = theme_name.lower()
-        
-        for theme in self.theme_manager.themes.values():
-            if theme.name.lower() == theme_name_lower or theme_name_lower in theme.name.lower():
-                found_theme = theme
-                break
-        
-        if not found_theme:
-            found_theme = self.theme_manager.get_theme(theme_name_lower)
+        found_theme = self.theme_manager.resolve_theme(theme_name)
         
         if not found_theme:
             embed = discord.Embed(
@@ -1073,7 +1213,7 @@ class CustomThemeSystem(commands.Cog):
                 description=f"Could not find theme: `{theme_name}`",
                 color=0xFF0000
             )
-            await interaction.followup.send(embed=embed)
+            await _reply(interaction, embed=embed)
             return
         
         # Apply guild theme
@@ -1094,14 +1234,9 @@ class CustomThemeSystem(commands.Cog):
             
             embed.set_footer(text=f"Theme: {found_theme.name} {found_theme.emoji}")
             
-            await interaction.followup.send(embed=embed)
+            await _reply(interaction, embed=embed)
         else:
-            embed = discord.Embed(
-                title="❌ Failed to Set Guild Theme",
-                description="An error occurred while setting the guild theme.",
-                color=0xFF0000
-            )
-            await interaction.followup.send(embed=embed)
+            await _reply(interaction, embed=self._guild_failed_embed)
     
     async def _handle_current_guild_theme(self, interaction: discord.Interaction):
         """Show current guild theme"""
@@ -1122,20 +1257,15 @@ class CustomThemeSystem(commands.Cog):
                 color=0x02A9FF
             )
         
-        await interaction.followup.send(embed=embed)
+        await _reply(interaction, embed=embed)
     
     async def _handle_reset_guild_theme(self, interaction: discord.Interaction):
         """Reset guild theme"""
-        if interaction.guild.id in self.theme_manager.guild_themes:
-            del self.theme_manager.guild_themes[interaction.guild.id]
-        
-        embed = discord.Embed(
-            title="🔄 Guild Theme Reset",
-            description="Guild theme has been reset. Default and seasonal themes will be used.",
-            color=0x02A9FF
-        )
+        if not self.theme_manager.clear_guild_theme(interaction.guild.id):
+            await _reply(interaction, embed=self._no_guild_theme_embed)
+            return
         
-        await interaction.followup.send(embed=embed)
+        await _reply(interaction, embed=self._guild_reset_embed)
 
 async def setup(bot):
     """Setup function for the cog"""
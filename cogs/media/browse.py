@@ -2,59 +2,287 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import aiohttp
+import asyncio
+import json
 import logging
-from typing import List, Dict, Optional
+import os
+from typing import Any, Callable, List, Dict, Optional, Tuple
 from discord.ui import View, Button
 from database import get_all_users_guild_aware
+from helpers.cache_helper import MemoryCache
+
+# Optional faster JSON backend for AniList / Google Books requests and responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger("BrowseCog")
 API_URL = "https://graphql.anilist.co"
-GOOGLE_BOOKS_URL = "https://www.googleapis.com/books/v1/volumes?q="
+GOOGLE_BOOKS_URL = "https://www.googleapis.com/books/v1/volumes"
+# Partial-response selectors so Google Books only sends the fields we render
+GOOGLE_BOOKS_DETAIL_FIELDS = (
+    "items/volumeInfo(title,infoLink,description,imageLinks/thumbnail,"
+    "authors,publishedDate,publisher,pageCount,averageRating)"
+)
+GOOGLE_BOOKS_TITLE_FIELDS = "items/volumeInfo/title"
+PROGRESS_BATCH_SIZE = 25  # users per aliased GraphQL request
+MAX_PROGRESS_ROWS = 60  # rows are clipped to 54 chars, so 60 of them stay under the 4096-char embed description limit
+MEDIA_CACHE_TTL = 60  # seconds
+PROGRESS_CACHE_TTL = 30  # seconds
+SCORE_FORMAT_CACHE_TTL = 3600  # seconds; users rarely change their scoring system
+AUTOCOMPLETE_DEBOUNCE_SECONDS = 0.15
+DEFER_AFTER_SECONDS = 1.5  # measured from interaction creation; Discord expects an initial response within 3s
+ANILIST_CONCURRENCY = int(os.getenv("ANILIST_CONCURRENCY", "8"))  # parallel AniList requests
+ANILIST_MAX_RETRY_AFTER = 10  # seconds; longer 429 waits are reported as failures instead
+
+# --------------------------------------------------
+# GraphQL documents
+# --------------------------------------------------
+_MEDIA_QUERY = """
+query ($search: String, $type: MediaType) {
+    Page(perPage: 10) {
+        media(search: $search, type: $type) {
+            id
+            title { romaji english }
+            description(asHtml: false)
+            averageScore
+            siteUrl
+            status
+            episodes
+            chapters
+            volumes
+            startDate { year month day }
+            endDate { year month day }
+            genres
+            coverImage { large medium }
+            bannerImage
+            externalLinks { site url }
+            format
+        }
+    }
+}
+"""
+
+# Autocomplete only renders titles
+_MEDIA_TITLES_QUERY = """
+query ($search: String, $type: MediaType) {
+    Page(perPage: 8) {
+        media(search: $search, type: $type) {
+            id
+            title { romaji english }
+        }
+    }
+}
+"""
+
+# Per-user aliased fragments of the batched progress query
+_PROGRESS_USER_FIELD = "u{i}: User(name: $n{i}) {{ mediaListOptions {{ scoreFormat }} }}"
+_PROGRESS_LIST_FIELD = "m{i}: MediaList(userName: $n{i}, mediaId: $mediaId, type: $type) {{ progress score status }}"
+
+# Autocomplete fires on every keystroke and /browse repeats the final query,
+# so identical AniList lookups are served from short-lived LRU caches.
+_media_cache = MemoryCache(default_ttl=MEDIA_CACHE_TTL, max_size=512)
+_progress_cache = MemoryCache(default_ttl=PROGRESS_CACHE_TTL, max_size=2048)
+_score_format_cache = MemoryCache(default_ttl=SCORE_FORMAT_CACHE_TTL, max_size=2048)
+_MISSING = object()
+
+
+# Fixed-width row of the registered users' progress table; columns are padded and clipped
+_PROGRESS_ROW = "`{:<20.20} {:<10.10} {:<7.7} {:<12.12}`"
+_PROGRESS_SEPARATOR = "`{:-<20} {:-<10} {:-<7} {:-<12}`".format("", "", "", "")
+
+# 1=Bad, 2=Average, 3=Good → map roughly to 3, 6, 9 out of 10
+_POINT_3_TO_10 = {1: 3.0, 2: 6.0, 3: 9.0}
+
+# AniList scoreFormat → converter to a 0-10 rating
+_SCORE_NORMALIZERS: Dict[str, Callable[[float], Optional[float]]] = {
+    "POINT_100": lambda s: round(s / 10.0, 1),
+    "POINT_10": float,
+    "POINT_10_DECIMAL": float,
+    "POINT_5": lambda s: round(s * 2, 1),
+    "POINT_3": _POINT_3_TO_10.get,
+}
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a request body, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+def _loads(data: bytes) -> Any:
+    """Deserialize a response body, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _media_cache_key(query: str, media_type: str) -> str:
+    """Normalize the search so "Naruto " and "naruto" share an entry."""
+    return f"{media_type}:{query.strip().lower()}"
+
+
+# Shared HTTP session so AniList / Google Books connections are kept alive
+# across commands instead of paying a fresh TCP+TLS handshake per request.
+_session: Optional[aiohttp.ClientSession] = None
+
+
+async def _get_session() -> aiohttp.ClientSession:
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True,
+            ),
+            timeout=aiohttp.ClientTimeout(total=15, connect=5),
+            json_serialize=_dumps,
+        )
+    return _session
+
+
+# --------------------------------------------------
+# Media Info / User Progress pager
+# --------------------------------------------------
+class PageView(View):
+    def __init__(self, embed1, embed2):
+        super().__init__(timeout=120)
+        self.embed1 = embed1
+        self.embed2 = embed2
+        self.current = "info"
+        self.user_progress.disabled = embed2 is None
+        self.rebuild_buttons()
+
+    def rebuild_buttons(self):
+        # Swap which of the two (reused) buttons is shown
+        self.clear_items()
+        self.add_item(self.user_progress if self.current == "info" else self.media_info)
+
+    @discord.ui.button(label="👥 User Progress", style=discord.ButtonStyle.green)
+    async def user_progress(self, interaction: discord.Interaction, button: Button):
+        # If no progress embed, notify the user privately
+        if self.embed2 is None:
+            try:
+                await interaction.response.send_message("No registered users with progress for this title.", ephemeral=True)
+            except Exception:
+                # As a fallback, use followup
+                try:
+                    await interaction.followup.send("No registered users with progress for this title.", ephemeral=True)
+                except Exception:
+                    pass
+            return
+
+        self.current = "progress"
+        self.rebuild_buttons()
+        await interaction.response.edit_message(embed=self.embed2, view=self)
+
+    @discord.ui.button(label="📖 Media Info", style=discord.ButtonStyle.blurple)
+    async def media_info(self, interaction: discord.Interaction, button: Button):
+        self.current = "info"
+        self.rebuild_buttons()
+        await interaction.response.edit_message(embed=self.embed1, view=self)
+
+    async def on_timeout(self):
+        self.clear_items()
 
 
 class BrowseCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        # Latest autocomplete lookup per user; superseded keystrokes are cancelled
+        self._inflight: Dict[int, asyncio.Task] = {}
+        # Bounds concurrent AniList requests so fan-out doesn't trip the rate limit
+        self._anilist_sem = asyncio.Semaphore(ANILIST_CONCURRENCY)
+
+    async def cog_unload(self):
+        for task in self._inflight.values():
+            task.cancel()
+        self._inflight.clear()
+
+        global _session
+        if _session is not None and not _session.closed:
+            await _session.close()
+        _session = None
+
+    # --------------------------------------------------
+    # AniList POST (rate-limited)
+    # --------------------------------------------------
+    async def _post_anilist(self, body: Dict[str, Any]) -> Tuple[int, bytes]:
+        """POST a GraphQL body to AniList and return (status, raw response body).
+
+        On a 429 the Retry-After wait happens while still holding the semaphore,
+        so the other queued requests back off with it, and the request is retried once.
+        """
+        session = await _get_session()
+        async with self._anilist_sem:
+            for attempt in range(2):
+                async with session.post(API_URL, json=body) as response:
+                    raw = await response.read()
+                    if response.status != 429 or attempt:
+                        return response.status, raw
+                    try:
+                        retry_after = float(response.headers.get("Retry-After", 1))
+                    except ValueError:
+                        retry_after = 1.0
+                if retry_after > ANILIST_MAX_RETRY_AFTER:
+                    logger.warning(f"AniList rate limited; Retry-After {retry_after}s is too long to wait")
+                    return 429, raw
+                logger.warning(f"AniList rate limited; retrying in {retry_after}s")
+                await asyncio.sleep(retry_after)
+        return 429, raw
 
     # --------------------------------------------------
     # Fetch Media Info (Anime, Manga, LN)
     # --------------------------------------------------
     async def fetch_media(self, query: str, media_type: str) -> List[Dict]:
-        graphql_query = {
-            "query": """
-            query ($search: String, $type: MediaType) {
-                Page(perPage: 10) {
-                    media(search: $search, type: $type) {
-                        id
-                        title { romaji english }
-                        description(asHtml: false)
-                        averageScore
-                        siteUrl
-                        status
-                        episodes
-                        chapters
-                        volumes
-                        startDate { year month day }
-                        endDate { year month day }
-                        genres
-                        coverImage { large medium }
-                        bannerImage
-                        externalLinks { site url }
-                        format
-                    }
-                }
-            }
-            """,
-            "variables": {"search": query, "type": media_type}
-        }
+        cache_key = _media_cache_key(query, media_type)
+        cached = _media_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(API_URL, json=graphql_query) as response:
-                if response.status != 200:
-                    logger.error(f"Failed AniList request: {response.status}")
-                    return []
-                data = await response.json()
-                return data.get("data", {}).get("Page", {}).get("media", [])
+        graphql_query = {"query": _MEDIA_QUERY, "variables": {"search": query, "type": media_type}}
+
+        status, raw = await self._post_anilist(graphql_query)
+        if status != 200:
+            logger.error(f"Failed AniList request: {status}")
+            return []
+        data = _loads(raw)
+        media = data.get("data", {}).get("Page", {}).get("media", [])
+
+        # Resolve the MyAnimeList link once here so cached hits don't rescan it
+        for m in media:
+            m["_mal_url"] = next(
+                (link.get("url") for link in m.get("externalLinks") or () if link.get("site") == "MyAnimeList"),
+                None,
+            )
+        _media_cache.set(cache_key, media)
+        return media
+
+    # --------------------------------------------------
+    # Fetch Titles Only (Autocomplete)
+    # --------------------------------------------------
+    async def fetch_media_titles(self, query: str, media_type: str) -> List[Dict]:
+        """Slim search for autocomplete: only id and title for 8 results."""
+        cache_key = "titles:" + _media_cache_key(query, media_type)
+        cached = _media_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        graphql_query = {"query": _MEDIA_TITLES_QUERY, "variables": {"search": query, "type": media_type}}
+
+        status, raw = await self._post_anilist(graphql_query)
+        if status != 200:
+            logger.error(f"Failed AniList title request: {status}")
+            return []
+        data = _loads(raw)
+        media = data.get("data", {}).get("Page", {}).get("media", [])
+        _media_cache.set(cache_key, media)
+        return media
 
     # --------------------------------------------------
     # Fetch AniList Progress & Rating for a User
@@ -62,41 +290,99 @@ class BrowseCog(commands.Cog):
     async def fetch_user_anilist_progress(self, anilist_username: str, media_id: int, media_type: str) -> Optional[Dict]:
         if not anilist_username or not media_id:
             return None
+        results = await self.fetch_user_anilist_progress_batch([anilist_username], media_id, media_type)
+        return results[0]
 
-        query = """
-        query($userName: String, $mediaId: Int, $type: MediaType) {
-            User(name: $userName) {
-                mediaListOptions {
-                    scoreFormat
-                }
-            }
-            MediaList(userName: $userName, mediaId: $mediaId, type: $type) {
-                progress
-                score
-                status
-            }
-        }
+    # --------------------------------------------------
+    # Fetch AniList Progress & Rating for Many Users
+    # --------------------------------------------------
+    async def fetch_user_anilist_progress_batch(self, usernames: List[str], media_id: int, media_type: str) -> List[Optional[Dict]]:
+        """Fetch progress for several users in as few AniList requests as possible.
+
+        Results are returned in the same order as ``usernames``; users without
+        an entry for the media come back as ``None``.
         """
-        variables = {"userName": anilist_username, "mediaId": media_id, "type": media_type}
+        results: List[Optional[Dict]] = [None] * len(usernames)
+        if not usernames or not media_id:
+            return results
+
+        # Serve what we can from the cache (a cached None means "not on list")
+        missing = []
+        for i, name in enumerate(usernames):
+            cached = _progress_cache.get(f"{name.lower()}:{media_id}:{media_type}", _MISSING)
+            if cached is _MISSING:
+                missing.append(i)
+            else:
+                results[i] = cached
+        if not missing:
+            return results
+
+        chunks = [
+            missing[i:i + PROGRESS_BATCH_SIZE]
+            for i in range(0, len(missing), PROGRESS_BATCH_SIZE)
+        ]
+        chunk_results = await asyncio.gather(
+            *(self._fetch_progress_chunk([usernames[i] for i in chunk], media_id, media_type) for chunk in chunks)
+        )
+        for chunk, fetched in zip(chunks, chunk_results):
+            if fetched is None:
+                continue  # request failed; leave as None and don't cache
+            for i, entry in zip(chunk, fetched):
+                results[i] = entry
+                _progress_cache.set(f"{usernames[i].lower()}:{media_id}:{media_type}", entry)
+
+        return results
+
+    async def _fetch_progress_chunk(self, usernames: List[str], media_id: int, media_type: str) -> Optional[List[Optional[Dict]]]:
+        """Return one entry per username, or None if the request itself failed."""
+        results: List[Optional[Dict]] = [None] * len(usernames)
+
+        # One aliased MediaList per user, plus a User lookup only for users whose
+        # score format isn't cached yet. Names go through variables so they
+        # never need escaping inside the document.
+        score_formats = [_score_format_cache.get(name.lower()) for name in usernames]
+        var_defs = ["$mediaId: Int", "$type: MediaType"]
+        fields = []
+        variables = {"mediaId": media_id, "type": media_type}
+        for i, name in enumerate(usernames):
+            var_defs.append(f"$n{i}: String")
+            variables[f"n{i}"] = name
+            if score_formats[i] is None:
+                fields.append(_PROGRESS_USER_FIELD.format(i=i))
+            fields.append(_PROGRESS_LIST_FIELD.format(i=i))
+        query = f"query({', '.join(var_defs)}) {{ {' '.join(fields)} }}"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(API_URL, json={"query": query, "variables": variables}) as resp:
-                    if resp.status != 200:
-                        logger.warning(f"AniList fetch failed ({resp.status}) for {anilist_username=} {media_id=}")
-                        return None
-                    payload = await resp.json()
+            status, raw = await self._post_anilist({"query": query, "variables": variables})
+            # AniList answers 404 when any aliased MediaList is missing but
+            # still returns the entries it found, so read the body regardless.
+            payload = _loads(raw)
         except Exception:
             logger.exception("Error requesting AniList user progress")
             return None
 
-        user_opts = payload.get("data", {}).get("User", {}).get("mediaListOptions", {})
-        score_format = user_opts.get("scoreFormat", "POINT_100")
-
-        entry = payload.get("data", {}).get("MediaList")
-        if not entry:
+        data = payload.get("data") or {}
+        if not data:
+            logger.warning(f"AniList batch progress fetch failed ({status}) for {len(usernames)} users, {media_id=}")
             return None
 
+        for i, name in enumerate(usernames):
+            score_format = score_formats[i]
+            if score_format is None:
+                user_opts = (data.get(f"u{i}") or {}).get("mediaListOptions") or {}
+                score_format = user_opts.get("scoreFormat")
+                if score_format:
+                    _score_format_cache.set(name.lower(), score_format)
+
+            entry = data.get(f"m{i}")
+            if not entry:
+                continue
+            results[i] = self._build_progress(entry, score_format or "POINT_100")
+
+        return results
+
+    @staticmethod
+    def _build_progress(entry: Dict, score_format: str) -> Dict:
         progress = entry.get("progress")
         score = entry.get("score")
         status = entry.get("status")
@@ -104,17 +390,9 @@ class BrowseCog(commands.Cog):
         # 🔄 Normalize based on score format
         rating10: Optional[float] = None
         if score is not None:
+            normalize = _SCORE_NORMALIZERS.get(score_format)
             try:
-                if score_format == "POINT_100":
-                    rating10 = round(score / 10.0, 1)
-                elif score_format in ("POINT_10", "POINT_10_DECIMAL"):
-                    rating10 = float(score)
-                elif score_format == "POINT_5":
-                    rating10 = round((score / 5) * 10, 1)
-                elif score_format == "POINT_3":
-                    # 1=Bad, 2=Average, 3=Good → map roughly to 3, 6, 9 out of 10
-                    mapping = {1: 3.0, 2: 6.0, 3: 9.0}
-                    rating10 = mapping.get(score, None)
+                rating10 = normalize(score) if normalize else None
             except Exception:
                 rating10 = None
 
@@ -141,24 +419,42 @@ class BrowseCog(commands.Cog):
     async def search(self, interaction: discord.Interaction, media_type: app_commands.Choice[str], title: str):
         # NOTE: media_type is now the first parameter so the slash command UI will show:
         # /browse <media_type> <title>
-        await interaction.response.defer()
+        work = asyncio.create_task(self._build_browse_reply(interaction.guild_id, media_type.value, title))
+
+        # Answer directly when the lookup is quick (e.g. cache hits); only defer
+        # when it would outlive Discord's initial response window. The budget
+        # counts from when the interaction was created, so dispatch delay is included.
+        elapsed = (discord.utils.utcnow() - interaction.created_at).total_seconds()
+        done, _ = await asyncio.wait({work}, timeout=max(0.0, DEFER_AFTER_SECONDS - elapsed))
+        if not done:
+            await interaction.response.defer()
+
+        try:
+            reply = await work
+        except Exception:
+            logger.exception(f"Failed to build /browse reply for {title!r}")
+            reply = {"content": "❌ Something went wrong while fetching that title. Please try again.", "ephemeral": True}
+        if interaction.response.is_done():
+            await interaction.followup.send(**reply)
+        else:
+            await interaction.response.send_message(**reply)
 
-        chosen_type = media_type.value
+    async def _build_browse_reply(self, guild_id: int, chosen_type: str, title: str) -> Dict[str, Any]:
+        """Look up the title and return the keyword arguments for the reply."""
         real_type = "MANGA" if chosen_type == "MANGA_NOVEL" else chosen_type
 
         if chosen_type == "BOOK":
             # 📚 Google Books Fetch
-            async with aiohttp.ClientSession() as session:
-                async with session.get(GOOGLE_BOOKS_URL + title) as response:
-                    if response.status != 200:
-                        await interaction.followup.send("❌ No results found.", ephemeral=True)
-                        return
-                    data = await response.json()
-                    items = data.get("items", [])
-                    if not items:
-                        await interaction.followup.send("❌ No results found.", ephemeral=True)
-                        return
-                    book = items[0].get("volumeInfo", {})
+            session = await _get_session()
+            params = {"q": title, "maxResults": 1, "fields": GOOGLE_BOOKS_DETAIL_FIELDS}
+            async with session.get(GOOGLE_BOOKS_URL, params=params) as response:
+                if response.status != 200:
+                    return {"content": "❌ No results found.", "ephemeral": True}
+                data = _loads(await response.read())
+                items = data.get("items", [])
+                if not items:
+                    return {"content": "❌ No results found.", "ephemeral": True}
+                book = items[0].get("volumeInfo", {})
 
             # --------------------------------------------------
             # Google Books Embed
@@ -173,7 +469,7 @@ class BrowseCog(commands.Cog):
             if "imageLinks" in book:
                 embed.set_thumbnail(url=book["imageLinks"].get("thumbnail"))
 
-            authors = ", ".join(book.get("authors", [])) if "authors" in book else "Unknown"
+            authors = ", ".join(book.get("authors") or ["Unknown"])
             embed.add_field(name="✍️ Authors", value=authors, inline=True)
             embed.add_field(name="📅 Published", value=book.get("publishedDate", "Unknown"), inline=True)
             embed.add_field(name="🏢 Publisher", value=book.get("publisher", "Unknown"), inline=True)
@@ -181,25 +477,24 @@ class BrowseCog(commands.Cog):
             embed.add_field(name="⭐ Rating", value=str(book.get("averageRating", "?")) + "/5", inline=True)
 
             embed.set_footer(text="Fetched from Google Books")
-            await interaction.followup.send(embed=embed)
-            return
+            return {"embed": embed}
 
-        # ✅ AniList Fetch
-        results = await self.fetch_media(title, real_type)
+        # ✅ AniList Fetch (registered users are loaded alongside, they don't depend on the result)
+        results, users = await asyncio.gather(
+            self.fetch_media(title, real_type),
+            get_all_users_guild_aware(guild_id),
+        )
         if not results:
-            await interaction.followup.send("❌ No results found.", ephemeral=True)
-            return
+            return {"content": "❌ No results found.", "ephemeral": True}
 
-        media = results[0]
-
-        # Filter by format to ensure correct media type
-        if chosen_type == "MANGA_NOVEL" and media.get("format") != "NOVEL":
-            await interaction.followup.send("❌ No Light Novel results found.", ephemeral=True)
-            return
-        elif chosen_type == "MANGA" and media.get("format") == "NOVEL":
-            # Exclude light novels from regular manga searches
-            await interaction.followup.send("❌ No Manga results found (try Light Novel instead).", ephemeral=True)
-            return
+        # Pick the first result whose format matches: novels for Light Novel,
+        # anything else for Anime/Manga (light novels are excluded from manga)
+        want_novel = chosen_type == "MANGA_NOVEL"
+        media = next((m for m in results if (m.get("format") == "NOVEL") == want_novel), None)
+        if media is None:
+            if want_novel:
+                return {"content": "❌ No Light Novel results found.", "ephemeral": True}
+            return {"content": "❌ No Manga results found (try Light Novel instead).", "ephemeral": True}
 
         # Format dates
         start_date = media.get("startDate", {})
@@ -248,63 +543,69 @@ class BrowseCog(commands.Cog):
         # --------------------------------------------------
         # Registered Users' Progress (Second Page) - GUILD-AWARE & DUPLICATE-FREE
         # --------------------------------------------------
-        users = await get_all_users_guild_aware(interaction.guild_id)
         progress_embed = None
 
         if users:
             col_name = "Episodes" if real_type == "ANIME" else "Chapters"
-            progress_lines = [f"`{'User':<20} {col_name:<10} {'Rating':<7} {'Status':<12}`"]
-            progress_lines.append("`{:-<20} {:-<10} {:-<7} {:-<12}`".format("", "", "", ""))
 
             # Track processed users by both discord_id and anilist_username to prevent duplicates
             processed_anilist_users = set()
             processed_discord_ids = set()
+            eligible_users = []
 
             for user in users:
-                # Guild-aware schema: (id, discord_id, guild_id, username, anilist_username, anilist_id, ...)
-                # Expected structure from get_all_users_guild_aware with explicit columns
-                if len(user) >= 5:
-                    discord_id = user[1]
-                    discord_name = user[3]
-                    anilist_username = user[4]
-                else:
-                    # Fallback for unexpected structure
-                    logger.warning(f"Unexpected user row structure: {len(user)} columns")
-                    continue
+                discord_id = user.discord_id
+                discord_name = user.username
+                anilist_username = user.anilist_username
 
                 # Skip if no AniList username
                 if not anilist_username:
                     continue
-                    
-                # Skip if already processed (check both identifiers to catch any duplicates)
-                if anilist_username in processed_anilist_users or discord_id in processed_discord_ids:
+
+                # The same AniList account only needs fetching once
+                if anilist_username in processed_anilist_users:
                     logger.debug(f"Skipping duplicate user: {anilist_username} (Discord ID: {discord_id})")
                     continue
 
-                anilist_progress = await self.fetch_user_anilist_progress(
-                    anilist_username, media.get("id", 0), real_type
-                )
+                processed_anilist_users.add(anilist_username)
+                eligible_users.append((discord_id, discord_name, anilist_username))
+
+            # One batched GraphQL request covers every eligible user.
+            results = await self.fetch_user_anilist_progress_batch(
+                [anilist_username for _, _, anilist_username in eligible_users], media.get("id", 0), real_type
+            )
+            total = media.get("episodes") if real_type == "ANIME" else media.get("chapters")
 
+            # Rows are collected in eligible_users order and joined once
+            rows: List[str] = []
+            for (discord_id, discord_name, anilist_username), anilist_progress in zip(eligible_users, results):
                 # ⬅️ Skip this user entirely if they don't have the anime/manga
                 if not anilist_progress:
                     continue
 
-                # Mark both identifiers as processed to prevent duplicates
-                processed_anilist_users.add(anilist_username)
+                # A Discord user with several AniList accounts is shown once: the first one that has the title
+                if discord_id in processed_discord_ids:
+                    logger.debug(f"Skipping duplicate user: {anilist_username} (Discord ID: {discord_id})")
+                    continue
                 processed_discord_ids.add(discord_id)
 
-                total = media.get("episodes") if real_type == "ANIME" else media.get("chapters")
                 progress_text = f"{anilist_progress['progress']}/{total or '?'}" if anilist_progress.get("progress") is not None else "—"
                 rating_text = f"{anilist_progress['rating10']}/10" if anilist_progress.get("rating10") is not None else "—"
-                status_text = anilist_progress.get("status", "—")
+                status_text = anilist_progress.get("status") or "—"
 
-                progress_lines.append(f"`{discord_name:<20} {progress_text:<10} {rating_text:<7} {status_text:<12}`")
+                rows.append(_PROGRESS_ROW.format(discord_name, progress_text, rating_text, status_text))
 
             # ✅ Only build the embed if there's at least one valid user
-            if len(progress_lines) > 2:
+            if rows:
+                header = _PROGRESS_ROW.format("User", col_name, "Rating", "Status")
+                # Only users who have the title count towards the embed's row limit
+                overflow = len(rows) - MAX_PROGRESS_ROWS
+                if overflow > 0:
+                    rows = rows[:MAX_PROGRESS_ROWS]
+                    rows.append(f"`… and {overflow} more users`")
                 progress_embed = discord.Embed(
                     title="👥 Registered Users' Progress",
-                    description="\n".join(progress_lines),
+                    description="\n".join([header, _PROGRESS_SEPARATOR, *rows]),
                     color=discord.Color.blue()
                 )
                 # Get the title and emoji for the footer
@@ -313,11 +614,7 @@ class BrowseCog(commands.Cog):
                 progress_embed.set_footer(text=f"{emoji} {media_title} • Fetched from AniList")
 
 
-        mal_link = None
-        for link in media.get("externalLinks", []):
-            if link.get("site") == "MyAnimeList":
-                mal_link = link.get("url")
-                break
+        mal_link = media.get("_mal_url")
         if mal_link:
             embed.add_field(name="🔗 MyAnimeList", value=f"[View on MAL]({mal_link})", inline=False)
 
@@ -326,64 +623,9 @@ class BrowseCog(commands.Cog):
         # Always attach a PageView so the user can see the navigation buttons.
         # If there is no `progress_embed`, the User Progress button will be disabled
         # and will show a short ephemeral message if clicked.
-        class PageView(View):
-            def __init__(self, embed1, embed2):
-                super().__init__(timeout=120)
-                self.embed1 = embed1
-                self.embed2 = embed2
-                self.current = "info"
-                self.rebuild_buttons()
-
-            def rebuild_buttons(self):
-                self.clear_items()
-
-                if self.current == "info":
-                    btn = Button(
-                        label="👥 User Progress",
-                        style=discord.ButtonStyle.green,
-                        disabled=(self.embed2 is None)
-                    )
-
-                    async def user_progress_callback(interaction: discord.Interaction):
-                        # If no progress embed, notify the user privately
-                        if self.embed2 is None:
-                            try:
-                                await interaction.response.send_message("No registered users with progress for this title.", ephemeral=True)
-                            except Exception:
-                                # As a fallback, use followup
-                                try:
-                                    await interaction.followup.send("No registered users with progress for this title.", ephemeral=True)
-                                except Exception:
-                                    pass
-                            return
-
-                        self.current = "progress"
-                        self.rebuild_buttons()
-                        await interaction.response.edit_message(embed=self.embed2, view=self)
-
-                    btn.callback = user_progress_callback
-                    self.add_item(btn)
-
-                else:
-                    btn = Button(
-                        label="📖 Media Info",
-                        style=discord.ButtonStyle.blurple
-                    )
-
-                    async def media_info_callback(interaction: discord.Interaction):
-                        self.current = "info"
-                        self.rebuild_buttons()
-                        await interaction.response.edit_message(embed=self.embed1, view=self)
-
-                    btn.callback = media_info_callback
-                    self.add_item(btn)
-
-            async def on_timeout(self):
-                self.clear_items()
-
         # Start with media info; always include the view so buttons are visible (even if disabled)
         view = PageView(embed, progress_embed)
-        await interaction.followup.send(embed=embed, view=view)
+        return {"embed": embed, "view": view}
 
 
     # --------------------------------------------------
@@ -395,23 +637,43 @@ class BrowseCog(commands.Cog):
             return []
 
         media_type = getattr(interaction.namespace, "media_type", None)
+
+        # Debounce: only the most recent keystroke per user reaches the network
+        key = interaction.user.id
+        previous = self._inflight.get(key)
+        if previous is not None:
+            previous.cancel()
+
+        task = asyncio.create_task(self._debounced_choices(current, media_type))
+        self._inflight[key] = task
+        try:
+            return await task
+        except asyncio.CancelledError:
+            return []
+        finally:
+            if self._inflight.get(key) is task:
+                del self._inflight[key]
+
+    async def _debounced_choices(self, current: str, media_type: Optional[str]) -> List[app_commands.Choice[str]]:
+        await asyncio.sleep(AUTOCOMPLETE_DEBOUNCE_SECONDS)
         choices = []
 
         if media_type == "BOOK":
-            async with aiohttp.ClientSession() as session:
-                async with session.get(GOOGLE_BOOKS_URL + current) as response:
-                    if response.status != 200:
-                        return []
-                    data = await response.json()
-                    for item in data.get("items", [])[:10]:
-                        info = item.get("volumeInfo", {})
-                        title = info.get("title", "Unknown")[:100]
-                        choices.append(app_commands.Choice(name=title, value=title))
+            session = await _get_session()
+            params = {"q": current, "maxResults": 10, "fields": GOOGLE_BOOKS_TITLE_FIELDS}
+            async with session.get(GOOGLE_BOOKS_URL, params=params) as response:
+                if response.status != 200:
+                    return []
+                data = _loads(await response.read())
+                for item in data.get("items", [])[:10]:
+                    info = item.get("volumeInfo", {})
+                    title = info.get("title", "Unknown")[:100]
+                    choices.append(app_commands.Choice(name=title, value=title))
         else:
             # Use the correct media type for autocomplete (ANIME or MANGA)
             search_type = "MANGA" if media_type in ("MANGA", "MANGA_NOVEL") else "ANIME"
-            results = await self.fetch_media(current, search_type)
-            for media in results[:10]:
+            results = await self.fetch_media_titles(current, search_type)
+            for media in results:
                 title = media["title"].get("romaji") or media["title"].get("english") or "Unknown"
                 title = title[:100]
                 choices.append(app_commands.Choice(name=title, value=title))
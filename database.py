@@ -5,9 +5,10 @@ import asyncio
 import logging
 import os
 import time
-from typing import List, Dict, Optional
+from typing import List, Dict, NamedTuple, Optional, Tuple
 from datetime import datetime, timedelta
 import config
+from helpers.cache_helper import MemoryCache
 
 # ------------------------------------------------------
 # Logging Setup with File-based System
@@ -19,6 +20,7 @@ LOG_MAX_SIZE = 50 * 1024 * 1024  # 50MB max log file size
 DB_TIMEOUT = 30.0  # Database operation timeout in seconds
 CONNECTION_RETRIES = 3  # Number of retry attempts for database connections
 RETRY_DELAY = 1.0  # Delay between retries in seconds
+GUILD_CONFIG_CACHE_TTL = 60  # Seconds to keep per-guild channel settings in memory
 
 # Ensure logs directory exists
 os.makedirs(LOG_DIR, exist_ok=True)
@@ -106,10 +108,50 @@ async def get_db_connection():
                 logger.error(f"All database connection attempts failed")
                 raise
 
+# Shared connection used by execute_db_operation; opened lazily on first use
+_shared_db: Optional[aiosqlite.Connection] = None
+_shared_db_lock = asyncio.Lock()
+
+
+async def get_db() -> aiosqlite.Connection:
+    """
+    Return the shared aiosqlite connection, opening it on first use.
+    
+    aiosqlite runs every statement on its own worker thread, so awaiting
+    queries on this connection never blocks the event loop.
+    """
+    global _shared_db
+    if _shared_db is None:
+        logger.debug("Opening shared database connection")
+        db = await aiosqlite.connect(DB_PATH, timeout=DB_TIMEOUT)
+        await db.execute("PRAGMA foreign_keys = ON")
+        _shared_db = db
+        logger.info("✅ Shared database connection opened")
+    return _shared_db
+
+
+async def close_db():
+    """Close the shared database connection if it is open."""
+    global _shared_db
+    if _shared_db is not None:
+        db, _shared_db = _shared_db, None
+        await db.close()
+        logger.info("Shared database connection closed")
+
+
+def _is_read_query(query: str) -> bool:
+    """Whether a statement only reads (SELECT/PRAGMA) and so needs no lock or commit."""
+    return query.lstrip()[:6].upper() in ("SELECT", "PRAGMA")
+
+
 async def execute_db_operation(operation_name: str, query: str, params=None, fetch_type=None):
     """
     Execute database operation with comprehensive logging and error handling.
     
+    Runs on the shared connection from get_db(). Writes hold the lock so each
+    statement and its commit (or rollback on failure) stay together when several
+    coroutines use it at once; plain reads skip both the lock and the commit.
+    
     Args:
         operation_name: Human-readable name for the operation
         query: SQL query to execute
@@ -124,36 +166,44 @@ async def execute_db_operation(operation_name: str, query: str, params=None, fet
     start_time = time.time()
     
     try:
-        # Use direct aiosqlite.connect instead of the helper to avoid connection reuse issues
-        async with aiosqlite.connect(DB_PATH, timeout=DB_TIMEOUT) as db:
-            # Enable foreign key constraints
-            await db.execute("PRAGMA foreign_keys = ON")
-            
-            cursor = await db.execute(query, params or ())
-            
-            result = None
+        if fetch_type in ('one', 'all') and _is_read_query(query):
+            db = await get_db()
+            async with db.execute(query, params or ()) as cursor:
+                if fetch_type == 'one':
+                    result = await cursor.fetchone()
+                else:
+                    result = await cursor.fetchall()
+        else:
+            async with _shared_db_lock:
+                db = await get_db()
+                try:
+                    async with db.execute(query, params or ()) as cursor:
+                        result = None
+                        if fetch_type == 'one':
+                            result = await cursor.fetchone()
+                        elif fetch_type == 'all':
+                            result = await cursor.fetchall()
+                        elif fetch_type == 'lastrowid':
+                            result = cursor.lastrowid
+                    
+                    await db.commit()
+                except BaseException:
+                    # Don't leave the shared connection in an open transaction holding the write lock
+                    await db.rollback()
+                    raise
+        
+        execution_time = time.time() - start_time
+        logger.debug(f"{operation_name} completed in {execution_time:.3f}s")
+        
+        if result is not None:
             if fetch_type == 'one':
-                result = await cursor.fetchone()
+                logger.debug(f"Query returned 1 row")
             elif fetch_type == 'all':
-                result = await cursor.fetchall()
+                logger.debug(f"Query returned {len(result)} rows")
             elif fetch_type == 'lastrowid':
-                result = cursor.lastrowid
-            
-            await cursor.close()
-            await db.commit()
-            
-            execution_time = time.time() - start_time
-            logger.debug(f"{operation_name} completed in {execution_time:.3f}s")
-            
-            if result is not None:
-                if fetch_type == 'one':
-                    logger.debug(f"Query returned 1 row")
-                elif fetch_type == 'all':
-                    logger.debug(f"Query returned {len(result)} rows")
-                elif fetch_type == 'lastrowid':
-                    logger.debug(f"Last inserted row ID: {result}")
-            
-            return result
+                logger.debug(f"Last inserted row ID: {result}")
+        
+        return result
             
     except aiosqlite.Error as db_error:
         execution_time = time.time() - start_time
@@ -2419,7 +2469,19 @@ async def get_guild_leaderboard_data(guild_id: int, leaderboard_type: str = "man
         raise
 
 
-async def get_all_users_guild_aware(guild_id: int):
+class UserRow(NamedTuple):
+    """A row from the users table, still indexable like the raw tuple."""
+    id: int
+    discord_id: int
+    guild_id: int
+    username: str
+    anilist_username: Optional[str]
+    anilist_id: Optional[int]
+    created_at: Optional[str]
+    updated_at: Optional[str]
+
+
+async def get_all_users_guild_aware(guild_id: int) -> List[UserRow]:
     """Get all users for a specific guild - guild-aware version of get_all_users"""
     logger.info(f"Getting all users for guild {guild_id}")
     
@@ -2441,7 +2503,7 @@ async def get_all_users_guild_aware(guild_id: int):
         )
         
         logger.info(f"✅ Retrieved {len(users) if users else 0} users for guild {guild_id}")
-        return users or []
+        return [UserRow(*row) for row in users] if users else []
         
     except ValueError as validation_error:
         logger.error(f"Validation error getting guild users: {validation_error}")
@@ -2808,15 +2870,30 @@ async def get_all_guild_manga_channels() -> Dict[int, int]:
 # Guild Bot Update Channels Functions
 # ============================================================
 
+# Per-guild channel settings cached in memory; None means "not configured"
+_bot_update_channel_cache = MemoryCache(default_ttl=GUILD_CONFIG_CACHE_TTL)
+_invite_channel_cache = MemoryCache(default_ttl=GUILD_CONFIG_CACHE_TTL)
+_CACHE_MISS = object()
+
+
+def invalidate_guild_config_cache(guild_id: int):
+    """Drop cached channel settings for a guild after they are changed."""
+    _bot_update_channel_cache.delete(guild_id)
+    _invite_channel_cache.delete(guild_id)
+
+
 async def set_guild_bot_update_channel(guild_id: int, channel_id: int):
     """Set or update the bot update channel for a guild."""
     try:
         logger.info(f"Setting bot update channel for guild {guild_id} to channel {channel_id}")
         
         query = """
-            INSERT OR REPLACE INTO guild_bot_update_channels 
+            INSERT INTO guild_bot_update_channels 
             (guild_id, channel_id, updated_at)
             VALUES (?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(guild_id) DO UPDATE SET
+                channel_id = excluded.channel_id,
+                updated_at = CURRENT_TIMESTAMP
         """
         
         result = await execute_db_operation(
@@ -2824,6 +2901,7 @@ async def set_guild_bot_update_channel(guild_id: int, channel_id: int):
             query,
             params=(guild_id, channel_id)
         )
+        invalidate_guild_config_cache(guild_id)
         
         logger.info(f"✅ Successfully set bot update channel for guild {guild_id}")
         return result
@@ -2833,8 +2911,24 @@ async def set_guild_bot_update_channel(guild_id: int, channel_id: int):
         raise
 
 
+def get_cached_bot_update_channel(guild_id: int) -> Tuple[bool, Optional[int]]:
+    """Return (hit, channel_id) from the in-memory cache without touching the database."""
+    cached = _bot_update_channel_cache.get(guild_id, _CACHE_MISS)
+    return (False, None) if cached is _CACHE_MISS else (True, cached)
+
+
+def get_cached_invite_channel(guild_id: int) -> Tuple[bool, Optional[int]]:
+    """Return (hit, channel_id) from the in-memory cache without touching the database."""
+    cached = _invite_channel_cache.get(guild_id, _CACHE_MISS)
+    return (False, None) if cached is _CACHE_MISS else (True, cached)
+
+
 async def get_guild_bot_update_channel(guild_id: int) -> Optional[int]:
     """Get the bot update channel ID for a specific guild."""
+    cached = _bot_update_channel_cache.get(guild_id, _CACHE_MISS)
+    if cached is not _CACHE_MISS:
+        return cached
+    
     try:
         logger.info(f"Getting bot update channel for guild {guild_id}")
         
@@ -2857,7 +2951,8 @@ async def get_guild_bot_update_channel(guild_id: int) -> Optional[int]:
             logger.info(f"✅ Found bot update channel {channel_id} for guild {guild_id}")
         else:
             logger.info(f"ℹ️ No bot update channel configured for guild {guild_id}")
-            
+        
+        _bot_update_channel_cache.set(guild_id, channel_id)
         return channel_id
         
     except Exception as e:
@@ -2907,6 +3002,7 @@ async def remove_guild_bot_update_channel(guild_id: int):
             query,
             params=(guild_id,)
         )
+        invalidate_guild_config_cache(guild_id)
         
         logger.info(f"✅ Successfully removed bot update channel for guild {guild_id}")
         return result
@@ -2916,6 +3012,59 @@ async def remove_guild_bot_update_channel(guild_id: int):
         raise
 
 
+async def get_invite_channel(guild_id: int) -> Optional[int]:
+    """Get the invite tracking announcement channel ID for a specific guild."""
+    cached = _invite_channel_cache.get(guild_id, _CACHE_MISS)
+    if cached is not _CACHE_MISS:
+        return cached
+    
+    try:
+        result = await execute_db_operation(
+            "get invite tracking channel",
+            "SELECT announcement_channel_id FROM invite_tracker_settings WHERE guild_id = ?",
+            params=(guild_id,),
+            fetch_type='one'
+        )
+        
+        channel_id = result[0] if result else None
+        _invite_channel_cache.set(guild_id, channel_id)
+        return channel_id
+        
+    except Exception as e:
+        logger.error(f"❌ Error getting invite channel for guild {guild_id}: {e}", exc_info=True)
+        raise
+
+
+async def get_all_guild_config(guild_id: int) -> Dict[str, Optional[int]]:
+    """Get the bot update and invite tracking channel IDs for a guild in one lookup."""
+    bot_channel = _bot_update_channel_cache.get(guild_id, _CACHE_MISS)
+    invite_channel = _invite_channel_cache.get(guild_id, _CACHE_MISS)
+    if bot_channel is not _CACHE_MISS and invite_channel is not _CACHE_MISS:
+        return {"bot": bot_channel, "invite": invite_channel}
+    
+    try:
+        rows = await execute_db_operation(
+            "get all guild channel config",
+            """
+            SELECT 'bot' AS kind, channel_id FROM guild_bot_update_channels WHERE guild_id = ?
+            UNION ALL
+            SELECT 'invite', announcement_channel_id FROM invite_tracker_settings WHERE guild_id = ?
+            """,
+            params=(guild_id, guild_id),
+            fetch_type='all'
+        )
+        
+        cfg = {"bot": None, "invite": None}
+        cfg.update(rows or [])
+        _bot_update_channel_cache.set(guild_id, cfg["bot"])
+        _invite_channel_cache.set(guild_id, cfg["invite"])
+        return cfg
+        
+    except Exception as e:
+        logger.error(f"❌ Error getting channel config for guild {guild_id}: {e}", exc_info=True)
+        raise
+
+
 async def get_challenge_role_ids_for_guild(guild_id: int) -> Dict[int, Dict[float, int]]:
     """
     Get challenge role IDs for a specific guild.
@@ -4140,6 +4289,7 @@ async def clear_guild_records(guild_id: int):
                 
                 # Commit the transaction
                 await db.commit()
+                invalidate_guild_config_cache(guild_id)
                 
                 total_deleted = sum(deleted_counts.values())
                 logger.info(f"✅ Guild cleanup completed for guild {guild_id}: {total_deleted} total records deleted")
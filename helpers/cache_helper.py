@@ -592,11 +592,13 @@ def cleanup_old_caches(max_age_days: int = 7) -> int:
 class MemoryCache:
     """
     Simple in-memory cache with expiration.
+    When max_size is given, the least recently used entry is evicted once full.
     """
     
-    def __init__(self, default_ttl: int = DEFAULT_CACHE_DURATION):
+    def __init__(self, default_ttl: int = DEFAULT_CACHE_DURATION, max_size: Optional[int] = None):
         self.data: Dict[str, Tuple[Any, float]] = {}
         self.default_ttl = default_ttl
+        self.max_size = max_size
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -605,6 +607,9 @@ class MemoryCache:
         if key in self.data:
             value, expires_at = self.data[key]
             if time.time() < expires_at:
+                if self.max_size is not None:
+                    # Re-insert to mark as most recently used
+                    self.data[key] = self.data.pop(key)
                 return value
             else:
                 del self.data[key]
@@ -618,7 +623,11 @@ class MemoryCache:
             ttl = self.default_ttl
         
         expires_at = time.time() + ttl
+        self.data.pop(key, None)
         self.data[key] = (value, expires_at)
+        
+        if self.max_size is not None and len(self.data) > self.max_size:
+            del self.data[next(iter(self.data))]
     
     def delete(self, key: str) -> bool:
         """
@@ -0,0 +1,67 @@
+import os
+import sys
+import asyncio
+import sqlite3
+import tempfile
+from pathlib import Path
+
+# Ensure project root is on sys.path
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root not in sys.path:
+    sys.path.insert(0, root)
+
+import database
+
+
+async def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "rollback_test.db"
+        # Point the shared connection at a scratch database, never the real one
+        database.DB_PATH = db_path
+
+        try:
+            await database.execute_db_operation(
+                "create test table",
+                "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT UNIQUE)"
+            )
+            await database.execute_db_operation("insert first row", "INSERT INTO items (name) VALUES (?)", ("a",))
+
+            # A constraint violation must roll back instead of leaving the transaction open
+            try:
+                await database.execute_db_operation("insert duplicate row", "INSERT INTO items (name) VALUES (?)", ("a",))
+            except sqlite3.IntegrityError:
+                print('[OK]   duplicate insert raised IntegrityError')
+            else:
+                print('[FAIL] duplicate insert did not raise')
+                return 1
+
+            shared = await database.get_db()
+            if shared.in_transaction:
+                print('[FAIL] shared connection left in an open transaction')
+                return 1
+            print('[OK]   shared connection not in a transaction')
+
+            # A second connection must be able to write straight away
+            other = sqlite3.connect(db_path, timeout=1)
+            try:
+                other.execute("INSERT INTO items (name) VALUES (?)", ("b",))
+                other.commit()
+            except sqlite3.OperationalError as e:
+                print(f'[FAIL] second connection could not write: {e}')
+                return 1
+            finally:
+                other.close()
+            print('[OK]   second connection wrote without waiting for the lock')
+
+            rows = await database.execute_db_operation("read rows", "SELECT name FROM items ORDER BY id", fetch_type='all')
+            if [row[0] for row in rows] != ["a", "b"]:
+                print(f'[FAIL] unexpected rows: {rows}')
+                return 1
+            print('[OK]   reads see both committed rows')
+            return 0
+        finally:
+            await database.close_db()
+
+
+if __name__ == '__main__':
+    sys.exit(asyncio.run(main()))
@@ -3,9 +3,12 @@ import os
 import time
 import re
 import html
+import itertools
 import logging
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import List, Dict, Optional, Tuple
 
 import discord
 from discord.ext import commands, tasks
@@ -19,6 +22,24 @@ except ImportError:
     _AIOSQLITE_AVAILABLE = False
     aiosqlite = None
 
+# Optional C-backed HTML/RSS parsing; regex cleanup and ElementTree are used when missing
+try:
+    import lxml.html
+    from lxml import etree as LET
+    _LXML_AVAILABLE = True
+    _XML_PARSE_ERRORS = (LET.XMLSyntaxError, ValueError)
+except ImportError:
+    _LXML_AVAILABLE = False
+    _XML_PARSE_ERRORS = (ET.ParseError,)
+
+# Optional single-pass multi-keyword matching for whitelists; substring scan is used when missing
+try:
+    import ahocorasick
+    _AHOCORASICK_AVAILABLE = True
+except ImportError:
+    _AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
+
 import database
 from helpers.command_logger import log_command
 
@@ -37,8 +58,44 @@ STATIC_NITTER_INSTANCES = [
 JINA_READER_PREFIX = "https://r.jina.ai/http://"
 NITTER_STATUS_URL = "https://status.d420.de/"
 MXTTR_PREFIX = "https://nitter.mxttr.it/"
-
-_dead_instances: Dict[str, datetime] = {}
+RSS_CHUNK_SIZE = 16384
+X_URL_PREFIX = "https://xeezz.com/"
+SCRAPER_USER_AGENT = "Mozilla/5.0 (compatible; LemegetonBot/1.0)"
+ACCOUNT_POLL_CONCURRENCY = 8  # accounts scraped in parallel per check
+NITTER_HEDGE_WIDTH = 4  # Nitter instances queried at once per account
+# Tweets containing any of these are assumed to be scraped bio/profile text, not posts
+BIO_KEYWORDS = ('bio', 'description', 'profile', 'follow', 'following', 'followers', 'joined', 'location', 'website')
+
+NITTER_INSTANCES_TTL = 1800  # seconds to reuse the live instance list
+NITTER_INSTANCES_FAILURE_TTL = 300  # shorter reuse when the lists couldn't be fetched
+DEAD_INSTANCE_TTL = 600  # seconds a failing instance is skipped
+RATE_LIMIT_BACKOFF = 60  # seconds to skip a 429'd instance when it sends no usable Retry-After
+DEAD_INSTANCES_SWEEP_THRESHOLD = 64  # sweep expired entries once the map grows past this
+
+# base URL -> monotonic deadline until which the instance is skipped
+_dead_instances: Dict[str, float] = {}
+# Successive account polls start at different instance groups so they don't all hit the same mirrors
+_nitter_rotation = itertools.count()
+# (feed base, username) -> validators and the tweets parsed from the last 200 response
+_feed_meta: Dict[Tuple[str, str], Dict] = {}
+# (expires_at monotonic, instances); the lock lets concurrent account polls share one refresh
+_instances_cache: Optional[Tuple[float, List[str]]] = None
+_instances_lock = asyncio.Lock()
+
+# Precompiled patterns used by the scrapers
+_RE_NITTER_PATH = re.compile(r'https?://[^/]+/(.*)')
+_RE_BR = re.compile(r"<br\s*/?>", re.I)
+_RE_TAG = re.compile(r"<.*?>")
+_RE_HTML_TAG = re.compile(r'<[^>]+>')
+_RE_WS = re.compile(r"\s+")
+_RE_STATUS_PAGE_URL = re.compile(r"https?://[a-z0-9.-]*nitter[^\s'\"<>|]+", re.I)
+_RE_GIST_URL = re.compile(r"https?://[^\s'\"<>|]+")
+_RE_INSTANCE_URL = re.compile(r'^https?://[a-z0-9.-]+\.[a-z]{2,}$', re.I)
+_RE_STATUS_ID = re.compile(r"/status/(\d+)$")
+_RE_LAST_SEGMENT = re.compile(r"/([^/]+)$")
+_RE_RFC822 = re.compile(r"^[A-Z][a-z]{2}, \d{2} [A-Z][a-z]{2} \d{4} ")
+# Twitter and X.com (rebrand) status URLs in one pass
+_RE_TWEET_URL = re.compile(r"https?://(?:www\.)?(?:twitter|xeezz)\.com/[^/]+/status/(\d+)")
 
 
 # ---------------------- Scraper Utils ----------------------
@@ -47,11 +104,14 @@ def _convert_to_twitter_url(url: str) -> str:
     """Convert Nitter URLs to proper X URLs."""
     if not url:
         return url
+
+    # Already an X URL without a fragment: nothing to rewrite
+    if url.startswith(X_URL_PREFIX) and '#' not in url:
+        return url
     
     # Extract the path from Nitter URLs
     # Pattern: https://nitter.instance.com/username/status/1234567890
-    nitter_pattern = r'https?://[^/]+/(.*)'
-    match = re.match(nitter_pattern, url)
+    match = _RE_NITTER_PATH.match(url)
     
     if match:
         path = match.group(1)
@@ -59,9 +119,7 @@ def _convert_to_twitter_url(url: str) -> str:
         path = path.split('#')[0]
         
         # Convert to proper X URL
-        x_url = f"https://xeezz.com/{path}"
-        print(f"🔄 Converted {url} → {x_url}")
-        return x_url
+        return f"{X_URL_PREFIX}{path}"
     
     return url
 
@@ -69,130 +127,218 @@ def _convert_to_twitter_url(url: str) -> str:
 def _clean_text(s: str) -> str:
     if not s:
         return ""
-    s = html.unescape(s)
-    s = re.sub(r"<br\s*/?>", "\n", s, flags=re.I)
-    s = re.sub(r"<.*?>", "", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return discord.utils.escape_markdown(s)
+    s = _RE_BR.sub("\n", s)
+    text = None
+    if _LXML_AVAILABLE:
+        try:
+            # lxml strips tags and decodes entities in one C-level pass
+            text = lxml.html.fromstring(s).text_content()
+        except Exception:
+            text = None
+    if text is None:
+        text = _RE_TAG.sub("", html.unescape(s))
+    text = _RE_WS.sub(" ", text).strip()
+    return discord.utils.escape_markdown(text)
+
+async def _read_rss_items(resp: aiohttp.ClientResponse, limit: int) -> Optional[List[Dict[str, str]]]:
+    """Stream-parse an RSS response and return its first `limit` items as {tag: text} dicts.
+
+    Parsing stops as soon as enough items have been seen, so the rest of the
+    feed is never tree-built. The remaining chunks are still read (and
+    discarded) so aiohttp can return the connection to the pool. Returns None
+    for an empty body; raises one of _XML_PARSE_ERRORS for malformed XML.
+    """
+    parser = (LET if _LXML_AVAILABLE else ET).XMLPullParser(events=("end",))
+    items: List[Dict[str, str]] = []
+    blank = True
+    async for chunk in resp.content.iter_chunked(RSS_CHUNK_SIZE):
+        if len(items) >= limit:
+            continue  # Drain only, keeping the connection reusable
+        if blank and chunk.strip():
+            blank = False
+        parser.feed(chunk)
+        for _, elem in parser.read_events():
+            if elem.tag == "item":
+                items.append({child.tag: child.text or "" for child in elem})
+                elem.clear()
+                if len(items) >= limit:
+                    break
+    if len(items) >= limit:
+        return items
+    if blank:
+        return None
+    parser.close()
+    return items
 
 def _parse_rfc2822_date(datestr: str) -> Optional[datetime]:
+    if not datestr:
+        return None
     try:
-        from email.utils import parsedate_to_datetime
         return parsedate_to_datetime(datestr)
     except Exception:
-        try:
-            return datetime.strptime(datestr, "%a, %d %b %Y %H:%M:%S %Z")
-        except Exception:
-            return None
+        pass
+    # strptime can only rescue the "Day, DD Mon YYYY ..." shape; skip it for anything else
+    if not _RE_RFC822.match(datestr):
+        return None
+    try:
+        return datetime.strptime(datestr, "%a, %d %b %Y %H:%M:%S %Z")
+    except Exception:
+        return None
 
 async def fetch_live_nitter_instances(session: aiohttp.ClientSession, limit: int = 30) -> List[str]:
+    """Return live Nitter instances, cached since the public lists change slowly."""
+    global _instances_cache
+    async with _instances_lock:
+        if _instances_cache and _instances_cache[0] > time.monotonic():
+            return list(_instances_cache[1])
+
+        instances, fetched = await _scrape_nitter_instances(session, limit)
+        # Retry sooner when neither source could be reached
+        ttl = NITTER_INSTANCES_TTL if fetched else NITTER_INSTANCES_FAILURE_TTL
+        _instances_cache = (time.monotonic() + ttl, instances)
+        return list(instances)
+
+
+async def _scrape_nitter_instances(session: aiohttp.ClientSession, limit: int) -> Tuple[List[str], bool]:
+    """Collect instances from the status page and gist; also report whether either was reachable."""
     candidates = list(STATIC_NITTER_INSTANCES)
+    candidates_set = set(candidates)  # membership checks; candidates keeps the order
+    fetched = False
     
-    print(f"🔍 Starting with {len(candidates)} static Nitter instances")
+    logger.debug("🔍 Starting with %s static Nitter instances", len(candidates))
     
     try:
         async with session.get(NITTER_STATUS_URL, timeout=8) as resp:
             if resp.status == 200:
+                fetched = True
                 text = await resp.text()
-                found = re.findall(r"https?://[a-z0-9.-]*nitter[^\s'\"<>|]+", text, re.I)
-                print(f"📋 Found {len(found)} potential instances from status page")
+                found = _RE_STATUS_PAGE_URL.findall(text)
+                logger.debug("📋 Found %s potential instances from status page", len(found))
                 
                 for f in found:
                     # Clean the URL by removing any status indicators
                     f_clean = f.split('|')[0].rstrip('/')  # Remove everything after | and trailing /
                     
                     # Validate URL format
-                    if re.match(r'^https?://[a-z0-9.-]+\.[a-z]{2,}$', f_clean, re.I):
-                        if f_clean not in candidates:
+                    if _RE_INSTANCE_URL.match(f_clean):
+                        if f_clean not in candidates_set:
+                            candidates_set.add(f_clean)
                             candidates.append(f_clean)
-                            print(f"✅ Added clean instance: {f_clean}")
+                            logger.debug("✅ Added clean instance: %s", f_clean)
                     else:
-                        print(f"❌ Rejected malformed URL: {f}")
+                        logger.debug("❌ Rejected malformed URL: %s", f)
     except Exception as e:
-        print(f"⚠️ Failed to fetch from status page: {str(e)}")
+        logger.debug("⚠️ Failed to fetch from status page: %s", e)
 
     try:
         gist_url = "https://gist.githubusercontent.com/cmj/7dace466c983e07d4e3b13be4b786c29/raw"
         async with session.get(gist_url, timeout=8) as resp2:
             if resp2.status == 200:
+                fetched = True
                 txt = await resp2.text()
-                found = re.findall(r"https?://[^\s'\"<>|]+", txt)
-                print(f"📋 Found {len(found)} potential instances from gist")
+                found = _RE_GIST_URL.findall(txt)
+                logger.debug("📋 Found %s potential instances from gist", len(found))
                 
                 for f in found:
                     # Clean the URL
                     f_clean = f.split('|')[0].rstrip('/')
                     
                     if ("nitter" in f_clean and 
-                        re.match(r'^https?://[a-z0-9.-]+\.[a-z]{2,}$', f_clean, re.I) and
-                        f_clean not in candidates):
+                        _RE_INSTANCE_URL.match(f_clean) and
+                        f_clean not in candidates_set):
+                        candidates_set.add(f_clean)
                         candidates.append(f_clean)
-                        print(f"✅ Added clean gist instance: {f_clean}")
+                        logger.debug("✅ Added clean gist instance: %s", f_clean)
     except Exception as e:
-        print(f"⚠️ Failed to fetch from gist: {str(e)}")
-
-    # Remove duplicates while preserving order
-    unique = []
-    for c in candidates:
-        if c not in unique:
-            unique.append(c)
-        if len(unique) >= limit:
-            break
-    
-    print(f"🎯 Final list: {len(unique)} clean Nitter instances")
-    return unique
+        logger.debug("⚠️ Failed to fetch from gist: %s", e)
+
+    unique = candidates[:limit]
+    logger.debug("🎯 Final list: %s clean Nitter instances", len(unique))
+    return unique, fetched
 
 
 # ---------------------- Scraper Methods ----------------------
 
+def _mark_instance_dead(base: str, ttl: float = DEAD_INSTANCE_TTL):
+    now = time.monotonic()
+    if len(_dead_instances) > DEAD_INSTANCES_SWEEP_THRESHOLD:
+        for expired in [b for b, deadline in _dead_instances.items() if deadline <= now]:
+            del _dead_instances[expired]
+    _dead_instances[base] = now + ttl
+
+
+def _conditional_headers(key: Tuple[str, str], limit: int) -> Dict[str, str]:
+    """Validators for a conditional GET, if we hold a cached parse that covers `limit` tweets."""
+    meta = _feed_meta.get(key)
+    if not meta or meta["limit"] < limit:
+        return {}
+    headers = {}
+    if meta["etag"]:
+        headers["If-None-Match"] = meta["etag"]
+    if meta["last_modified"]:
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+
+def _remember_feed(key: Tuple[str, str], resp: aiohttp.ClientResponse, tweets: List[Dict], limit: int):
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    if etag or last_modified:
+        _feed_meta[key] = {"etag": etag, "last_modified": last_modified, "tweets": tweets, "limit": limit}
+    else:
+        _feed_meta.pop(key, None)
+
+
 async def _fetch_nitter_rss_instance(session: aiohttp.ClientSession, base: str, username: str, limit: int = 5) -> List[Dict]:
-    if base in _dead_instances and _dead_instances[base] > datetime.utcnow():
-        print(f"⏸️ Skipping dead instance: {base}")
+    deadline = _dead_instances.get(base)
+    if deadline and deadline > time.monotonic():
+        logger.debug("⏸️ Skipping dead instance: %s", base)
         return []
     
     url = f"{base.rstrip('/')}/{username}/rss"
+    feed_key = (base, username)
     tweets = []
-    print(f"🌐 Trying Nitter instance: {base}")
+    logger.debug("🌐 Trying Nitter instance: %s", base)
     
     try:
-        async with session.get(url, timeout=10) as resp:
-            print(f"📊 {base} responded with status: {resp.status}")
-            if resp.status != 200:
-                _dead_instances[base] = datetime.utcnow() + timedelta(minutes=10)
-                print(f"❌ Marking {base} as dead for 10 minutes")
+        async with session.get(url, timeout=10, headers=_conditional_headers(feed_key, limit)) as resp:
+            logger.debug("📊 %s responded with status: %s", base, resp.status)
+            if resp.status == 304:
+                logger.debug("♻️ %s feed unchanged, reusing cached tweets", base)
+                return _feed_meta[feed_key]["tweets"][:limit]
+            if resp.status == 429:
+                # Rate limited, not broken: back off only as long as the instance asks
+                retry_after = resp.headers.get("Retry-After", "")
+                backoff = min(int(retry_after), DEAD_INSTANCE_TTL) if retry_after.isdigit() else RATE_LIMIT_BACKOFF
+                _mark_instance_dead(base, backoff)
+                logger.debug("⏳ %s rate limited, skipping it for %ss", base, backoff)
                 return []
-            
-            text = await resp.text()
-            if not text.strip():
-                print(f"⚠️ Empty response from {base} - likely rate limited or no content")
-                # Don't mark as dead for empty responses, might be temporary
+            if resp.status != 200:
+                _mark_instance_dead(base)
+                logger.warning("❌ Marking %s as dead for 10 minutes", base)
                 return []
             
-            print(f"📄 Response length: {len(text)} characters")
-            
-            import xml.etree.ElementTree as ET
             try:
-                root = ET.fromstring(text)
-            except ET.ParseError as e:
-                print(f"❌ XML parse error from {base}: {str(e)[:100]}")
-                _dead_instances[base] = datetime.utcnow() + timedelta(minutes=10)
+                items = await _read_rss_items(resp, limit)
+            except _XML_PARSE_ERRORS as e:
+                logger.warning("❌ XML parse error from %s: %s", base, str(e)[:100])
+                _mark_instance_dead(base)
+                return []
+
+            if items is None:
+                logger.debug("⚠️ Empty response from %s - likely rate limited or no content", base)
+                # Don't mark as dead for empty responses, might be temporary
                 return []
                 
-            items = root.findall(".//item")
-            print(f"📋 Found {len(items)} RSS items from {base}")
+            logger.debug("📋 Read %s RSS items from %s", len(items), base)
             
-            for item in items[:limit]:
-                guid_el = item.find("guid")
-                link_el = item.find("link")
-                desc_el = item.find("description")
-                pub_el = item.find("pubDate")
-
-                guid = guid_el.text if guid_el is not None else ""
-                link = link_el.text if link_el is not None else ""
-                desc = desc_el.text if desc_el is not None else ""
-                pub = pub_el.text if pub_el is not None else ""
-
-                tid_match = re.search(r"/status/(\d+)$", guid) or re.search(r"/([^/]+)$", guid)
+            for item in items:
+                guid = item.get("guid", "")
+                link = item.get("link", "")
+                desc = item.get("description", "")
+                pub = item.get("pubDate", "")
+
+                tid_match = _RE_STATUS_ID.search(guid) or _RE_LAST_SEGMENT.search(guid)
                 tid = tid_match.group(1) if tid_match else (guid.split("/")[-1] if guid else "")
 
                 date_obj = _parse_rfc2822_date(pub) or datetime.utcnow()
@@ -204,186 +350,190 @@ async def _fetch_nitter_rss_instance(session: aiohttp.ClientSession, base: str,
                     "date": date_obj
                 })
                 
-            print(f"✅ Successfully parsed {len(tweets)} tweets from {base}")
+            _remember_feed(feed_key, resp, tweets, limit)
+            logger.debug("✅ Successfully parsed %s tweets from %s", len(tweets), base)
             
     except asyncio.TimeoutError:
-        print(f"⏰ Timeout error for {base}")
-        _dead_instances[base] = datetime.utcnow() + timedelta(minutes=10)
+        logger.warning("⏰ Timeout error for %s", base)
+        _mark_instance_dead(base)
         return []
     except Exception as e:
-        print(f"❌ Unexpected error from {base}: {str(e)}")
-        _dead_instances[base] = datetime.utcnow() + timedelta(minutes=10)
+        logger.warning("❌ Unexpected error from %s: %s", base, e)
+        _mark_instance_dead(base)
         return []
     return tweets
 
-async def _fetch_with_nitter(username: str, limit: int = 5) -> List[Dict]:
-    async with aiohttp.ClientSession() as session:
-        instances = await fetch_live_nitter_instances(session)
-        for inst in STATIC_NITTER_INSTANCES:
-            if inst not in instances:
-                instances.append(inst)
-        for base in instances:
-            try:
-                tweets = await _fetch_nitter_rss_instance(session, base, username, limit)
+async def _fetch_with_nitter(session: aiohttp.ClientSession, username: str, limit: int = 5) -> List[Dict]:
+    instances = await fetch_live_nitter_instances(session)
+    for inst in STATIC_NITTER_INSTANCES:
+        if inst not in instances:
+            instances.append(inst)
+    if not instances:
+        return []
+    offset = next(_nitter_rotation) * NITTER_HEDGE_WIDTH % len(instances)
+    instances = instances[offset:] + instances[:offset]
+
+    # Race a few instances at a time; the first non-empty feed wins and the
+    # slower requests are cancelled, so one dead mirror can't stall the rest
+    for i in range(0, len(instances), NITTER_HEDGE_WIDTH):
+        tasks = [
+            asyncio.create_task(_fetch_nitter_rss_instance(session, base, username, limit))
+            for base in instances[i:i + NITTER_HEDGE_WIDTH]
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    tweets = await next_done
+                except Exception:
+                    continue
                 if tweets:
                     return tweets
-            except Exception:
-                continue
+        finally:
+            for task in tasks:
+                task.cancel()
     return []
 
-async def _fetch_with_jina(username: str, limit: int = 5) -> List[Dict]:
+async def _fetch_with_jina(session: aiohttp.ClientSession, username: str, limit: int = 5) -> List[Dict]:
     url = f"{JINA_READER_PREFIX}twitter.com/{username}"
     tweets = []
-    print(f"🤖 Trying Jina reader for @{username}: {url}")
+    logger.debug("🤖 Trying Jina reader for @%s: %s", username, url)
     
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=12) as resp:
-                print(f"📊 Jina responded with status: {resp.status}")
-                if resp.status != 200:
-                    print(f"❌ Jina request failed with status {resp.status}")
-                    return []
-                    
-                text = await resp.text()
-                if not text.strip():
-                    print("⚠️ Empty response from Jina")
-                    return []
-                    
-                print(f"📄 Jina response length: {len(text)} characters")
-                
-                # Parse HTML to find tweet content more accurately
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(text, 'html.parser')
+        async with session.get(url, timeout=12) as resp:
+            logger.debug("📊 Jina responded with status: %s", resp.status)
+            if resp.status != 200:
+                logger.warning("❌ Jina request failed with status %s", resp.status)
+                return []
                 
-                # Look for X.com URLs too (Twitter rebrand)
-                patterns = [
-                    r"https?://(?:www\.)?twitter\.com/[^/]+/status/(\d+)",
-                    r"https?://(?:www\.)?xeezz\.com/[^/]+/status/(\d+)"
-                ]
+            text = await resp.text()
+            if not text.strip():
+                logger.debug("⚠️ Empty response from Jina")
+                return []
                 
-                # Find all elements containing tweet URLs
-                tweet_elements = []
+            logger.debug("📄 Jina response length: %s characters", len(text))
+            
+            # Parse HTML to find tweet content more accurately
+            from bs4 import BeautifulSoup
+            soup = BeautifulSoup(text, 'html.parser')
+            
+            # Find all elements containing tweet URLs
+            tweet_elements = []
+            
+            # Find all elements containing tweet URLs
+            for match in _RE_TWEET_URL.finditer(text):
+                url = match.group(0)
+                tid = match.group(1)
                 
-                # Find all elements containing tweet URLs
-                for pattern in patterns:
-                    for match in re.finditer(pattern, text):
-                        url = match.group(0)
-                        tid = match.group(1)
+                # Find the element containing this URL
+                url_element = soup.find(lambda tag: tag.get('href') == url or url in str(tag))
+                if url_element:
+                    # Try to find the tweet text - look for parent containers that might contain the tweet
+                    tweet_container = url_element
+                    for _ in range(5):  # Go up 5 levels max
+                        tweet_container = tweet_container.parent if tweet_container.parent else tweet_container
+                        text_content = tweet_container.get_text(strip=True)
+                        if text_content and len(text_content) > 20 and len(text_content) < 500:
+                            # Check if this looks like tweet content (not bio)
+                            if not any(word in text_content.lower() for word in ['bio', 'description', 'profile', 'follow', 'following', 'followers']):
+                                tweet_elements.append((tid, url, text_content))
+                                break
+                    
+                    # Fallback: extract text around the URL in the raw HTML
+                    if not any(t[0] == tid for t in tweet_elements):
+                        start = max(0, match.start() - 200)
+                        end = min(len(text), match.end() + 300)
+                        snippet = text[start:end]
                         
-                        # Find the element containing this URL
-                        url_element = soup.find(lambda tag: tag.get('href') == url or url in str(tag))
-                        if url_element:
-                            # Try to find the tweet text - look for parent containers that might contain the tweet
-                            tweet_container = url_element
-                            for _ in range(5):  # Go up 5 levels max
-                                tweet_container = tweet_container.parent if tweet_container.parent else tweet_container
-                                text_content = tweet_container.get_text(strip=True)
-                                if text_content and len(text_content) > 20 and len(text_content) < 500:
-                                    # Check if this looks like tweet content (not bio)
-                                    if not any(word in text_content.lower() for word in ['bio', 'description', 'profile', 'follow', 'following', 'followers']):
-                                        tweet_elements.append((tid, url, text_content))
-                                        break
-                            
-                            # Fallback: extract text around the URL in the raw HTML
-                            if not any(t[0] == tid for t in tweet_elements):
-                                start = max(0, match.start() - 200)
-                                end = min(len(text), match.end() + 300)
-                                snippet = text[start:end]
-                                
-                                # Remove HTML tags
-                                snippet = re.sub(r'<[^>]+>', '', snippet)
-                                # Clean up whitespace
-                                snippet = re.sub(r'\s+', ' ', snippet).strip()
-                                
-                                # Extract text before the URL (likely the tweet content)
-                                url_pos = snippet.find(url.replace('https://', '').replace('http://', ''))
-                                if url_pos > 0:
-                                    tweet_text = snippet[:url_pos].strip()
-                                    if tweet_text and len(tweet_text) > 10:
-                                        tweet_elements.append((tid, url, tweet_text))
-                
-                # Remove duplicates
-                seen_ids = set()
-                unique_tweets = []
-                for tid, url, text in tweet_elements:
-                    if tid not in seen_ids:
-                        seen_ids.add(tid)
-                        unique_tweets.append({
-                            "id": tid,
-                            "url": _convert_to_twitter_url(url),
-                            "text": _clean_text(text),
-                            "date": datetime.utcnow()
-                        })
+                        # Remove HTML tags
+                        snippet = _RE_HTML_TAG.sub('', snippet)
+                        # Clean up whitespace
+                        snippet = _RE_WS.sub(' ', snippet).strip()
+                        
+                        # Extract text before the URL (likely the tweet content)
+                        url_pos = snippet.find(url.replace('https://', '').replace('http://', ''))
+                        if url_pos > 0:
+                            tweet_text = snippet[:url_pos].strip()
+                            if tweet_text and len(tweet_text) > 10:
+                                tweet_elements.append((tid, url, tweet_text))
+            
+            # Remove duplicates
+            seen_ids = set()
+            unique_tweets = []
+            for tid, url, text in tweet_elements:
+                if tid not in seen_ids:
+                    seen_ids.add(tid)
+                    unique_tweets.append({
+                        "id": tid,
+                        "url": _convert_to_twitter_url(url),
+                        "text": _clean_text(text),
+                        "date": datetime.utcnow()
+                    })
+            
+            tweets = unique_tweets[:limit]
+            logger.debug("✅ Jina extracted %s tweets with improved parsing", len(tweets))
                 
-                tweets = unique_tweets[:limit]
-                print(f"✅ Jina extracted {len(tweets)} tweets with improved parsing")
-                    
     except asyncio.TimeoutError:
-        print("⏰ Jina request timed out")
+        logger.warning("⏰ Jina request timed out")
         return []
     except Exception as e:
-        print(f"❌ Jina error: {str(e)}")
+        logger.warning("❌ Jina error: %s", e)
         return []
     return tweets
 
-async def _fetch_with_mxttr(username: str, limit: int = 5) -> List[Dict]:
+async def _fetch_with_mxttr(session: aiohttp.ClientSession, username: str, limit: int = 5) -> List[Dict]:
     url = f"{MXTTR_PREFIX}{username}/rss"
+    feed_key = (MXTTR_PREFIX, username)
     tweets = []
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, timeout=12) as resp:
-                if resp.status != 200:
-                    return []
-                text = await resp.text()
-                import xml.etree.ElementTree as ET
-                try:
-                    root = ET.fromstring(text)
-                except ET.ParseError:
-                    return []
-                items = root.findall(".//item")
-                for item in items[:limit]:
-                    link_el = item.find("link")
-                    desc_el = item.find("description")
-                    pub_el = item.find("pubDate")
-
-                    link = link_el.text if link_el is not None else ""
-                    desc = desc_el.text if desc_el is not None else ""
-                    pub = pub_el.text if pub_el is not None else ""
+        async with session.get(url, timeout=12, headers=_conditional_headers(feed_key, limit)) as resp:
+            if resp.status == 304:
+                return _feed_meta[feed_key]["tweets"][:limit]
+            if resp.status != 200:
+                return []
+            try:
+                items = await _read_rss_items(resp, limit)
+            except _XML_PARSE_ERRORS:
+                return []
+            for item in items or ():
+                link = item.get("link", "")
+                desc = item.get("description", "")
+                pub = item.get("pubDate", "")
 
-                    tid_match = re.search(r"/status/(\d+)$", link)
-                    tid = tid_match.group(1) if tid_match else link.split("/")[-1]
+                tid_match = _RE_STATUS_ID.search(link)
+                tid = tid_match.group(1) if tid_match else link.split("/")[-1]
 
-                    date_obj = _parse_rfc2822_date(pub) or datetime.utcnow()
+                date_obj = _parse_rfc2822_date(pub) or datetime.utcnow()
 
-                    tweets.append({
-                        "id": tid,
-                        "url": _convert_to_twitter_url(link),
-                        "text": _clean_text(desc) if desc and len(desc.strip()) > 5 else f"New tweet from @{username}",
-                        "date": date_obj
-                    })
+                tweets.append({
+                    "id": tid,
+                    "url": _convert_to_twitter_url(link),
+                    "text": _clean_text(desc) if desc and len(desc.strip()) > 5 else f"New tweet from @{username}",
+                    "date": date_obj
+                })
+            _remember_feed(feed_key, resp, tweets, limit)
     except Exception:
         return []
     return tweets
 
-async def fetch_tweets(username: str, limit: int = 5) -> List[Dict]:
+async def fetch_tweets(session: aiohttp.ClientSession, username: str, limit: int = 5) -> List[Dict]:
     username = username.replace("@", "").lower()
-    print(f"🔍 Attempting to fetch tweets for @{username}")
+    logger.debug("🔍 Attempting to fetch tweets for @%s", username)
     
     for i, fetcher in enumerate([_fetch_with_nitter, _fetch_with_jina, _fetch_with_mxttr], 1):
         fetcher_name = fetcher.__name__.replace('_fetch_with_', '').upper()
         try:
-            print(f"📡 Trying method {i}/3: {fetcher_name}")
-            tweets = await fetcher(username, limit)
+            logger.debug("📡 Trying method %s/3: %s", i, fetcher_name)
+            tweets = await fetcher(session, username, limit)
             if tweets:
-                print(f"✅ {fetcher_name} succeeded: Found {len(tweets)} tweets")
+                logger.debug("✅ %s succeeded: Found %s tweets", fetcher_name, len(tweets))
                 return tweets
             else:
-                print(f"⚠️ {fetcher_name} returned no tweets")
+                logger.debug("⚠️ %s returned no tweets", fetcher_name)
         except Exception as e:
-            print(f"❌ {fetcher_name} failed: {str(e)}")
+            logger.warning("❌ %s failed: %s", fetcher_name, e)
             continue
     
-    print(f"💥 All scraping methods failed for @{username}")
+    logger.warning("💥 All scraping methods failed for @%s", username)
     return []
 
 
@@ -420,17 +570,28 @@ class NewsCog(commands.Cog):
         self.bot = bot
         self._task_started = False
         self._watchdog_started = False
-        print("🔧 NewsCog: __init__ called")
+        # Shared HTTP session for all scrapers; built in initialize()
+        self.http: Optional[aiohttp.ClientSession] = None
+        # handle -> (lower-cased keywords, automaton); rebuilt when the whitelist changes
+        self._ac_cache: Dict[str, Tuple[Tuple[str, ...], object]] = {}
+        # Scraper health from the last check_tweets cycle; None until the first cycle runs
+        self._scraper_healthy: Optional[bool] = None
+        self._last_health_check: Optional[datetime] = None
+        logger.debug("🔧 NewsCog: __init__ called")
 
     async def initialize(self):
         """Initialize the news cog and start background task."""
+        if self.http is None or self.http.closed:
+            self.http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=50, ttl_dns_cache=300, keepalive_timeout=30),
+                headers={"User-Agent": SCRAPER_USER_AGENT},
+            )
+
         if not _AIOSQLITE_AVAILABLE:
-            print("❌ aiosqlite not available - news cog disabled")
             logger.error("aiosqlite not available - news cog disabled")
             return
         
         try:
-            print("✅ News cog initialized using main database")
             logger.info("News cog initialized using main database")
             
             # Ensure task starts
@@ -440,91 +601,75 @@ class NewsCog(commands.Cog):
             await self._ensure_watchdog_running()
             
         except Exception as e:
-            print(f"❌ Failed to initialize news cog: {e}")
-            logger.error(f"Failed to initialize news cog: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error("Failed to initialize news cog: %s", e, exc_info=True)
 
     async def _ensure_task_running(self):
         """Ensure the background task is running."""
         try:
             if not self.check_tweets.is_running():
-                print("🚀 Starting background tweet checking task...")
                 logger.info("Starting background tweet checking task")
                 self.check_tweets.start()
                 self._task_started = True
-                print("✅ Background tweet checking task started successfully")
                 logger.info("Background tweet checking task started successfully")
             else:
-                print("✅ Background tweet checking task is already running")
                 logger.info("Background tweet checking task is already running")
                 self._task_started = True
         except RuntimeError as e:
             # Task might already be running or starting
             if "already running" in str(e).lower() or "already started" in str(e).lower():
-                print("✅ Background task already running (caught RuntimeError)")
                 logger.info("Background task already running (caught RuntimeError)")
                 self._task_started = True
             else:
-                print(f"❌ Failed to start background task: {e}")
-                logger.error(f"Failed to start background task: {e}")
+                logger.error("Failed to start background task: %s", e)
                 raise
         except Exception as e:
-            print(f"❌ Unexpected error starting background task: {e}")
-            logger.error(f"Unexpected error starting background task: {e}")
+            logger.error("Unexpected error starting background task: %s", e)
             raise
 
     async def _ensure_watchdog_running(self):
         """Ensure the watchdog task is running."""
         try:
             if not self.task_watchdog.is_running():
-                print("🐕 Starting task watchdog...")
                 logger.info("Starting task watchdog to monitor background task")
                 self.task_watchdog.start()
                 self._watchdog_started = True
-                print("✅ Task watchdog started successfully")
                 logger.info("Task watchdog started successfully")
             else:
-                print("✅ Task watchdog is already running")
                 logger.info("Task watchdog is already running")
                 self._watchdog_started = True
         except RuntimeError as e:
             if "already running" in str(e).lower() or "already started" in str(e).lower():
-                print("✅ Watchdog already running (caught RuntimeError)")
                 logger.info("Watchdog already running (caught RuntimeError)")
                 self._watchdog_started = True
             else:
-                print(f"❌ Failed to start watchdog: {e}")
-                logger.error(f"Failed to start watchdog: {e}")
+                logger.error("Failed to start watchdog: %s", e)
                 raise
         except Exception as e:
-            print(f"❌ Unexpected error starting watchdog: {e}")
-            logger.error(f"Unexpected error starting watchdog: {e}")
+            logger.error("Unexpected error starting watchdog: %s", e)
             raise
 
     async def cog_load(self):
         """Called when the cog is loaded."""
-        print("🔧 NewsCog: cog_load called")
         logger.info("NewsCog: cog_load called")
         await self.initialize()
 
     async def cog_unload(self):
         """Called when the cog is unloaded."""
-        print("🔧 NewsCog: cog_unload called")
         logger.info("NewsCog: cog_unload called")
         
         if self.task_watchdog.is_running():
-            print("⏹️ Stopping task watchdog...")
             logger.info("Stopping task watchdog")
             self.task_watchdog.cancel()
             self._watchdog_started = False
         
         if self.check_tweets.is_running():
-            print("⏹️ Stopping background tweet checking task...")
             logger.info("Stopping background tweet checking task")
             self.check_tweets.cancel()
             self._task_started = False
 
+        if self.http is not None and not self.http.closed:
+            await self.http.close()
+
     # Replace individual commands with single admin interface
     @bot_moderator_only()
     @app_commands.command(name="admin-news-manage", description="Manage Twitter news monitoring system")
@@ -539,7 +684,7 @@ class NewsCog(commands.Cog):
             logger.error("Interaction expired before deferring - user may have waited too long")
             return
         except Exception as e:
-            logger.error(f"Failed to defer interaction: {e}")
+            logger.error("Failed to defer interaction: %s", e)
             return
         
         try:
@@ -552,14 +697,14 @@ class NewsCog(commands.Cog):
             status_lines = []
             status_lines.append("✅ Database: Connected (Main Database)")
             
-            try:
-                tweets = await fetch_tweets("nasa", 1)
-                if tweets:
-                    status_lines.append("✅ Scraping: Working")
+            if self._scraper_healthy is None:
+                status_lines.append("⏳ Scraping: Not checked yet")
+            else:
+                checked_at = int(self._last_health_check.replace(tzinfo=timezone.utc).timestamp())
+                if self._scraper_healthy:
+                    status_lines.append(f"✅ Scraping: Working (as of <t:{checked_at}:R>)")
                 else:
-                    status_lines.append("⚠️ Scraping: No tweets found")
-            except Exception:
-                status_lines.append("❌ Scraping: Error")
+                    status_lines.append(f"⚠️ Scraping: No tweets found (as of <t:{checked_at}:R>)")
 
             # Add watchdog status
             if hasattr(self, 'task_watchdog') and self.task_watchdog.is_running():
@@ -635,10 +780,10 @@ class NewsCog(commands.Cog):
             except discord.NotFound:
                 logger.error("Interaction expired before sending followup message")
             except Exception as e:
-                logger.error(f"Failed to send followup message: {e}")
+                logger.error("Failed to send followup message: %s", e)
                 
         except Exception as e:
-            logger.error(f"Error in news_manage command: {e}")
+            logger.error("Error in news_manage command: %s", e)
             try:
                 await interaction.followup.send("❌ An error occurred while loading the news management system.", ephemeral=True)
             except:
@@ -654,7 +799,7 @@ class NewsCog(commands.Cog):
             logger.error("Interaction expired before deferring for test-scrape command")
             return
         except Exception as e:
-            logger.error(f"Failed to defer test-scrape interaction: {e}")
+            logger.error("Failed to defer test-scrape interaction: %s", e)
             return
         
         username = username.replace("@", "").lower()
@@ -675,7 +820,7 @@ class NewsCog(commands.Cog):
         results = []
         for method_name, method_func in methods:
             try:
-                tweets = await method_func(username, 3)
+                tweets = await method_func(self.http, username, 3)
                 if tweets:
                     results.append(f"✅ **{method_name}**: Found {len(tweets)} tweets")
                     for i, tweet in enumerate(tweets[:2], 1):
@@ -694,7 +839,7 @@ class NewsCog(commands.Cog):
         
         # Overall test
         try:
-            final_tweets = await fetch_tweets(username, 3)
+            final_tweets = await fetch_tweets(self.http, username, 3)
             if final_tweets:
                 embed.add_field(
                     name="🎯 Final Result",
@@ -721,161 +866,194 @@ class NewsCog(commands.Cog):
         """Check for new tweets every 15 minutes. This task is designed to recover from errors."""
         try:
             current_time = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')
-            print(f"\n🔄 Tweet check started at {current_time}")
-            logger.info(f"Tweet check cycle started at {current_time}")
+            logger.info("Tweet check cycle started at %s", current_time)
             
             accounts = await database.get_news_accounts()
             if not accounts:
-                print("⚠️ No news accounts configured")
                 logger.info("No news accounts configured - skipping check")
                 return
                 
-            for account in accounts:
-                handle = account['handle']
-                channel_id = account['channel_id']
-                last_tweet_id = account['last_tweet_id']
-                print(f"\n🔍 Processing account: @{handle}")
-                print(f"📺 Channel ID: {channel_id}")
-                print(f"📝 Last tweet ID: {last_tweet_id}")
+            # Poll accounts concurrently; the semaphore bounds simultaneous scrapes
+            semaphore = asyncio.Semaphore(ACCOUNT_POLL_CONCURRENCY)
+            results = await asyncio.gather(
+                *(self._process_account_guarded(semaphore, account) for account in accounts),
+                return_exceptions=True
+            )
+
+            # Record scraper health for /news-manage so it doesn't have to scrape live
+            self._scraper_healthy = any(result is True for result in results)
+            self._last_health_check = datetime.utcnow()
+
+            # Save the check time at the END after all work is done
+            check_time = datetime.utcnow()
+            await database.set_news_last_check(check_time)
+            completed_time = check_time.strftime('%Y-%m-%d %H:%M:%S UTC')
+            logger.info("Tweet check completed at %s - checked %s accounts", completed_time, len(accounts))
+        
+        except Exception as e:
+            # Catch any uncaught exceptions to prevent the task from stopping
+            logger.critical("CRITICAL ERROR in check_tweets task: %s", e, exc_info=True)
+            # Task will continue and retry in 15 minutes
+
+    async def _process_account(self, account):
+        """Fetch and post new tweets for a single tracked account. Returns True if the scrape returned tweets."""
+        handle = account['handle']
+        channel_id = account['channel_id']
+        last_tweet_id = account['last_tweet_id']
+        logger.debug("🔍 Processing account: @%s", handle)
+        logger.debug("📺 Channel ID: %s", channel_id)
+        logger.debug("📝 Last tweet ID: %s", last_tweet_id)
+        
+        try:
+            channel = self.bot.get_channel(channel_id)
+            if not channel:
+                logger.warning("❌ Channel %s not found or not accessible", channel_id)
+                return
+                
+            logger.debug("✅ Found channel: #%s in %s", channel.name, channel.guild.name)
+            
+            tweets = await fetch_tweets(self.http, handle, 5)
+            if not tweets:
+                logger.debug("⚠️ No tweets returned for @%s", handle)
+                return
                 
-                try:
-                    channel = self.bot.get_channel(channel_id)
-                    if not channel:
-                        print(f"❌ Channel {channel_id} not found or not accessible")
-                        continue
-                        
-                    print(f"✅ Found channel: #{channel.name} in {channel.guild.name}")
-                    
-                    tweets = await fetch_tweets(handle, 5)
-                    if not tweets:
-                        print(f"⚠️ No tweets returned for @{handle}")
-                        continue
+            logger.debug("📋 Got %s tweets for @%s", len(tweets), handle)
+            
+            new_tweets = []
+            for i, t in enumerate(tweets):
+                tid = str(t["id"])
+                logger.debug("🆔 Tweet %s: ID=%s", i+1, tid)
+                
+                if last_tweet_id and tid == last_tweet_id:
+                    logger.debug("🛑 Found last known tweet ID %s, stopping here", tid)
+                    break
+                new_tweets.append(t)
+                
+            logger.debug("🆕 Found %s new tweets", len(new_tweets))
+            
+            if not new_tweets:
+                logger.debug("⚠️ No new tweets for @%s", handle)
+                return True
+            
+            new_tweets.reverse()
+            tweets_to_post = new_tweets[-3:]  # Get last 3
+            logger.debug("📤 Will attempt to post %s tweets", len(tweets_to_post))
+            
+            posted_count = 0
+            last_posted_tweet_id = None  # Track the last successfully posted tweet
+            
+            # The whitelist is per account, so fetch and lower-case it once rather than per tweet
+            account_whitelist = await database.get_account_whitelist(handle)
+            wl_lower = [(keyword, keyword.lower()) for keyword in account_whitelist]
+            automaton = self._whitelist_automaton(handle, wl_lower)
+            logger.debug("✅ Checking against %s whitelist keywords for account @%s", len(account_whitelist), handle)
+            
+            # Account-level message prefixes, built once rather than per tweet
+            author = f"🕊 New Tweet From [@{handle}](https://twitter.com/{handle})"
+            text_prefix = f"{author} posted:\n\n"
+            update_prefix = f"{author} has posted a new update:\n"
+            
+            for i, t in enumerate(tweets_to_post):
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("📝 Processing tweet %s/%s", i+1, len(tweets_to_post))
+                    logger.debug("🆔 Tweet ID: %s", t['id'])
+                    logger.debug("📄 Tweet text: %s...", t['text'][:100])
+                
+                should_post = True
+                text_lc = t["text"].lower()
+                
+                if wl_lower:  # If account-specific whitelist exists, tweet must contain at least one keyword
+                    if automaton is not None:
+                        hit = next(automaton.iter(text_lc), None)
+                        keyword = hit[1] if hit is not None else None
+                    else:
+                        keyword = next((kw for kw, kw_lc in wl_lower if kw_lc in text_lc), None)
+                    should_post = keyword is not None
+                    if should_post:
+                        logger.debug("✅ Tweet approved by whitelist keyword: '%s' for @%s", keyword, handle)
+                    else:
+                        logger.debug("🚫 Tweet blocked: no whitelist keywords found for @%s", handle)
+                else:
+                    logger.debug("✅ No whitelist configured for @%s, allowing all tweets", handle)
                         
-                    print(f"📋 Got {len(tweets)} tweets for @{handle}")
+                if not should_post:
+                    logger.debug("⏭️ Skipping tweet due to whitelist")
+                    continue
                     
-                    new_tweets = []
-                    for i, t in enumerate(tweets):
-                        tid = str(t["id"])
-                        print(f"🆔 Tweet {i+1}: ID={tid}")
-                        
-                        if last_tweet_id and tid == last_tweet_id:
-                            print(f"🛑 Found last known tweet ID {tid}, stopping here")
-                            break
-                        new_tweets.append(t)
-                        
-                    print(f"🆕 Found {len(new_tweets)} new tweets")
+                logger.debug("✅ Tweet passed all filters, posting...")
+                try:
+                    # Include tweet text if available and not just a fallback
+                    tweet_text = t.get('text', '').strip()
                     
-                    if not new_tweets:
-                        print(f"⚠️ No new tweets for @{handle}")
+                    # Validate tweet text - skip if it looks like bio/profile content
+                    if tweet_text and any(keyword in text_lc for keyword in BIO_KEYWORDS):
+                        logger.debug("⚠️ Skipping tweet %s - appears to contain bio/profile content", t['id'])
                         continue
                     
-                    new_tweets.reverse()
-                    tweets_to_post = new_tweets[-3:]  # Get last 3
-                    print(f"📤 Will attempt to post {len(tweets_to_post)} tweets")
-                    
-                    posted_count = 0
-                    last_posted_tweet_id = None  # Track the last successfully posted tweet
-                    
-                    for i, t in enumerate(tweets_to_post):
-                        print(f"\n📝 Processing tweet {i+1}/{len(tweets_to_post)}")
-                        print(f"🆔 Tweet ID: {t['id']}")
-                        print(f"📄 Tweet text: {t['text'][:100]}...")
-                        
-                        should_post = True
-                        account_whitelist = await database.get_account_whitelist(handle)
-                        print(f"✅ Checking against {len(account_whitelist)} whitelist keywords for account @{handle}")
-                        
-                        if account_whitelist:  # If account-specific whitelist exists, tweet must contain at least one keyword
-                            should_post = False
-                            for keyword in account_whitelist:
-                                if keyword.lower() in t["text"].lower():
-                                    print(f"✅ Tweet approved by whitelist keyword: '{keyword}' for @{handle}")
-                                    should_post = True
-                                    break
-                            if not should_post:
-                                print(f"🚫 Tweet blocked: no whitelist keywords found for @{handle}")
-                        else:
-                            print(f"✅ No whitelist configured for @{handle}, allowing all tweets")
-                                
-                        if not should_post:
-                            print(f"⏭️ Skipping tweet due to whitelist")
-                            continue
-                            
-                        print(f"✅ Tweet passed all filters, posting...")
-                        try:
-                            # Include tweet text if available and not just a fallback
-                            tweet_text = t.get('text', '').strip()
-                            
-                            # Validate tweet text - skip if it looks like bio/profile content
-                            bio_keywords = ['bio', 'description', 'profile', 'follow', 'following', 'followers', 'joined', 'location', 'website']
-                            if tweet_text and any(keyword in tweet_text.lower() for keyword in bio_keywords):
-                                print(f"⚠️ Skipping tweet {t['id']} - appears to contain bio/profile content")
-                                continue
-                            
-                            if tweet_text and tweet_text != f"Tweet {t['id']}" and len(tweet_text) > 10:
-                                message = f"🕊 New Tweet From [@{handle}](https://twitter.com/{handle}) posted:\n\n{tweet_text}\n\n{t['url']}"
-                            else:
-                                message = f"🕊 New Tweet From [@{handle}](https://twitter.com/{handle}) has posted a new update:\n{t['url']}"
-                            
-                            await channel.send(message)
-                            posted_count += 1
-                            last_posted_tweet_id = str(t['id'])  # Track last successfully posted tweet
-                            print(f"🎉 Successfully posted tweet {t['id']}")
-                        except Exception as post_error:
-                            print(f"❌ Failed to post tweet {t['id']}: {str(post_error)}")
-                    
-                    print(f"📊 Posted {posted_count}/{len(tweets_to_post)} tweets for @{handle}")
+                    if tweet_text and tweet_text != f"Tweet {t['id']}" and len(tweet_text) > 10:
+                        message = f"{text_prefix}{tweet_text}\n\n{t['url']}"
+                    else:
+                        message = update_prefix + t['url']
                     
-                    # Update last_tweet_id to prevent duplicates
-                    # Use the newest tweet ID from the fetch (even if not posted) to mark all as "seen"
-                    # This prevents re-processing tweets that were filtered by whitelist
-                    if new_tweets:
-                        new_last_id = str(tweets[0]["id"])  # Newest tweet from API
-                        update_success = await database.update_last_tweet_id(handle, new_last_id)
-                        if update_success:
-                            print(f"💾 Updated last tweet ID to: {new_last_id}")
-                        else:
-                            print(f"❌ WARNING: Failed to update last tweet ID! Duplicates may occur on next check.")
-                            # Still continue - better to risk duplicates than stop processing other accounts
-                        
-                except Exception as e:
-                    print(f"❌ Error checking tweets for {handle}: {e}")
-                    logger.error(f"Error checking tweets for {handle}: {e}")
-                    import traceback
-                    traceback.print_exc()
+                    await channel.send(message)
+                    posted_count += 1
+                    last_posted_tweet_id = str(t['id'])  # Track last successfully posted tweet
+                    logger.info("🎉 Successfully posted tweet %s", t['id'])
+                except Exception as post_error:
+                    logger.warning("❌ Failed to post tweet %s: %s", t['id'], post_error)
             
-            # Save the check time at the END after all work is done
-            check_time = datetime.utcnow()
-            await database.set_news_last_check(check_time)
-            completed_time = check_time.strftime('%Y-%m-%d %H:%M:%S UTC')
-            print(f"✅ Tweet check completed at {completed_time}")
-            logger.info(f"Tweet check completed at {completed_time} - checked {len(accounts)} accounts")
-        
+            logger.info("📊 Posted %s/%s tweets for @%s", posted_count, len(tweets_to_post), handle)
+            
+            # Update last_tweet_id to prevent duplicates
+            # Use the newest tweet ID from the fetch (even if not posted) to mark all as "seen"
+            # This prevents re-processing tweets that were filtered by whitelist
+            if new_tweets:
+                new_last_id = str(tweets[0]["id"])  # Newest tweet from API
+                update_success = await database.update_last_tweet_id(handle, new_last_id)
+                if update_success:
+                    logger.debug("💾 Updated last tweet ID to: %s", new_last_id)
+                else:
+                    logger.warning("❌ WARNING: Failed to update last tweet ID! Duplicates may occur on next check.")
+                    # Still continue - better to risk duplicates than stop processing other accounts
+            
+            return True
+                
         except Exception as e:
-            # Catch any uncaught exceptions to prevent the task from stopping
-            print(f"💥 CRITICAL ERROR in check_tweets task: {e}")
-            logger.critical(f"CRITICAL ERROR in check_tweets task: {e}")
-            import traceback
-            traceback.print_exc()
-            # Task will continue and retry in 15 minutes
+            logger.error("Error checking tweets for %s: %s", handle, e, exc_info=True)
+
+    def _whitelist_automaton(self, handle: str, wl_lower: List[Tuple[str, str]]):
+        """Return a cached Aho-Corasick automaton for the account's whitelist, or None to fall back to substring checks."""
+        if not _AHOCORASICK_AVAILABLE or not wl_lower:
+            return None
+        key = tuple(kw_lc for _, kw_lc in wl_lower)
+        cached = self._ac_cache.get(handle)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        if "" in key:
+            # An empty keyword matches every tweet, which the automaton can't express
+            return None
+        automaton = ahocorasick.Automaton()
+        for keyword, keyword_lc in wl_lower:
+            automaton.add_word(keyword_lc, keyword)
+        automaton.make_automaton()
+        self._ac_cache[handle] = (key, automaton)
+        return automaton
+
+    async def _process_account_guarded(self, semaphore: asyncio.Semaphore, account):
+        async with semaphore:
+            return await self._process_account(account)
 
     @check_tweets.before_loop
     async def before_check_tweets(self):
         """Wait for the bot to be ready before starting the task."""
-        print("⏳ Tweet checker task waiting for bot to be ready...")
         logger.info("Tweet checker task waiting for bot to be ready")
         await self.bot.wait_until_ready()
-        print("✅ Bot is ready - tweet checker task starting")
         logger.info("Bot is ready - tweet checker task starting")
 
     @check_tweets.error
     async def check_tweets_error(self, error):
         """Handle errors in the check_tweets task to prevent it from stopping permanently."""
-        print(f"💥 ERROR in check_tweets task: {error}")
-        logger.error(f"ERROR in check_tweets task: {error}")
-        import traceback
-        traceback.print_exc()
-        print("⏰ Task will restart in 15 minutes...")
+        logger.error("ERROR in check_tweets task: %s", error, exc_info=error)
         logger.warning("Tweet checking task encountered error - will restart in 15 minutes")
         # The task will automatically restart after the interval
 
@@ -883,70 +1061,53 @@ class NewsCog(commands.Cog):
     async def task_watchdog(self):
         """Watchdog task that monitors and restarts the main task if it stops unexpectedly."""
         try:
-            print(f"🐕 Watchdog check: Main task running = {self.check_tweets.is_running()}")
+            logger.debug("Watchdog check: main task running = %s", self.check_tweets.is_running())
             
             if not self.check_tweets.is_running():
-                print("⚠️ WATCHDOG ALERT: Main task is not running!")
                 logger.warning("WATCHDOG ALERT: Main tweet checking task is not running - attempting restart")
                 
                 # Check if task failed
                 if self.check_tweets.failed():
-                    print("❌ Task failed - restarting...")
                     logger.error("Main task failed - watchdog restarting it")
                 elif self.check_tweets.is_being_cancelled():
-                    print("⏸️ Task is being cancelled - waiting...")
                     logger.info("Task is being cancelled - watchdog will check again later")
                     return
                 else:
-                    print("⏹️ Task stopped - restarting...")
                     logger.warning("Main task stopped unexpectedly - watchdog restarting it")
                 
                 try:
                     # Attempt to restart the task
                     self.check_tweets.restart()
-                    print("✅ Watchdog successfully restarted main task")
                     logger.info("Watchdog successfully restarted main task")
                 except Exception as restart_error:
-                    print(f"❌ Watchdog failed to restart task: {restart_error}")
-                    logger.error(f"Watchdog failed to restart task: {restart_error}")
+                    logger.error("Watchdog failed to restart task: %s", restart_error)
                     
                     # If restart fails, try canceling and starting fresh
                     try:
                         self.check_tweets.cancel()
                         await asyncio.sleep(2)
                         self.check_tweets.start()
-                        print("✅ Watchdog force-started main task after cancel")
                         logger.info("Watchdog force-started main task after cancel")
                     except Exception as force_start_error:
-                        print(f"❌ Watchdog force-start also failed: {force_start_error}")
-                        logger.critical(f"Watchdog unable to restart main task: {force_start_error}")
+                        logger.critical("Watchdog unable to restart main task: %s", force_start_error)
             else:
-                print("✅ Watchdog check: Main task is running normally")
+                logger.debug("Watchdog check: main task is running normally")
                 
         except Exception as e:
-            print(f"💥 ERROR in watchdog task: {e}")
-            logger.error(f"ERROR in watchdog task: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error("ERROR in watchdog task: %s", e, exc_info=True)
             # Watchdog continues despite errors
 
     @task_watchdog.before_loop
     async def before_task_watchdog(self):
         """Wait for the bot to be ready before starting the watchdog."""
-        print("⏳ Watchdog waiting for bot to be ready...")
         logger.info("Watchdog waiting for bot to be ready")
         await self.bot.wait_until_ready()
-        print("✅ Bot is ready - watchdog starting")
         logger.info("Bot is ready - watchdog starting")
 
     @task_watchdog.error
     async def task_watchdog_error(self, error):
         """Handle errors in the watchdog task."""
-        print(f"💥 ERROR in watchdog task: {error}")
-        logger.error(f"ERROR in watchdog task: {error}")
-        import traceback
-        traceback.print_exc()
-        print("⏰ Watchdog will restart in 5 minutes...")
+        logger.error("ERROR in watchdog task: %s", error, exc_info=error)
         logger.warning("Watchdog task encountered error - will restart in 5 minutes")
 
 
@@ -1182,10 +1343,10 @@ class AddAccountModal(discord.ui.Modal):
                         try:
                             self.cog.check_tweets.start()
                             task_status = "\n\n🚀 Background task automatically started!"
-                            print(f"✅ Auto-started background task after adding @{username}")
+                            logger.info("Auto-started background task after adding @%s", username)
                         except Exception as task_error:
                             task_status = f"\n\n⚠️ Couldn't auto-start task: {str(task_error)}\nUse 'Restart Task' button to start manually."
-                            print(f"❌ Failed to auto-start task: {task_error}")
+                            logger.error("Failed to auto-start task after adding @%s: %s", username, task_error)
                 
                 embed = discord.Embed(
                     title="✅ Account Added",